@@ -0,0 +1,93 @@
+"""_summary_
+Throughput of the vectorized decoding of the bit signals of an ADC into its decimal codes
+(dycifer.mixed_signals.decodeBits), against the former row-by-row string decoding.
+Usage:
+    python benchmarks/bench_bit_decoding.py [--lengths 16 20 23] [--bits 6 12 16] [--legacy 16]
+    (lengths as powers of 2 of the number of samples; the string decoding is only timed
+    up to 2^legacy samples)
+"""
+
+import sys
+import time
+import argparse
+import numpy as np
+from pandas import DataFrame
+from tabulate import tabulate
+from loguru import logger as log
+from dycifer.mixed_signals import decodeBits
+
+
+def bitSignals(n_samples: int, n_bits: int) -> np.ndarray:
+    """_summary_
+    Random bit signals (most significant bit first) at 0 V / 1 V.
+    """
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 2**n_bits, n_samples)
+    return ((codes[:, None] >> np.arange(n_bits - 1, -1, -1)) & 1).astype(np.float64)
+
+
+def legacyDecodeBits(bits: np.ndarray) -> np.ndarray:
+    """_summary_
+    The former decoding: a binary string is built for each row, and parsed back into an integer.
+    """
+    dout = DataFrame(bits)
+    means = dout.mean()
+    for col in dout.columns:
+        dout[col] = (dout[col] > means[col]).astype(int)
+    bin_word = dout.apply(
+        lambda row: "".join(map(lambda b: str(int(b)), row.values)), axis=1
+    )
+    return bin_word.apply(lambda bin: int(bin, 2)).values
+
+
+def timeDecoding(decode, bits: np.ndarray) -> float:
+    """_summary_
+    Returns the decoding time (in seconds) of the bit signals.
+    """
+    start = time.perf_counter()
+    decode(bits)
+    return time.perf_counter() - start
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        description="Throughput of the vectorized decoding of the bit signals of an ADC."
+    )
+    parser.add_argument("--lengths", nargs="+", type=int, default=[16, 20, 23])
+    parser.add_argument("--bits", nargs="+", type=int, default=[6, 12, 16])
+    parser.add_argument("--legacy", type=int, default=16)
+    args = parser.parse_args(argv)
+    log.remove()
+    rows = []
+    for length in args.lengths:
+        for n_bits in args.bits:
+            bits = bitSignals(2**length, n_bits)
+            vectorized = timeDecoding(decodeBits, bits)
+            legacy = (
+                timeDecoding(legacyDecodeBits, bits)
+                if length <= args.legacy
+                else float("nan")
+            )
+            rows.append(
+                [
+                    f"2^{length}",
+                    n_bits,
+                    f"{vectorized * 1e3:.1f}",
+                    f"{vectorized / bits.size * 1e9:.2f}",
+                    f"{legacy * 1e3:.1f}",
+                    f"{legacy / vectorized:.0f}",
+                ]
+            )
+    headers = [
+        "Samples",
+        "Bits",
+        "Vectorized (ms)",
+        "Vectorized (ns / sample / bit)",
+        "String (ms)",
+        "Speedup",
+    ]
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""_summary_
+Throughput of the vectorized evaluation of the code transitions of a DAC
+(dycifer.mixed_signals.dacTransitions): settling time, glitch impulse area and major carries.
+Usage:
+    python benchmarks/bench_dac_transitions.py [--updates 16 20 22] [--bits 8 12] [--samples 8]
+    (updates as powers of 2 of the number of DAC updates, and samples per update)
+"""
+
+import sys
+import time
+import argparse
+import numpy as np
+from tabulate import tabulate
+from loguru import logger as log
+from dycifer.mixed_signals import dacTransitions
+
+
+def dacOutput(n_updates: int, n_bits: int, samples_per_update: int):
+    """_summary_
+    Random codes, and the first order settling of the output (1 mV LSB) of each update.
+    """
+    rng = np.random.default_rng(0)
+    update_codes = rng.integers(0, 2**n_bits, n_updates)
+    finals = update_codes * 1e-3
+    previous = np.append(finals[0], finals[:-1])
+    decay = np.exp(-np.arange(samples_per_update) / (samples_per_update / 8))
+    vout = (finals[:, None] + (previous - finals)[:, None] * decay[None, :]).ravel()
+    return vout, np.repeat(update_codes, samples_per_update)
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        description="Throughput of the vectorized evaluation of the code transitions of a DAC."
+    )
+    parser.add_argument("--updates", nargs="+", type=int, default=[16, 20, 22])
+    parser.add_argument("--bits", nargs="+", type=int, default=[8, 12])
+    parser.add_argument("--samples", type=int, default=8)
+    args = parser.parse_args(argv)
+    log.remove()
+    rows = []
+    for updates in args.updates:
+        for n_bits in args.bits:
+            vout, codes = dacOutput(2**updates, n_bits, args.samples)
+            start = time.perf_counter()
+            transitions = dacTransitions(vout, codes, 1e-9, n_bits)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                [
+                    f"2^{updates}",
+                    n_bits,
+                    len(vout),
+                    len(transitions),
+                    f"{elapsed * 1e3:.1f}",
+                    f"{elapsed / len(vout) * 1e9:.2f}",
+                ]
+            )
+    headers = [
+        "Updates",
+        "Bits",
+        "Samples",
+        "Transitions",
+        "Time (ms)",
+        "Time (ns / sample)",
+    ]
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""_summary_
+Throughput of the FFT backends of dycifer.fft in batch runs over many records of the same length.
+Usage:
+    python benchmarks/bench_fft_backends.py [--lengths 16 20 24] [--records 16] [--workers -1]
+    (lengths as powers of 2 of the number of samples of each record)
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from tabulate import tabulate
+from loguru import logger as log
+from dycifer.fft import FFTBackends, rfft
+
+
+def timeBackend(records: list, backend: str) -> float:
+    """_summary_
+    Returns the throughput (in records per second) of the real input FFT of the records.
+    The first transform (planning) is excluded from the measurement.
+    """
+    rfft(records[0], backend=backend)
+    start = time.perf_counter()
+    for x in records:
+        rfft(x, backend=backend)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        description="Throughput of the FFT backends over many records of the same length."
+    )
+    parser.add_argument("--lengths", nargs="+", type=int, default=[16, 20, 24])
+    parser.add_argument("--records", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=-1)
+    args = parser.parse_args(argv)
+    os.environ["DYCIFER_FFT_WORKERS"] = str(args.workers)
+    log.remove()
+    rng = np.random.default_rng(0)
+    rows = []
+    for length in args.lengths:
+        records = [rng.standard_normal(2**length) for _ in range(args.records)]
+        row = [f"2^{length}"]
+        for backend in [elem.value for elem in FFTBackends]:
+            try:
+                __import__(backend)
+            except ImportError:
+                row.append("not installed")
+                continue
+            row.append(f"{timeBackend(records, backend):.1f}")
+        rows.append(row)
+    headers = ["Samples"] + [f"{elem.value} (records/s)" for elem in FFTBackends]
+    print(f"{os.cpu_count()} cores")
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
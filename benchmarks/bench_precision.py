@@ -0,0 +1,92 @@
+"""_summary_
+Accuracy and memory cost of the single precision mode (float32 samples and complex64 FFT)
+of the dynamic performance evaluation, against the default double precision mode.
+Usage:
+    python benchmarks/bench_precision.py [--lengths 14 18 22] [--snr 60 100 140]
+    (lengths as powers of 2 of the number of samples, snr in dB of the added white noise)
+"""
+
+import sys
+import argparse
+import tracemalloc
+import numpy as np
+from pandas import DataFrame
+from tabulate import tabulate
+from loguru import logger as log
+from dycifer.analog import caosDynamicEval
+from dycifer.spectrum import floatType
+
+
+def testSignals(n_samples: int, snr_db: float, fs: float = 1e9) -> DataFrame:
+    """_summary_
+    Coherently sampled sine wave (with 2nd and 3rd harmonics at -80 and -90 dBc)
+    plus white noise of the given Signal to Noise Ratio.
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(n_samples) / fs
+    # odd number of cycles in the record: coherent sampling
+    f_in = fs * 1021 / n_samples if n_samples > 2**12 else fs * 31 / n_samples
+    amplitude = 1.0
+    vout = (
+        amplitude * np.sin(2 * np.pi * f_in * t)
+        + 1e-4 * np.sin(2 * np.pi * 2 * f_in * t)
+        + 10 ** (-90 / 20) * np.sin(2 * np.pi * 3 * f_in * t)
+    )
+    noise_rms = np.sqrt(amplitude**2 / 2 / 10 ** (snr_db / 10))
+    vout = vout + rng.normal(0, noise_rms, n_samples)
+    signals = DataFrame({"vout": vout}, index=t)
+    signals.index.name = "time [s]"
+    return signals
+
+
+def evaluate(signals: DataFrame, fs: float, precision: str) -> tuple:
+    """_summary_
+    Returns the SFDR, THD, SNR and SNDR of the signals and the peak memory (in MB) of the evaluation.
+    """
+    tracemalloc.start()
+    results = caosDynamicEval(signals, fs, "vout", precision=precision)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _, _, _, _, _, _, sfdr, thd, snr, sndr, _, _ = results
+    return sfdr, thd, snr, sndr, peak / 2**20
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        description="Accuracy and memory cost of the single precision mode."
+    )
+    parser.add_argument("--lengths", nargs="+", type=int, default=[14, 18, 22])
+    parser.add_argument("--snr", nargs="+", type=float, default=[60, 100, 140])
+    args = parser.parse_args(argv)
+    log.remove()
+    fs = 1e9
+    rows = []
+    for length in args.lengths:
+        for snr_db in args.snr:
+            signals = testSignals(2**length, snr_db, fs)
+            # the signals are parsed in the precision of the evaluation (see readSignals(dtype=...))
+            double = evaluate(signals.astype(floatType("double")), fs, "double")
+            single = evaluate(signals.astype(floatType("single")), fs, "single")
+            rows.append(
+                [f"2^{length}", f"{snr_db:g}"]
+                + [f"{double[idx]:.2f}" for idx in [0, 2]]
+                + [f"{abs(single[idx] - double[idx]):.2e}" for idx in range(4)]
+                + [f"{double[4]:.0f}", f"{single[4]:.0f}"]
+            )
+    headers = [
+        "Samples",
+        "Noise SNR (dB)",
+        "SFDR (dB)",
+        "SNR (dB)",
+        "|dSFDR| (dB)",
+        "|dTHD| (dB)",
+        "|dSNR| (dB)",
+        "|dSNDR| (dB)",
+        "Peak double (MB)",
+        "Peak single (MB)",
+    ]
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
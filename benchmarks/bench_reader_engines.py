@@ -0,0 +1,89 @@
+"""_summary_
+Benchmark of the CSV reader engines of dycifer.read.readSignals against the size of the signals file.
+Usage:
+    python benchmarks/bench_reader_engines.py [--sizes 10 100 1000] [--signals 8]
+    (sizes in MB of the generated CSV files)
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+from pandas import DataFrame
+from tabulate import tabulate
+from dycifer.read import readSignals, ReaderEngines
+
+
+def writeSignalsFile(file_path: str, size_mb: float, n_signals: int = 8):
+    """_summary_
+    Writes a CSV file of (approximately) size_mb MB with a time column and n_signals sine waves.
+    """
+    rng = np.random.default_rng(0)
+    # approximate number of characters of each row
+    row_size = 24 * (n_signals + 1)
+    n_rows = int(size_mb * 2**20 / row_size)
+    block_rows = 2**18
+    with open(file_path, "w") as fp:
+        for start in range(0, n_rows, block_rows):
+            t = np.arange(start, min(start + block_rows, n_rows)) / 1e9
+            data = {"time [s]": t}
+            for idx in range(n_signals):
+                data[f"v{idx}"] = np.sin(2 * np.pi * 1e7 * (idx + 1) * t) + 1e-3 * (
+                    rng.standard_normal(len(t))
+                )
+            DataFrame(data).to_csv(fp, index=False, header=(start == 0))
+
+
+def timeEngine(file_path: str, engine: str, repeats: int = 3) -> float:
+    """_summary_
+    Returns the best parsing time (in seconds) of the signals file with the given engine.
+    """
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        readSignals(file_path, use_cache=False, engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description="Benchmark of the CSV reader engines.")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[10, 100, 1000])
+    parser.add_argument("--signals", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+    engines = [elem.value for elem in ReaderEngines]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            file_path = os.path.join(tmp_dir, f"signals_{size_mb:g}MB.csv")
+            writeSignalsFile(file_path, size_mb, args.signals)
+            times = {}
+            for engine in engines:
+                try:
+                    times[engine] = timeEngine(file_path, engine, args.repeats)
+                except ImportError:
+                    times[engine] = np.nan
+            rows.append(
+                [f"{os.path.getsize(file_path) / 2**20:.0f}"]
+                + [f"{times[engine]:.3f}" for engine in engines]
+                + [
+                    f"x{times['pandas'] / times[engine]:.2f}"
+                    for engine in engines
+                    if engine != "pandas"
+                ]
+            )
+            os.remove(file_path)
+    headers = (
+        ["Size (MB)"]
+        + [f"{engine} (s)" for engine in engines]
+        + [f"{engine} speedup" for engine in engines if engine != "pandas"]
+    )
+    print(f"\nCores: {os.cpu_count()}")
+    print(tabulate(rows, headers=headers, tablefmt="psql"))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,34 @@ from loguru import logger as log
 from pandas import DataFrame
 import numpy as np
 from dycifer.utils import plotPrettyFFT
-from dycifer.read import readSignals
+from dycifer.read import (
+    readSignals,
+    streamSignals,
+    collectSignals,
+    analysisWindow,
+    Reiterable,
+    isReiterable,
+    countSamples,
+)
+from dycifer.resample import sampleSignals, sampleBlocks, resampleBlocks
+from dycifer.spectrum import (
+    Spectrum,
+    signalSpectrum,
+    spectralMetrics,
+    floatType,
+    binPower,
+    windowGains,
+    windowSpan,
+    estimateToneFrequency,
+    streamHarmonics,
+    harmonicMetrics,
+    spectrumPower,
+    coherentRecord,
+    streamWelchSpectra,
+)
 from modelling_utils import stof, timer
 from enum import Enum
+from itertools import chain
 
 
 def analogDynamicEval(subparser, *args, **kwargs):
@@ -27,8 +52,42 @@ def analogDynamicEval(subparser, *args, **kwargs):
     except Exception as e:
         log.error(traceback.format_exc())
     # from the signals argument (containing the signals file filepath)
-    # extract the signals
-    signals = readSignals(argv.signals[0])
+    # extract only the analysed signals
+    output_signals = None if "all" in argv.output_signal else argv.output_signal
+    columns = None
+    if output_signals is not None:
+        columns = output_signals + [
+            argv.input_signal[0] if bool(argv.input_signal) else None
+        ]
+    batched = output_signals is None or len(output_signals) > 1
+    # analysis window: the rows outside of it are skipped before parsing
+    time_range, row_range = analysisWindow(
+        t_start=argv.t_start[0] if bool(argv.t_start) else None,
+        t_stop=argv.t_stop[0] if bool(argv.t_stop) else None,
+        start_sample=argv.start_sample[0] if bool(argv.start_sample) else None,
+        n_samples=argv.n_samples[0] if bool(argv.n_samples) else None,
+    )
+    if bool(argv.chunk_size):
+        # the file is streamed again at each pass over the signals (e.g. to average the spectra)
+        signals = Reiterable(
+            streamSignals,
+            argv.signals,
+            columns=columns,
+            chunk_size=argv.chunk_size[0],
+            use_cache=not argv.no_cache,
+            time_range=time_range,
+            row_range=row_range,
+        )
+    else:
+        signals = readSignals(
+            argv.signals,
+            columns=columns,
+            use_cache=not argv.no_cache,
+            engine=argv.reader_engine[0] if bool(argv.reader_engine) else "pandas",
+            dtype=floatType(argv.precision[0]) if bool(argv.precision) else None,
+            time_range=time_range,
+            row_range=row_range,
+        )
     if argv.continuous_aos:
         print(
             "Running Continuous Amplitude Output System (CAOS) Dynamic Performance Evaluation..."
@@ -41,6 +100,48 @@ def analogDynamicEval(subparser, *args, **kwargs):
         harmonics = argv.harmonics[0] if bool(argv.harmonics) else 7
         signal_span = argv.signal_span[0] if bool(argv.signal_span) else 0.0
         noise_power = argv.noise_power[0] if bool(argv.noise_power) else -1.0
+        resampling = argv.resampling[0] if bool(argv.resampling) else None
+        precision = argv.precision[0] if bool(argv.precision) else "double"
+        window = argv.window[0] if bool(argv.window) else "rectangular"
+        segments = argv.segments[0] if bool(argv.segments) else 1
+        overlap = argv.overlap[0] if bool(argv.overlap) else 0.5
+        fft_backend = argv.fft_backend[0] if bool(argv.fft_backend) else None
+        tone_frequency = (
+            stof(argv.tone_frequency[0]) if bool(argv.tone_frequency) else None
+        )
+        if batched:
+            # evaluate all the output signals at once, one row per signal
+            dynamic_eval_indicators = caosBatchEval(
+                signals,
+                sampling_freq,
+                output_signal_names=output_signals,
+                input_signal_name=input_signal,
+                harmonics=harmonics,
+                signal_span_factor=signal_span,
+                noise_power=noise_power,
+                resampling=resampling,
+                precision=precision,
+                window=window,
+                segments=segments,
+                overlap=overlap,
+                fft_backend=fft_backend,
+                targeted=argv.targeted,
+                tone_frequency=tone_frequency,
+            )
+            if argv.plot:
+                log.warning(
+                    "\nThe spectra of the batched evaluation are not plotted: evaluate a single output signal to plot its spectrum."
+                )
+            if bool(argv.output_file) and argv.generate_table:
+                tablename = argv.output_file[0]
+                dynamic_eval_indicators.to_csv(tablename + ".csv")
+                dynamic_eval_indicators.to_json(tablename + ".json")
+                dynamic_eval_indicators.to_markdown(tablename + ".md")
+                dynamic_eval_indicators.to_latex(tablename + ".tex")
+            print()
+            print(dynamic_eval_indicators.to_string())
+            print("\nPerformance evaluation finished.")
+            return
         # pdb.set_trace()
         # perform dynamic performance evaluation
         (
@@ -64,6 +165,15 @@ def analogDynamicEval(subparser, *args, **kwargs):
             harmonics=harmonics,
             signal_span_factor=signal_span,
             noise_power=noise_power,
+            resampling=resampling,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            fft_backend=fft_backend,
+            targeted=argv.targeted,
+            tone_frequency=tone_frequency,
+            coherent=argv.coherent,
         )
         # prepare to plot resulting information
         dynamic_eval_indicators = DataFrame(
@@ -81,12 +191,19 @@ def analogDynamicEval(subparser, *args, **kwargs):
             },
             index=["Dynamic Evaluation Indicators"],
         )
-        if argv.plot:
+        if spectrum is not None and spectrum.record is not None:
+            # report the coherent record the spectrum was computed from
+            start, length = spectrum.record
+            dynamic_eval_indicators[
+                "Coherent Record (samples)"
+            ] = f"[{start}, {start + length})"
+            dynamic_eval_indicators[
+                "Coherence Error (cycles)"
+            ] = spectrum.coherence_error
+        # (no spectrum is computed by the targeted evaluation)
+        if argv.plot and spectrum is not None:
             plotPrettyFFT(
-                spectrum[
-                    spectrum.index.values >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
+                spectrum,  # one-sided spectrum
                 title="Signal Spectrum (dB)",
                 xlabel="Frequency (GHz)",
                 ylabel="Power (dB)",
@@ -97,19 +214,17 @@ def analogDynamicEval(subparser, *args, **kwargs):
                 xscale="G",
             )
         if bool(argv.output_file):
-            plotPrettyFFT(
-                spectrum[
-                    spectrum.index >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
-                title="Signal Spectrum (dB)",
-                xlabel="Frequency (GHz)",
-                ylabel="Power (dB)",
-                show=False,
-                file_path=argv.output_file[0] + ".png",
-                target_harmonics=target_harmonics,
-                xscale="G",
-            )
+            if spectrum is not None:
+                plotPrettyFFT(
+                    spectrum,  # one-sided spectrum
+                    title="Signal Spectrum (dB)",
+                    xlabel="Frequency (GHz)",
+                    ylabel="Power (dB)",
+                    show=False,
+                    file_path=argv.output_file[0] + ".png",
+                    target_harmonics=target_harmonics,
+                    xscale="G",
+                )
             if argv.generate_table:
                 tablename = argv.output_file[0]
                 dynamic_eval_indicators.to_csv(tablename + ".csv")
@@ -123,6 +238,20 @@ def analogDynamicEval(subparser, *args, **kwargs):
         print(
             "Running Discrete Amplitude Output System (DAOS) Dynamic Performance Evaluation..."
         )
+        if batched:
+            raise ValueError(
+                "The DAOS evaluation analyses a single output signal at a time."
+            )
+        if argv.targeted or bool(argv.tone_frequency):
+            # the rise time and bandwidth of the DAOS are measured over the whole waveform
+            raise ValueError(
+                "The DAOS evaluation does not support the targeted mode (--targeted, --tone-frequency)."
+            )
+        if argv.coherent:
+            # trimming the record would cut the transitions of the DAOS waveform
+            raise ValueError(
+                "The DAOS evaluation does not support the coherent record (--coherent)."
+            )
         sampling_freq = stof(
             argv.sampling_frequency[0]
         )  # convert the parsed string to a float
@@ -133,6 +262,12 @@ def analogDynamicEval(subparser, *args, **kwargs):
         harmonics = argv.harmonics[0] if bool(argv.harmonics) else 7
         signal_span = argv.signal_span[0] if bool(argv.signal_span) else 0.0
         noise_power = argv.noise_power[0] if bool(argv.noise_power) else -1.0
+        resampling = argv.resampling[0] if bool(argv.resampling) else None
+        precision = argv.precision[0] if bool(argv.precision) else "double"
+        window = argv.window[0] if bool(argv.window) else "rectangular"
+        segments = argv.segments[0] if bool(argv.segments) else 1
+        overlap = argv.overlap[0] if bool(argv.overlap) else 0.5
+        fft_backend = argv.fft_backend[0] if bool(argv.fft_backend) else None
         (
             spectrum,
             target_harmonics,
@@ -159,6 +294,12 @@ def analogDynamicEval(subparser, *args, **kwargs):
             levels=(0.1, upper_level),
             wave_type=wave_type,
             show_rise_time_eval=argv.plot,
+            resampling=resampling,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            fft_backend=fft_backend,
         )
         # prepare to plot resulting information
         dynamic_eval_indicators = DataFrame(
@@ -180,10 +321,7 @@ def analogDynamicEval(subparser, *args, **kwargs):
         )
         if argv.plot:
             plotPrettyFFT(
-                spectrum[
-                    spectrum.index.values >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
+                spectrum,  # one-sided spectrum
                 title="Signal Spectrum (dB)",
                 xlabel="Frequency (GHz)",
                 ylabel="Power (dB)",
@@ -195,10 +333,7 @@ def analogDynamicEval(subparser, *args, **kwargs):
             )
         if bool(argv.output_file):
             plotPrettyFFT(
-                spectrum[
-                    spectrum.index >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
+                spectrum,  # one-sided spectrum
                 title="Signal Spectrum (dB)",
                 xlabel="Frequency (GHz)",
                 ylabel="Power (dB)",
@@ -233,11 +368,21 @@ def caosDynamicEval(
     harmonics: int = 7,
     signal_span_factor: float = 0.0,
     noise_power: float = -1.0,
-) -> tuple[DataFrame, float, float, float, float, float, float, float, float]:
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+    targeted: bool = False,
+    tone_frequency: float = None,
+    coherent: bool = False,
+) -> tuple[Spectrum, float, float, float, float, float, float, float, float]:
     """_summary_
     Dynamic performance evaluation of Continuous Analog Output Systems (CAOS)
     Args:
-        signals (DataFrame): The time series data with all the correspondant signals.
+        signals (DataFrame): The time series data with all the correspondant signals,
+                            or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
         sampling_frequency (float): The sampling frequency of the signals.
         harmonics (int, optional): The number of harmonics to be used in the CAOS. Defaults to 7.
         signal_span_factor (float, optional): The factor to be used to scale the signal span. Defaults to 0.0.
@@ -245,9 +390,28 @@ def caosDynamicEval(
         output_signal_name (str): The name of the output signal.
         input_signal_name (str, optional): The name of the input signal. Defaults to None. In no input signal is provided,
         the Gain of the system will not be computed.
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+        the sampling frequency grid. Defaults to None (linear, and only for non-uniform time steps).
+        precision (str, optional): "double" (float64 samples and complex128 FFT) or "single" (float32 samples and
+        complex64 FFT, halving the memory at the cost of the accuracy documented in docs/precision.md). Defaults to "double".
+        window (str, optional): The window applied to the signals before the FFT ("rectangular", "hann", "blackmanharris",
+        "kaiser[:beta]" or "flattop"), for non-coherently sampled signals. The powers are corrected for the coherent gain and
+        the equivalent noise bandwidth of the window. Defaults to "rectangular".
+        segments (int, optional): The number of overlapping segments of the signals whose power spectra are averaged (Welch's
+        method), bounding the FFT memory to the segment length and lowering the variance of the noise floor. Defaults to 1.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend ("numpy", "scipy" or "pyfftw", see dycifer.fft.fftBackend).
+        Defaults to None (the DYCIFER_FFT_BACKEND environment variable, or scipy).
+        targeted (bool, optional): Measure the signals at the fundamental tone and its harmonics only (see
+        dycifer.spectrum.targetedMetrics), in a single pass over the (streamed) signals and without any spectrum:
+        neither the spectrum nor the SFDR are returned. Defaults to False.
+        tone_frequency (float, optional): The frequency of the fundamental tone of the targeted mode and of the
+        coherent record [Hz]. Defaults to None (estimated from the output signal).
+        coherent (bool, optional): Trim the signals to their longest coherent record of FFT-friendly (5-smooth) length
+        (see dycifer.spectrum.coherentRecord), reported through the record and coherence_error of the spectrum. Defaults to False.
     Returns:
-        tuple[DataFrame, float, float, float, float, float, float, float]: The CAOS performance evaluation results.
-            DataFrame: The frequency spectrum of the CAOS output signal in volt, volt squared (power in watt) and decibels.
+        tuple[Spectrum, float, float, float, float, float, float, float]: The CAOS performance evaluation results.
+            Spectrum: The frequency spectrum of the CAOS output signal (see dycifer.spectrum.Spectrum).
             float(1): Output Signal's power in decibels
             float(2): Output Signal's DC power (in dB)
             float(3): Gain in linear scale
@@ -259,170 +423,139 @@ def caosDynamicEval(
             float(9): Fractional Second-Harmonic Distortion (HD2) metric
             float(10): Fractional Third-Harmonic Distortion (HD3) metric
     """
-    downsampling = 1
+    if targeted:
+        return caosTargetedEval(
+            signals,
+            sampling_frequency,
+            output_signal_name,
+            input_signal_name=input_signal_name,
+            harmonics=harmonics,
+            noise_power=noise_power,
+            resampling=resampling,
+            precision=precision,
+            tone_frequency=tone_frequency,
+        )
     ts = 1.0 / sampling_frequency
     fs = 1.0 / ts
-    if not bool(signals.index.name):
-        # in case there is no time axis frame
-        # automatically generate one from the sampling frequency
-
-        t = np.arange(0, len(signals) * ts, ts)
-        signals.set_index(t, inplace=True)
+    in_spectrum = None
+    streamed = not isinstance(signals, DataFrame) and isReiterable(signals)
+    if streamed and segments > 1 and not coherent:
+        # averaged spectra of re-iterable streamed blocks (the length of the segments depends on the
+        # number of samples, counted in a first pass): only the segments being accumulated are held
+        columns = [output_signal_name]
+        if bool(input_signal_name):
+            columns.append(input_signal_name)
+        blocks = Reiterable(sampleBlocks, signals, fs, resampling=resampling)
+        spectra, n_fft = streamWelchSpectra(
+            signalArrays(blocks, columns, floatType(precision), noise_power),
+            countSamples(blocks),
+            ts,
+            segments,
+            overlap=overlap,
+            precision=precision,
+            window=window,
+            backend=fft_backend,
+        )
+        spectrum = spectra[0]
+        if bool(input_signal_name):
+            in_spectrum = spectra[1]
+        record = None
+        coherence_error = np.nan
     else:
-        downsampling = int(
-            round(
-                (1.0 / sampling_frequency)
-                / (signals.index.values[1] - signals.index.values[0])
+        if not isinstance(signals, DataFrame):
+            # streamed blocks of signals: gather only the analysed signals
+            if bool(resampling):
+                signals = resampleBlocks(signals, sampling_frequency, method=resampling)
+            signals = collectSignals(
+                signals,
+                columns=[output_signal_name, input_signal_name],
+                dtype=floatType(precision),
+            )
+        if not (output_signal_name in signals.columns):
+            raise ValueError(
+                f"{output_signal_name} does not belong to the parsed signals."
             )
+        # downsample (or resample) the signals to the sampling frequency
+        signals = sampleSignals(signals, sampling_frequency, resampling=resampling)
+        # keep the samples in the floating point type of the chosen precision
+        signals = signals.astype(floatType(precision), copy=False)
+        # ts = signals.index.values[1] - signals.index.values[0]
+        # fs = 1.0 / ts
+        n_samples = len(signals.index)
+        if noise_power > 0:
+            noise_watt = (10 ** (noise_power / 10)) * 1e-3
+            noise = np.random.normal(0, np.sqrt(noise_watt), size=n_samples)
+            signals[output_signal_name] = signals[output_signal_name] + noise.astype(
+                floatType(precision)
+            )
+        record = None
+        coherence_error = np.nan
+        if coherent:
+            # trim the signals to a coherent record of FFT-friendly length
+            start, length, cycles, coherence_error = coherentRecord(
+                signals[output_signal_name].values, fs, tone_frequency=tone_frequency
+            )
+            log.info(
+                f"\nCoherent record: samples [{start}, {start + length}) holding {cycles:.4f} periods of the fundamental tone (coherence error: {coherence_error:.2e} cycles)."
+            )
+            signals = signals.iloc[start : start + length]
+            record = (start, length)
+        spectrum, n_fft = signalSpectrum(
+            signals[output_signal_name].values,
+            ts,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            backend=fft_backend,
         )
-        if downsampling < 1:
+    if bool(input_signal_name) and in_spectrum is None:
+        if not (input_signal_name in signals.columns):
             raise ValueError(
-                "Sampling time period must be equal or higher than the signals' time resolution."
+                f"{input_signal_name} does not belong to the parsed signals."
             )
-    if not (output_signal_name in signals.columns):
-        raise ValueError(f"{output_signal_name} does not belong to the parsed signals.")
-    # perform downsampling if so was chosen
-    signals = signals[::downsampling]
-    # ts = signals.index.values[1] - signals.index.values[0]
-    # fs = 1.0 / ts
-    n_samples = len(signals.index)
-    if noise_power > 0:
-        noise_watt = (10 ** (noise_power / 10)) * 1e-3
-        signals[output_signal_name] = signals[output_signal_name] + np.random.normal(
-            0, np.sqrt(noise_watt), size=n_samples
-        )
-    vout = np.abs(
-        np.fft.fftshift(np.fft.fft(signals[output_signal_name].values) / n_samples)
-    )  # [V]
-    freq = np.fft.fftshift(np.fft.fftfreq(len(vout), ts))  # [Hz]
-    power = (
-        vout * vout
-    )  # [V^2] - square the voltage spectrum to obtain the power spectrum
-    power_db = 10 * np.log10(power)  # [dB] - convert the power spectrum to dB
-    spectrum = DataFrame(
-        index=freq, data={"vout": vout, "power": power, "power_db": power_db}
-    )
-    # positive frequencies spectrum
-    pspectrum = spectrum[spectrum.index >= 0].copy()
+        in_spectrum = signalSpectrum(
+            signals[input_signal_name].values,
+            ts,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            backend=fft_backend,
+        )[0]
+    spectrum.record = record
+    spectrum.coherence_error = coherence_error
+    freq = spectrum.freq  # [Hz]
     # ********************************************
-    # Obtaining the ADC's output signal power
+    # Computing the output signal power, SFDR, THD,
+    # SNR, SNDR, HD2 and HD3 from the integer bins
+    # of the one-sided spectrum
     # ********************************************
     # determine the span of the signal's spectrum to consider it's total dispersed power
-    span = np.max([1, int(np.floor(signal_span_factor * len(pspectrum.index)))])
-    # obtain the signal frequency bin
-    signal_bin = pspectrum["power"][
-        span:
-    ].idxmax()  # don't count DC signal when searching for the signal bin
-    # obtain the harmonics of the signal from the signal bin
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (mult * signal_bin))
-            == np.min(np.abs(pspectrum.index - (mult * signal_bin)))
-        ][0]
-        for mult in range(1, harmonics + 1)
-        if mult * signal_bin <= np.max(freq)
-    ]
-    # tones that surpass Fs are aliased back to [0, Fs/2] spectrum
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (fs - bin))
-            == np.min(np.abs(pspectrum.index - (fs - bin)))
-        ]
-        if bin > fs / 2
-        else bin
-        for bin in harmonic_bins
-    ]
-    # indexes of the harmonic bins
-    harmonic_bins_idxs = [
-        pspectrum.index.get_loc(bin) for bin in harmonic_bins if bin in pspectrum.index
-    ]
-    harmonics_power = np.array(
-        [
-            np.sum(
-                pspectrum["power"]
-                .iloc[harmonic_bin_idx - span : harmonic_bin_idx + span]
-                .values
-            )
-            for harmonic_bin_idx in harmonic_bins_idxs
-        ]
-    )
-    # obtain the signal_power
-    signal_power = harmonics_power[0]
-    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
-    signal_dc_power = np.sum(pspectrum["power"].iloc[0 : 0 + span].values)
-    DC_POWER_DB = 10 * np.log10(signal_dc_power)
-    # ********************************************
-    # Computing SFDR - Spurious Free Dynamic Range
-    #  - Obtain the power of the
-    #       strongest spurious component
-    #       of the spectrum (excluding the
-    #       DC component) and compute the SFDR.
-    # ********************************************
-    signal_bin_idx = harmonic_bins_idxs[0]  # get the index of the signal bin
-    spurious_spectrum = pspectrum["power"].copy()
-    # erase the signal bin from the spurious spectrum
-    spurious_spectrum.iloc[signal_bin_idx - span : signal_bin_idx + span] = np.min(
-        pspectrum["power"]
+    # (at least the mainlobe of the window)
+    span = np.max(
+        [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
     )
-    # erase the signal's DC component from the spurious spectrum
-    spurious_spectrum.iloc[0 : 0 + span] = np.min(pspectrum["power"])
-    # find the strongest spurious component
-    spur_bin = spurious_spectrum.idxmax()
-    spur_bin_idx = pspectrum.index.get_loc(spur_bin)
-    # measure the power of the strongest spurious component
-    spur_power = np.sum(
-        spurious_spectrum.iloc[spur_bin_idx - span : spur_bin_idx + span].values
+    (
+        harmonic_bins_idxs,
+        harmonics_power,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        SFDR,
+        THD,
+        SNR,
+        SNDR,
+        HD2,
+        HD3,
+    ) = spectralMetrics(
+        spectrum.power,
+        n_fft,
+        harmonics=harmonics,
+        span=span,
+        enbw=windowGains(window, n_fft)[1],
     )
-    # compute the SFDR
-    SFDR = 10 * np.log10(signal_power / spur_power)
-    # ********************************************
-    # Computing THD - Total Harmonic Distortion
-    #  - Obtain the power of each harmonic component
-    # ********************************************
-    # compute the total power of the sum of the harmonics
-    THD = np.nan
-    SNR = np.nan
-    SNDR = np.nan
-    HD2 = np.nan
-    HD3 = np.nan
-    try:
-        total_distortion_power = np.sum(harmonics_power[1:])
-        THD = 10 * np.log10(total_distortion_power / harmonics_power[0])
-        # ********************************************
-        # Computing SNR - Signal to Noise Ratio
-        #  - Obtain the noise power in the spectrum
-        # ********************************************
-        noise_power = (
-            np.sum(pspectrum["power"].values)
-            - signal_dc_power
-            - signal_power
-            - total_distortion_power
-        )
-        SNR = 10 * np.log10(signal_power / noise_power)
-        # ********************************************
-        # Computing SNDR - Signal to Noise & Distortion Ratio
-        #  - Add the noise and distortion power in
-        #     the spectrum and compare them to the
-        #     signal power
-        # ********************************************
-        SNDR = 10 * np.log10(signal_power / (noise_power + total_distortion_power))
-        # ********************************************
-        # Computing ENOB - Effective Number of Bits
-        #  - Check deterioration of the ADC's
-        #    ideal resolution because of the SNDR
-        # ********************************************
-        ENOB = (SNDR - 1.76) / 6.02
-        # ********************************************
-        # Computing HD2 and HD3 - Fractional Harmonic
-        # Distortion of Second and Third order
-        # harmonics
-        # ********************************************
-        HD2 = 10 * np.log10(harmonics_power[1] / harmonics_power[0])
-        HD3 = 10 * np.log10(harmonics_power[2] / harmonics_power[0])
-    except IndexError:
-        log.warning(
-            f"\nTried to access an harmonic that was not found in the frequency domain of the analysed spectrum.\nThis is likely due to the fact that the chosen sampling frequency is \nviolating the Nyquist Theorem in relation to the 2nd or 3rd Order Harmonics.\nTry to increase the sampling frequency."
-        )
+    signal_power = harmonics_power[0]
+    harmonic_bins = freq[harmonic_bins_idxs]
     # ********************************************
     # Computing Gain - Output Signal amplitude
     # to Input Signal amplitude ratio
@@ -430,46 +563,12 @@ def caosDynamicEval(
     # measure the power of the fundamental harmonic of the input spectrum
     GAIN = np.nan
     GAIN_DB = np.nan
-    if bool(input_signal_name):
-        if not (input_signal_name in signals.columns):
-            raise ValueError(
-                f"{input_signal_name} does not belong to the parsed signals."
-            )
-
-        vin = np.abs(
-            np.fft.fftshift(np.fft.fft(signals[input_signal_name].values) / n_samples)
-        )
-        freq_in = np.fft.fftshift(np.fft.fftfreq(len(vin), ts))  # [Hz]
-        in_power = vin * vin
-        in_power_db = np.nan_to_num(
-            10 * np.log10(in_power), nan=0.0, posinf=0.0, neginf=0.0, copy=True
-        )
-        in_spectrum = DataFrame(
-            index=freq_in,
-            data={"vin": vin, "in_power": in_power, "in_power_db": in_power_db},
-        )
-        in_pspectrum = in_spectrum[in_spectrum.index >= 0].copy()
-        in_signal_bin = in_pspectrum["in_power"][
-            0 + span :
-        ].idxmax()  # don't count DC signal when searching for the signal bin
-        # obtain the harmonics of the signal from the signal bin
-        in_harmonic_bins = [
-            mult * in_signal_bin
-            for mult in range(1, harmonics + 1)
-            if mult * signal_bin <= np.max(freq)
-        ]
-        # tones that surpass Fs are aliased back to [0, Fs/2] spectrum
-        in_harmonic_bins = [
-            fs - bin if bin > fs / 2 else bin for bin in in_harmonic_bins
-        ]
-        # indexes of the harmonic bins
-        in_harmonic_bins_idxs = [
-            pspectrum.index.get_loc(bin) for bin in in_harmonic_bins
-        ]
-        input_signal_power = np.sum(
-            in_pspectrum["in_power"]
-            .iloc[in_harmonic_bins_idxs[0] : in_harmonic_bins_idxs[0] + span]
-            .values
+    if in_spectrum is not None:
+        in_power = in_spectrum.power
+        # don't count DC signal when searching for the signal bin
+        in_signal_bin = span + int(np.argmax(in_power[span:]))
+        input_signal_power = (
+            binPower(in_power, in_signal_bin, span) / windowGains(window, n_fft)[1]
         )
         GAIN = np.sqrt(signal_power / input_signal_power)
         GAIN_DB = 20 * np.log10(GAIN)
@@ -490,6 +589,352 @@ def caosDynamicEval(
     )
 
 
+def signalArrays(
+    blocks,
+    columns: list,
+    dtype: np.dtype,
+    noise_power: float = -1.0,
+    outputs: int = 1,
+    seed: int = None,
+):
+    """_summary_
+    Converts blocks of signals into (n_samples, n_signals) arrays of the analysed signals.
+    Args:
+        blocks (iterable): The DataFrame blocks of the signals.
+        columns (list): The names of the analysed signals (the output signals first).
+        dtype (np.dtype): The floating point type of the arrays.
+        noise_power (float, optional): The noise power (in dBm) artificially added to the output signals. Defaults to -1.0 (none).
+        outputs (int, optional): The number of output signals. Defaults to 1.
+        seed (int, optional): The seed of the noise, drawing the same noise on every pass over the blocks. Defaults to None (unseeded).
+    Yields:
+        np.ndarray: the (n_samples, n_signals) arrays of the analysed signals.
+    """
+    normal = np.random.normal if seed is None else np.random.default_rng(seed).normal
+    for block in blocks:
+        for column in columns:
+            if not (column in block.columns):
+                raise ValueError(f"{column} does not belong to the parsed signals.")
+        values = block[columns].to_numpy(dtype=dtype, copy=True)
+        if noise_power > 0:
+            noise_watt = (10 ** (noise_power / 10)) * 1e-3
+            values[:, :outputs] += normal(
+                0, np.sqrt(noise_watt), size=(len(values), outputs)
+            ).astype(dtype)
+        yield values
+
+
+def signalLevels(hist: np.ndarray, bin_edges: np.ndarray, threshold: float) -> tuple:
+    """_summary_
+    Finds the two discrete levels of a signal from its histogram: the two most probable bins above the threshold.
+    Args:
+        hist (np.ndarray): The counts (or probabilities) of the bins of the histogram of the signal.
+        bin_edges (np.ndarray): The edges of the bins of the histogram.
+        threshold (float): The value of the signal above which the levels are searched.
+    Returns:
+        tuple[float, float]: the lower and the upper levels of the signal.
+    """
+    from heapq import nlargest
+
+    hist_filtered = hist[bin_edges[:-1] > threshold]
+    signal_levels_prob = nlargest(2, hist_filtered)
+    signal_levels = (
+        bin_edges[:-1][bin_edges[:-1] > threshold][
+            hist_filtered == signal_levels_prob[0]
+        ],
+        bin_edges[:-1][bin_edges[:-1] > threshold][
+            hist_filtered == signal_levels_prob[1]
+        ],
+    )
+    signal_levels = signal_levels[0][0], signal_levels[1][0]
+    return tuple(sorted(signal_levels))
+
+
+def levelCrossings(v: np.ndarray, level: float, offset: int = 0) -> np.ndarray:
+    """_summary_
+    Finds the (linearly interpolated) fractional sample indexes at which a signal crosses a level.
+    Args:
+        v (np.ndarray): The samples of the signal.
+        level (float): The level crossed.
+        offset (int, optional): The index of the first sample of the signal. Defaults to 0.
+    Returns:
+        np.ndarray: the fractional sample indexes of the crossings.
+    """
+    delta_v = np.diff(v)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (level - v[:-1]) / delta_v
+    idx = np.where((t > 0) & (t < 1))[0]
+    return offset + idx + t[idx]
+
+
+def shortestTransition(t_start: np.ndarray, t_end: np.ndarray) -> tuple:
+    """_summary_
+    Finds the closest pair of crossings of two levels, sorting the crossings instead of comparing every pair.
+    Args:
+        t_start (np.ndarray): The fractional sample indexes of the crossings of the start level.
+        t_end (np.ndarray): The fractional sample indexes of the crossings of the end level.
+    Returns:
+        tuple[float, float]: the crossings of the start and of the end levels of the shortest transition.
+    """
+    if len(t_start) == 0 or len(t_end) == 0:
+        raise ValueError("The signal does not transition between its levels.")
+    order = np.argsort(t_start)
+    t_sorted = np.asarray(t_start)[order]
+    t_end = np.asarray(t_end)
+    # the nearest crossings of the start level lie just before or just after each crossing of the end level
+    after = np.clip(np.searchsorted(t_sorted, t_end), 0, len(t_sorted) - 1)
+    before = np.clip(after - 1, 0, len(t_sorted) - 1)
+    nearest = np.where(
+        np.abs(t_end - t_sorted[before]) <= np.abs(t_end - t_sorted[after]),
+        before,
+        after,
+    )
+    k = int(np.argmin(np.abs(t_end - t_sorted[nearest])))
+    return t_sorted[nearest[k]], t_end[k]
+
+
+def caosTargetedEval(
+    signals: DataFrame,
+    sampling_frequency: float,
+    output_signal_name: str,
+    input_signal_name: str = None,
+    harmonics: int = 7,
+    noise_power: float = -1.0,
+    resampling: str = None,
+    precision: str = "double",
+    tone_frequency: float = None,
+) -> tuple:
+    """_summary_
+    Targeted dynamic performance evaluation of Continuous Analog Output Systems (CAOS): the signals are only
+    measured at the fundamental tone and its harmonics (see dycifer.spectrum.targetedMetrics), in a single
+    pass over the (streamed) signals, so the memory is bounded by the block size whatever the record length.
+    Args: see caosDynamicEval.
+    Returns:
+        tuple: The results of caosDynamicEval, without the spectrum and the SFDR (None and NaN).
+    """
+    columns = [output_signal_name]
+    if bool(input_signal_name):
+        columns.append(input_signal_name)
+    fs = sampling_frequency
+    if isinstance(signals, DataFrame):
+        blocks = [sampleSignals(signals, fs, resampling=resampling)]
+        if tone_frequency is None:
+            tone_frequency = estimateToneFrequency(
+                blocks[0][output_signal_name].values, fs
+            )
+    else:
+        blocks = sampleBlocks(signals, fs, resampling=resampling)
+        if tone_frequency is None:
+            log.warning(
+                "\nNo tone frequency given: the fundamental tone is located from the first samples of the streamed signals (see --tone-frequency)."
+            )
+    (
+        tone_frequency,
+        frequencies,
+        harmonics_power,
+        dc_power,
+        residual_power,
+    ) = streamHarmonics(
+        signalArrays(blocks, columns, floatType(precision), noise_power, outputs=1),
+        fs,
+        tone_frequency,
+        harmonics=harmonics,
+    )
+    SIGNAL_POWER_DB, DC_POWER_DB, THD, SNR, SNDR, HD2, HD3 = harmonicMetrics(
+        harmonics_power[:, 0], dc_power[0], residual_power[0]
+    )
+    GAIN = np.nan
+    GAIN_DB = np.nan
+    if bool(input_signal_name):
+        GAIN = np.sqrt(harmonics_power[0, 0] / harmonics_power[0, 1])
+        GAIN_DB = 20 * np.log10(GAIN)
+    target_harmonics = list(zip(frequencies, 10 * np.log10(harmonics_power[:, 0])))
+    return (
+        None,
+        target_harmonics,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        GAIN,
+        GAIN_DB,
+        np.nan,
+        THD,
+        SNR,
+        SNDR,
+        HD2,
+        HD3,
+    )
+
+
+@timer
+def caosBatchEval(
+    signals: DataFrame,
+    sampling_frequency: float,
+    output_signal_names: list = None,
+    input_signal_name: str = None,
+    harmonics: int = 7,
+    signal_span_factor: float = 0.0,
+    noise_power: float = -1.0,
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+    targeted: bool = False,
+    tone_frequency: float = None,
+) -> DataFrame:
+    """_summary_
+    Batched dynamic performance evaluation of several comparable Continuous Analog Output Systems (CAOS)
+    outputs (e.g. the lanes of a multi-lane receiver): the output signals are gathered into a single
+    (n_samples, n_signals) array, transformed through a single FFT along the samples axis, and their
+    metrics are computed at once through vectorized reductions (see dycifer.spectrum.spectralMetrics).
+    Args:
+        signals (DataFrame): The time series data with all the correspondant signals,
+                            or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        sampling_frequency (float): The sampling frequency of the signals.
+        output_signal_names (list, optional): The names of the output signals. Defaults to None (all the signals
+        but the input signal).
+        input_signal_name (str, optional): The name of the input signal, shared by all the outputs. Defaults to None
+        (the Gain of the outputs will not be computed).
+        The other arguments are the arguments of caosDynamicEval.
+    Returns:
+        DataFrame: The indicators of the CAOS performance evaluation, one row per output signal.
+    """
+    dtype = floatType(precision)
+    fs = sampling_frequency
+    if not isinstance(signals, DataFrame) and (output_signal_names is None):
+        # streamed blocks of signals: the output signals are found in the first block
+        signals = iter(signals)
+        first = next(signals, None)
+        if first is None:
+            raise ValueError("No signals were streamed.")
+        signals = chain([first], signals)
+        output_signal_names = list(first.columns)
+    if output_signal_names is None:
+        output_signal_names = list(signals.columns)
+    output_signal_names = [
+        name for name in output_signal_names if name != input_signal_name
+    ]
+    columns = list(output_signal_names)
+    if bool(input_signal_name):
+        columns.append(input_signal_name)
+    n_outputs = len(output_signal_names)
+    if targeted:
+        # single pass over the (streamed) signals, at the harmonics only
+        if isinstance(signals, DataFrame):
+            blocks = [sampleSignals(signals, fs, resampling=resampling)]
+            if tone_frequency is None:
+                tone_frequency = estimateToneFrequency(
+                    blocks[0][output_signal_names[0]].values, fs
+                )
+        else:
+            blocks = sampleBlocks(signals, fs, resampling=resampling)
+        (
+            tone_frequency,
+            frequencies,
+            harmonics_power,
+            dc_power,
+            residual_power,
+        ) = streamHarmonics(
+            signalArrays(blocks, columns, dtype, noise_power, outputs=n_outputs),
+            fs,
+            tone_frequency,
+            harmonics=harmonics,
+        )
+        (
+            SIGNAL_POWER_DB,
+            DC_POWER_DB,
+            THD,
+            SNR,
+            SNDR,
+            HD2,
+            HD3,
+        ) = harmonicMetrics(
+            harmonics_power[:, :n_outputs],
+            dc_power[:n_outputs],
+            residual_power[:n_outputs],
+        )
+        SFDR = np.full(n_outputs, np.nan)
+        signal_power = harmonics_power[0, :n_outputs]
+        input_signal_power = harmonics_power[0, -1]
+    else:
+        if not isinstance(signals, DataFrame):
+            # streamed blocks of signals: gather only the analysed signals
+            if bool(resampling):
+                signals = resampleBlocks(signals, fs, method=resampling)
+            signals = collectSignals(signals, columns=columns, dtype=dtype)
+        signals = sampleSignals(signals, fs, resampling=resampling)
+        x = next(
+            signalArrays(
+                [signals], output_signal_names, dtype, noise_power, outputs=n_outputs
+            )
+        )
+        power, n_fft = spectrumPower(
+            x,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            backend=fft_backend,
+        )
+        del x
+        # determine the span of the signals' spectra to consider their total dispersed power
+        # (at least the mainlobe of the window)
+        span = np.max(
+            [windowSpan(window), int(np.floor(signal_span_factor * len(power)))]
+        )
+        (
+            harmonic_bins,
+            harmonics_power,
+            SIGNAL_POWER_DB,
+            DC_POWER_DB,
+            SFDR,
+            THD,
+            SNR,
+            SNDR,
+            HD2,
+            HD3,
+        ) = spectralMetrics(
+            power,
+            n_fft,
+            harmonics=harmonics,
+            span=span,
+            enbw=windowGains(window, n_fft)[1],
+        )
+        signal_power = harmonics_power[0]
+        if bool(input_signal_name):
+            in_power = spectrumPower(
+                signals[[input_signal_name]].to_numpy(dtype=dtype),
+                precision=precision,
+                window=window,
+                segments=segments,
+                overlap=overlap,
+                backend=fft_backend,
+            )[0][:, 0]
+            # don't count DC signal when searching for the signal bin
+            in_signal_bin = span + int(np.argmax(in_power[span:]))
+            input_signal_power = (
+                binPower(in_power, in_signal_bin, span) / windowGains(window, n_fft)[1]
+            )
+    GAIN = np.full(n_outputs, np.nan)
+    if bool(input_signal_name):
+        GAIN = np.sqrt(signal_power / input_signal_power)
+    return DataFrame(
+        data={
+            "Output Signal Power (dB)": SIGNAL_POWER_DB,
+            "Output DC Power (dB)": DC_POWER_DB,
+            "Gain (out/in)": GAIN,
+            "Gain (dB)": 20 * np.log10(GAIN),
+            "SFDR (dB)": SFDR,
+            "THD (dB)": THD,
+            "SNR (dB)": SNR,
+            "SNDR (dB)": SNDR,
+            "HD2": HD2,
+            "HD3": HD3,
+        },
+        index=output_signal_names,
+    )
+
+
 class WaveTypes(Enum):
     """_summary_
 
@@ -516,8 +961,13 @@ def daosDynamicEval(
     wave_type: str = "default",
     levels: tuple = (0.1, 0.9),
     show_rise_time_eval: bool = False,
-) -> tuple[DataFrame, float, float, float, float, float, float, float, float, float]:
-    from heapq import nlargest
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+) -> tuple[Spectrum, float, float, float, float, float, float, float, float, float]:
     from warnings import warn
     from matplotlib.pyplot import (
         plot,
@@ -535,7 +985,8 @@ def daosDynamicEval(
     """_summary_
     Dynamic performance evaluation of Discrete Analog Output Systems (CAOS)
     Args:
-        signals (DataFrame): The time series data with all the correspondant signals.
+        signals (DataFrame): The time series data with all the correspondant signals,
+                            or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
         sampling_frequency (float): The sampling frequency of the signals.
         output_signal_name (str): The name of the output signal.
         harmonics (int, optional): The number of harmonics to be used in the CAOS. Defaults to 7.
@@ -545,9 +996,21 @@ def daosDynamicEval(
         the Gain of the system will not be computed.
         wave_type (str, optional): The type of wave to be used in the DAOS. Defaults to "pulse". Options:
         levels (tuple, optional): The levels to be used in the Risetime computation. Defaults to (0.1, 0.9).
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+        the sampling frequency grid. Defaults to None (linear, and only for non-uniform time steps).
+        precision (str, optional): "double" (float64 samples and complex128 FFT) or "single" (float32 samples and
+        complex64 FFT, halving the memory at the cost of the accuracy documented in docs/precision.md). Defaults to "double".
+        window (str, optional): The window applied to the signals before the FFT ("rectangular", "hann", "blackmanharris",
+        "kaiser[:beta]" or "flattop"), for non-coherently sampled signals. The powers are corrected for the coherent gain and
+        the equivalent noise bandwidth of the window. Defaults to "rectangular".
+        segments (int, optional): The number of overlapping segments of the signals whose power spectra are averaged (Welch's
+        method), bounding the FFT memory to the segment length and lowering the variance of the noise floor. Defaults to 1.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend ("numpy", "scipy" or "pyfftw", see dycifer.fft.fftBackend).
+        Defaults to None (the DYCIFER_FFT_BACKEND environment variable, or scipy).
     Returns:
-        tuple[DataFrame, float, float, float, float, float, float, float]: The CAOS performance evaluation results.
-        DataFrame: The frequency spectrum of the CAOS output signal in volt, volt squared (power in watt) and decibels.
+        tuple[Spectrum, float, float, float, float, float, float, float]: The CAOS performance evaluation results.
+        Spectrum: The frequency spectrum of the DAOS output signal (see dycifer.spectrum.Spectrum).
         float(1): Output Signal's power in decibels
         float(2): Output Signal's DC power (in dB)
         float(3): Gain in linear scale
@@ -561,168 +1024,107 @@ def daosDynamicEval(
         float(11): Average Rise Time (ns) in 90% of the signal
         float(12): Estimated Bandwidth (Hz) of the output signal
     """
-    downsampling = 1
     ts = 1.0 / sampling_frequency
     fs = 1.0 / ts
-    if not bool(signals.index.name):
-        # in case there is no time axis frame
-        # automatically generate one from the sampling frequency
-        # ts = 1.0 / sampling_frequency
-        t = np.arange(0, len(signals) * ts, ts)
-        signals.set_index(t, inplace=True)
+    in_spectrum = None
+    arrays = None
+    streamed = not isinstance(signals, DataFrame) and isReiterable(signals)
+    if streamed and segments > 1:
+        # averaged spectra and rise time of re-iterable streamed blocks, over several passes: the
+        # noise is seeded so that every pass draws the same noise, and only the segments being
+        # accumulated are held
+        columns = [output_signal_name]
+        if bool(input_signal_name):
+            columns.append(input_signal_name)
+        blocks = Reiterable(sampleBlocks, signals, fs, resampling=resampling)
+        arrays = Reiterable(
+            signalArrays,
+            blocks,
+            columns,
+            floatType(precision),
+            noise_power,
+            seed=np.random.randint(2**31),
+        )
+        spectra, n_fft = streamWelchSpectra(
+            arrays,
+            countSamples(blocks),
+            ts,
+            segments,
+            overlap=overlap,
+            precision=precision,
+            window=window,
+            backend=fft_backend,
+        )
+        spectrum = spectra[0]
+        if bool(input_signal_name):
+            in_spectrum = spectra[1]
     else:
-        downsampling = int(
-            round(
-                (1.0 / sampling_frequency)
-                / (signals.index.values[1] - signals.index.values[0])
+        if not isinstance(signals, DataFrame):
+            # streamed blocks of signals: gather only the analysed signals
+            if bool(resampling):
+                signals = resampleBlocks(signals, sampling_frequency, method=resampling)
+            signals = collectSignals(
+                signals,
+                columns=[output_signal_name, input_signal_name],
+                dtype=floatType(precision),
             )
-        )
-        if downsampling < 1:
+        if not (output_signal_name in signals.columns):
             raise ValueError(
-                "Sampling time period must be equal or higher than the signals' time resolution."
+                f"{output_signal_name} does not belong to the parsed signals."
             )
-    if not (output_signal_name in signals.columns):
-        raise ValueError(f"{output_signal_name} does not belong to the parsed signals.")
-    # perform downsampling if so was chosen
-    signals = signals[::downsampling]
-    # ts = signals.index.values[1] - signals.index.values[0]
-    # fs = 1.0 / ts
-    n_samples = len(signals.index)
-    if noise_power > 0:
-        noise_watt = (10 ** (noise_power / 10)) * 1e-3
-        signals[output_signal_name] = signals[output_signal_name] + np.random.normal(
-            0, np.sqrt(noise_watt), size=n_samples
-        )
-    vout = np.abs(
-        np.fft.fftshift(np.fft.fft(signals[output_signal_name].values) / n_samples)
-    )  # [V]
-    freq = np.fft.fftshift(np.fft.fftfreq(len(vout), ts))  # [Hz]
-    power = (
-        vout * vout
-    )  # [V^2] - square the voltage spectrum to obtain the power spectrum
-    power_db = 10 * np.log10(power)  # [dB] - convert the power spectrum to dB
-    spectrum = DataFrame(
-        index=freq, data={"vout": vout, "power": power, "power_db": power_db}
-    )
-    # positive frequencies spectrum
-    pspectrum = spectrum[spectrum.index >= 0].copy()
-    # ********************************************
-    # Obtaining the ADC's output signal power
-    # ********************************************
-    # determine the span of the signal's spectrum to consider it's total dispersed power
-    span = np.max([1, int(np.floor(signal_span_factor * len(pspectrum.index)))])
-    # obtain the signal frequency bin
-    signal_bin = pspectrum["power"][
-        span:
-    ].idxmax()  # don't count DC signal when searching for the signal bin
-    # obtain the harmonics of the signal from the signal bin
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (mult * signal_bin))
-            == np.min(np.abs(pspectrum.index - (mult * signal_bin)))
-        ][0]
-        for mult in range(1, harmonics + 1)
-        if mult * signal_bin <= np.max(freq)
-    ]
-    # tones that surpass Fs are aliased back to [0, Fs/2] spectrum
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (fs - bin))
-            == np.min(np.abs(pspectrum.index - (fs - bin)))
-        ]
-        if bin > fs / 2
-        else bin
-        for bin in harmonic_bins
-    ]
-    # indexes of the harmonic bins
-    harmonic_bins_idxs = [pspectrum.index.get_loc(bin) for bin in harmonic_bins]
-    harmonics_power = np.array(
-        [
-            np.sum(
-                pspectrum["power"]
-                .iloc[harmonic_bin_idx - span : harmonic_bin_idx + span]
-                .values
+        # downsample (or resample) the signals to the sampling frequency
+        signals = sampleSignals(signals, sampling_frequency, resampling=resampling)
+        # keep the samples in the floating point type of the chosen precision
+        signals = signals.astype(floatType(precision), copy=False)
+        # ts = signals.index.values[1] - signals.index.values[0]
+        # fs = 1.0 / ts
+        n_samples = len(signals.index)
+        if noise_power > 0:
+            noise_watt = (10 ** (noise_power / 10)) * 1e-3
+            noise = np.random.normal(0, np.sqrt(noise_watt), size=n_samples)
+            signals[output_signal_name] = signals[output_signal_name] + noise.astype(
+                floatType(precision)
             )
-            for harmonic_bin_idx in harmonic_bins_idxs
-        ]
-    )
-    # obtain the signal_power
-    signal_power = harmonics_power[0]
-    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
-    signal_dc_power = np.sum(pspectrum["power"].iloc[0 : 0 + span].values)
-    DC_POWER_DB = 10 * np.log10(signal_dc_power)
+        spectrum, n_fft = signalSpectrum(
+            signals[output_signal_name].values,
+            ts,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            backend=fft_backend,
+        )
+    freq = spectrum.freq  # [Hz]
     # ********************************************
-    # Computing SFDR - Spurious Free Dynamic Range
-    #  - Obtain the power of the
-    #       strongest spurious component
-    #       of the spectrum (excluding the
-    #       DC component) and compute the SFDR.
+    # Computing the output signal power, SFDR, THD,
+    # SNR, SNDR, HD2 and HD3 from the integer bins
+    # of the one-sided spectrum
     # ********************************************
-    signal_bin_idx = harmonic_bins_idxs[0]  # get the index of the signal bin
-    spurious_spectrum = pspectrum["power"].copy()
-    # erase the signal bin from the spurious spectrum
-    spurious_spectrum.iloc[signal_bin_idx - span : signal_bin_idx + span] = np.min(
-        pspectrum["power"]
+    # determine the span of the signal's spectrum to consider it's total dispersed power
+    # (at least the mainlobe of the window)
+    span = np.max(
+        [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
     )
-    # erase the signal's DC component from the spurious spectrum
-    spurious_spectrum.iloc[0 : 0 + span] = np.min(pspectrum["power"])
-    # find the strongest spurious component
-    spur_bin = spurious_spectrum.idxmax()
-    spur_bin_idx = pspectrum.index.get_loc(spur_bin)
-    # measure the power of the strongest spurious component
-    spur_power = np.sum(
-        spurious_spectrum.iloc[spur_bin_idx - span : spur_bin_idx + span].values
+    (
+        harmonic_bins_idxs,
+        harmonics_power,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        SFDR,
+        THD,
+        SNR,
+        SNDR,
+        HD2,
+        HD3,
+    ) = spectralMetrics(
+        spectrum.power,
+        n_fft,
+        harmonics=harmonics,
+        span=span,
+        enbw=windowGains(window, n_fft)[1],
     )
-    # compute the SFDR
-    SFDR = 10 * np.log10(signal_power / spur_power)
-    # ********************************************
-    # Computing THD - Total Harmonic Distortion
-    #  - Obtain the power of each harmonic component
-    # ********************************************
-    # compute the total power of the sum of the harmonics
-    THD = np.nan
-    SNR = np.nan
-    SNDR = np.nan
-    HD2 = np.nan
-    HD3 = np.nan
-    try:
-        total_distortion_power = np.sum(harmonics_power[1:])
-        THD = 10 * np.log10(total_distortion_power / harmonics_power[0])
-        # ********************************************
-        # Computing SNR - Signal to Noise Ratio
-        #  - Obtain the noise power in the spectrum
-        # ********************************************
-        noise_power = (
-            np.sum(pspectrum["power"].values)
-            - signal_dc_power
-            - signal_power
-            - total_distortion_power
-        )
-        SNR = 10 * np.log10(signal_power / noise_power)
-        # ********************************************
-        # Computing SNDR - Signal to Noise & Distortion Ratio
-        #  - Add the noise and distortion power in
-        #     the spectrum and compare them to the
-        #     signal power
-        # ********************************************
-        SNDR = 10 * np.log10(signal_power / (noise_power + total_distortion_power))
-        # ********************************************
-        # Computing ENOB - Effective Number of Bits
-        #  - Check deterioration of the ADC's
-        #    ideal resolution because of the SNDR
-        # ********************************************
-        ENOB = (SNDR - 1.76) / 6.02
-        # ********************************************
-        # Computing HD2 and HD3 - Fractional Harmonic
-        # Distortion of Second and Third order
-        # harmonics
-        # ********************************************
-        HD2 = 10 * np.log10(harmonics_power[1] / harmonics_power[0])
-        HD3 = 10 * np.log10(harmonics_power[2] / harmonics_power[0])
-    except IndexError:
-        log.warning(
-            f"\nTried to access an harmonic that was not found in the frequency domain of the analysed spectrum.\nThis is likely due to the fact that the chosen sampling frequency is \nviolating the Nyquist Theorem in relation to the 2nd or 3rd Order Harmonics.\nTry to increase the sampling frequency."
-        )
+    signal_power = harmonics_power[0]
+    harmonic_bins = freq[harmonic_bins_idxs]
     # ********************************************
     # Computing Gain - Output Signal amplitude
     # to Input Signal amplitude ratio
@@ -731,45 +1133,25 @@ def daosDynamicEval(
     GAIN = np.nan
     GAIN_DB = np.nan
     if bool(input_signal_name):
-        if not (input_signal_name in signals.columns):
-            raise ValueError(
-                f"{input_signal_name} does not belong to the parsed signals."
-            )
-
-        vin = np.abs(
-            np.fft.fftshift(np.fft.fft(signals[input_signal_name].values) / n_samples)
-        )
-        freq_in = np.fft.fftshift(np.fft.fftfreq(len(vin), ts))  # [Hz]
-        in_power = vin * vin
-        in_power_db = np.nan_to_num(
-            10 * np.log10(in_power), nan=0.0, posinf=0.0, neginf=0.0, copy=True
-        )
-        in_spectrum = DataFrame(
-            index=freq_in,
-            data={"vin": vin, "in_power": in_power, "in_power_db": in_power_db},
-        )
-        in_pspectrum = in_spectrum[in_spectrum.index >= 0].copy()
-        in_signal_bin = in_pspectrum["in_power"][
-            0 + span :
-        ].idxmax()  # don't count DC signal when searching for the signal bin
-        # obtain the harmonics of the signal from the signal bin
-        in_harmonic_bins = [
-            mult * in_signal_bin
-            for mult in range(1, harmonics + 1)
-            if mult * signal_bin <= np.max(freq)
-        ]
-        # tones that surpass Fs are aliased back to [0, Fs/2] spectrum
-        in_harmonic_bins = [
-            fs - bin if bin > fs / 2 else bin for bin in in_harmonic_bins
-        ]
-        # indexes of the harmonic bins
-        in_harmonic_bins_idxs = [
-            pspectrum.index.get_loc(bin) for bin in in_harmonic_bins
-        ]
-        input_signal_power = np.sum(
-            in_pspectrum["in_power"]
-            .iloc[in_harmonic_bins_idxs[0] : in_harmonic_bins_idxs[0] + span]
-            .values
+        if in_spectrum is None:
+            if not (input_signal_name in signals.columns):
+                raise ValueError(
+                    f"{input_signal_name} does not belong to the parsed signals."
+                )
+            in_spectrum = signalSpectrum(
+                signals[input_signal_name].values,
+                ts,
+                precision=precision,
+                window=window,
+                segments=segments,
+                overlap=overlap,
+                backend=fft_backend,
+            )[0]
+        in_power = in_spectrum.power
+        # don't count DC signal when searching for the signal bin
+        in_signal_bin = span + int(np.argmax(in_power[span:]))
+        input_signal_power = (
+            binPower(in_power, in_signal_bin, span) / windowGains(window, n_fft)[1]
         )
         GAIN = np.sqrt(signal_power / input_signal_power)
         GAIN_DB = 20 * np.log10(GAIN)
@@ -785,52 +1167,66 @@ def daosDynamicEval(
     # between static levels
     # ********************************************
     RISETIME_90 = 0.0
-    vout = signals[output_signal_name].values
-    if wave_type in [WaveTypes.SAWTOOTH.value, WaveTypes.PULSE.value]:
-        threshold_vout = np.min(vout)
-    elif wave_type is WaveTypes.DEFAULT.value:
-        threshold_vout = np.mean(vout)
-    else:
+    if wave_type not in [elem.value for elem in WaveTypes]:
         raise ValueError(
             f"{wave_type} is not a valid wave type. Possible types are: {[elem.value for elem in WaveTypes]}."
         )
-    # comput output signal histogram
-    hist, bin_edges = np.histogram(vout)
-    hist, bin_edges = hist / sum(hist), np.array(bin_edges)
-    # through the histogram, find the discrete signal levels to be accounted for in the risetime
-    hist_filtered = hist[bin_edges[:-1] > threshold_vout]
-    signal_levels_prob = nlargest(2, hist_filtered)
-    signal_levels = (
-        bin_edges[:-1][bin_edges[:-1] > threshold_vout][
-            hist_filtered == signal_levels_prob[0]
-        ],
-        bin_edges[:-1][bin_edges[:-1] > threshold_vout][
-            hist_filtered == signal_levels_prob[1]
-        ],
-    )
-    # upper_signal_levels = sorted((signal_levels[0][0], signal_levels[1][0]))
-    signal_levels = signal_levels[0][0], signal_levels[1][0]
-    s0, s100 = sorted(signal_levels)
-    # measure all the transitions between these the signal levels found using the mean value of the signal
-    delta_v = np.diff(vout)
     if levels[0] > levels[1]:
         raise ValueError(
             f"Rise Time computation levels must be in ascending order, but levels {levels} were given."
         )
     level0 = levels[0]
     level1 = levels[1]
-    t10 = (s0 + (s100 - s0) * level0 - vout[:-1]) / delta_v
-    idx10 = np.where((t10 > 0) & (t10 < 1))[0]
-    t10 = idx10 + t10[idx10]
-    t90 = (s0 + (s100 - s0) * level1 - vout[:-1]) / delta_v
-    idx90 = np.where((t90 > 0) & (t90 < 1))[0]
-    t90 = idx90 + t90[idx90]
+    if arrays is not None:
+        # streamed output signal: its extrema and mean, its histogram and its level crossings
+        # are measured in successive passes over the blocks
+        n_samples, v_min, v_max, v_sum = 0, np.inf, -np.inf, 0.0
+        for x in arrays:
+            n_samples += len(x)
+            v_min = min(v_min, np.min(x[:, 0]))
+            v_max = max(v_max, np.max(x[:, 0]))
+            v_sum += np.sum(x[:, 0], dtype=np.float64)
+        if wave_type in [WaveTypes.SAWTOOTH.value, WaveTypes.PULSE.value]:
+            threshold_vout = v_min
+        else:
+            threshold_vout = v_sum / n_samples
+        # comput output signal histogram
+        bin_edges = np.histogram_bin_edges(np.array([v_min, v_max]))
+        hist = np.zeros(len(bin_edges) - 1)
+        for x in arrays:
+            hist += np.histogram(x[:, 0], bins=bin_edges)[0]
+        hist = hist / sum(hist)
+        # through the histogram, find the discrete signal levels to be accounted for in the risetime
+        s0, s100 = signalLevels(hist, bin_edges, threshold_vout)
+        # measure all the transitions between these the signal levels found, carrying the
+        # last sample of each block over to the next one
+        t10, t90 = [], []
+        offset, last = 0, np.empty(0)
+        for x in arrays:
+            vout = np.concatenate([last, x[:, 0]])
+            t10.append(levelCrossings(vout, s0 + (s100 - s0) * level0, offset))
+            t90.append(levelCrossings(vout, s0 + (s100 - s0) * level1, offset))
+            offset += len(vout) - 1
+            last = vout[-1:]
+        t10, t90 = np.concatenate(t10), np.concatenate(t90)
+    else:
+        vout = signals[output_signal_name].values
+        if wave_type in [WaveTypes.SAWTOOTH.value, WaveTypes.PULSE.value]:
+            threshold_vout = np.min(vout)
+        else:
+            threshold_vout = np.mean(vout)
+        # comput output signal histogram
+        hist, bin_edges = np.histogram(vout)
+        hist, bin_edges = hist / sum(hist), np.array(bin_edges)
+        # through the histogram, find the discrete signal levels to be accounted for in the risetime
+        s0, s100 = signalLevels(hist, bin_edges, threshold_vout)
+        # measure all the transitions between these the signal levels found using the mean value of the signal
+        t10 = levelCrossings(vout, s0 + (s100 - s0) * level0)
+        t90 = levelCrossings(vout, s0 + (s100 - s0) * level1)
 
     # compute all possible transition times, keep the smallest
-    idx = np.unravel_index(np.argmin(np.abs(t90[:, None] - t10)), (len(t90), len(t10)))
-    RISETIME_90 = (
-        np.abs((t90[idx[0]] - t10[idx[1]])) * ts
-    )  # finally, compute the risetime
+    t10_min, t90_min = shortestTransition(t10, t90)
+    RISETIME_90 = np.abs(t90_min - t10_min) * ts  # finally, compute the risetime
     BANDWIDTH = 1 / RISETIME_90
 
     if show_rise_time_eval:
@@ -852,9 +1248,9 @@ def daosDynamicEval(
         title(
             f"Output signal RiseTime[{level0*100:.2f}% - {level1*100:.2f}%] Evaluation"
         )
-        x = t10[idx[1]] * ts
+        x = t10_min * ts
         y = s0 + (s100 - s0) * level0
-        dx = t90[idx[0]] * ts - x
+        dx = t90_min * ts - x
         dy = s0 + (s100 - s0) * level1 - y
         # plot(t10*ts, [s0 + (s100-s0)*level0]*len(t10), 'go')
         plot(x, [y], "go")
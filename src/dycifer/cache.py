@@ -0,0 +1,329 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+from loguru import logger as log
+from pandas import DataFrame
+
+# default size limit of the signals cache (in bytes)
+DEFAULT_CACHE_SIZE = 4 * 2**30
+# number of bytes read at once to compute the content hash of a file
+HASH_BLOCK_SIZE = 2**20
+MANIFEST = "manifest.json"
+# file whose modification time records the last access to a cache entry
+ACCESS_MARKER = "last_access"
+# file held by the writer of the manifest of a cache entry
+LOCK = "manifest.lock"
+# time (in seconds) after which the lock of a cache entry is considered stale
+LOCK_TIMEOUT = 10.0
+LOCK_POLL = 0.01
+
+
+def cacheDirectory() -> str:
+    """_summary_
+    Returns the directory of the signals cache. The directory can be
+    set through the DYCIFER_CACHE_DIR environment variable.
+    Returns:
+        str: the path of the cache directory
+    """
+    return os.environ.get(
+        "DYCIFER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "dycifer"),
+    )
+
+
+def cacheSizeLimit() -> int:
+    """_summary_
+    Returns the size limit (in bytes) of the signals cache. The limit can be
+    set through the DYCIFER_CACHE_SIZE environment variable.
+    Returns:
+        int: the size limit of the cache
+    """
+    return int(os.environ.get("DYCIFER_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+
+
+def contentHash(file_path: str) -> str:
+    """_summary_
+    Computes the content hash of a file, reading all its contents
+    one block at a time (so any in-place edit changes the hash).
+    Args:
+        file_path (str): The path of the file.
+    Returns:
+        str: the hexadecimal digest of the contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as fp:
+        for block in iter(lambda: fp.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _entryDirectory(file_path: str) -> str:
+    key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+    return os.path.join(cacheDirectory(), key)
+
+
+def _columnFile(content_hash: str, column: str) -> str:
+    # named after the contents of the source file and the column, so concurrent writers
+    # of the same column write the same data, and never overwrite the data of another column
+    key = hashlib.sha1(f"{content_hash}/{column}".encode()).hexdigest()
+    return f"{key}.npy"
+
+
+@contextmanager
+def _entryLock(entry_dir: str):
+    """_summary_
+    Serializes the updates of the manifest of a cache entry among processes, through
+    a lock file created exclusively. A lock older than LOCK_TIMEOUT (left by a writer
+    that crashed) is broken.
+    Args:
+        entry_dir (str): The directory of the cache entry.
+    """
+    lock_path = os.path.join(entry_dir, LOCK)
+    start = time.monotonic()
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() - start > LOCK_TIMEOUT:
+                log.warning(
+                    f"\nBreaking the stale lock of the cache entry: {entry_dir}"
+                )
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+                start = time.monotonic()
+                continue
+            time.sleep(LOCK_POLL)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+
+def _removeFiles(entry_dir: str, file_names):
+    for file_name in file_names:
+        try:
+            os.remove(os.path.join(entry_dir, file_name))
+        except FileNotFoundError:
+            pass
+
+
+def _readManifest(entry_dir: str) -> dict:
+    try:
+        with open(os.path.join(entry_dir, MANIFEST), "r") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def _writeManifest(entry_dir: str, manifest: dict):
+    # a temporary file of its own for each writer, so concurrent writers do not race on it
+    fd, tmp_path = tempfile.mkstemp(dir=entry_dir, prefix=MANIFEST, suffix=".tmp")
+    with os.fdopen(fd, "w") as fp:
+        json.dump(manifest, fp)
+    os.replace(tmp_path, os.path.join(entry_dir, MANIFEST))
+
+
+def _touchEntry(entry_dir: str):
+    # the last access is recorded without rewriting the manifest
+    marker = os.path.join(entry_dir, ACCESS_MARKER)
+    try:
+        os.utime(marker)
+    except FileNotFoundError:
+        open(marker, "a").close()
+
+
+def _lastAccess(entry_dir: str, manifest: dict) -> float:
+    try:
+        return os.path.getmtime(os.path.join(entry_dir, ACCESS_MARKER))
+    except OSError:
+        return manifest.get("last_access", 0.0)
+
+
+def _isValid(manifest: dict, file_path: str, entry_dir: str) -> bool:
+    """_summary_
+    Checks if a cache entry still corresponds to the source file.
+    The content hash of the whole file is only recomputed when the size matches but the
+    modification time does not (e.g. the file was touched or copied): if the contents
+    are unchanged, the new modification time is written back to the manifest, so the
+    file is not hashed again on the next reads.
+    """
+    if manifest is None:
+        return False
+    stat = os.stat(file_path)
+    if manifest["size"] != stat.st_size:
+        return False
+    if manifest["mtime_ns"] == stat.st_mtime_ns:
+        return True
+    content_hash = contentHash(file_path)
+    if manifest["content_hash"] != content_hash:
+        return False
+    manifest["mtime_ns"] = stat.st_mtime_ns
+    with _entryLock(entry_dir):
+        # the manifest may have been updated by another process meanwhile
+        current = _readManifest(entry_dir)
+        if current is not None and current["content_hash"] == content_hash:
+            current["mtime_ns"] = stat.st_mtime_ns
+            _writeManifest(entry_dir, current)
+    return True
+
+
+def loadCachedSignals(file_path: str, columns: list = None) -> DataFrame:
+    """_summary_
+    Loads the signals of a file from the cache, memory-mapping each column.
+    Args:
+        file_path (str): The path of the source signals file.
+        columns (list, optional): The names of the signals to load. The time column is always loaded.
+                                    Defaults to None (load all the signals of the file).
+    Returns:
+        DataFrame: the cached signals, or None if the cache does not hold them.
+    """
+    entry_dir = _entryDirectory(file_path)
+    manifest = _readManifest(entry_dir)
+    if not _isValid(manifest, file_path, entry_dir):
+        return None
+    time_col = manifest["time_column"]
+    header = manifest["header"]
+    if columns is None:
+        if not manifest["complete"]:
+            return None
+        selected = [col for col in header if col != time_col]
+    else:
+        selected = [col for col in header if col in columns and col != time_col]
+        if len(selected) != len([col for col in columns if bool(col)]):
+            return None
+    stored = manifest["columns"]
+    if any([not (col in stored) for col in selected]) or (
+        time_col is not None and not (time_col in stored)
+    ):
+        return None
+    data = {
+        col: np.load(os.path.join(entry_dir, stored[col]), mmap_mode="r")
+        for col in selected
+    }
+    signals = DataFrame(data, columns=selected, copy=False)
+    if time_col is not None:
+        signals.index = np.load(
+            os.path.join(entry_dir, stored[time_col]), mmap_mode="r"
+        )
+        signals.index.name = time_col
+    _touchEntry(entry_dir)
+    return signals
+
+
+def storeCachedSignals(file_path: str, signals: DataFrame, header: list):
+    """_summary_
+    Stores the columns of the parsed signals of a file in the cache (one .npy file per column),
+    adding them to the columns already cached for the same (unchanged) file.
+    Concurrent writers (of the same or of other columns) do not clobber each other: each column file is
+    named after the contents of the file and the column (see _columnFile), and the manifest is re-read
+    and merged under the lock of the entry (see _entryLock).
+    Args:
+        file_path (str): The path of the source signals file.
+        signals (DataFrame): The parsed signals, indexed by the time column (if any).
+        header (list): All the column names of the source file.
+    """
+    entry_dir = _entryDirectory(file_path)
+    os.makedirs(entry_dir, exist_ok=True)
+    manifest = _readManifest(entry_dir)
+    if not _isValid(manifest, file_path, entry_dir):
+        stat = os.stat(file_path)
+        manifest = {
+            "source": os.path.abspath(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": contentHash(file_path),
+            "header": list(header),
+            "time_column": signals.index.name,
+            "columns": {},
+            "complete": False,
+            "n_bytes": 0,
+        }
+    arrays = {col: signals[col].values for col in signals.columns}
+    if bool(signals.index.name):
+        arrays[signals.index.name] = signals.index.values
+    # the column files are written outside of the lock (see _columnFile)
+    written = {}
+    for col, values in arrays.items():
+        if col in manifest["columns"] or values.dtype.kind not in "biuf":
+            continue
+        file_name = _columnFile(manifest["content_hash"], col)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, prefix=file_name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fp:
+            np.save(fp, values)
+        os.replace(tmp_path, os.path.join(entry_dir, file_name))
+        written[col] = (file_name, values.nbytes)
+    with _entryLock(entry_dir):
+        # merge the columns into the manifest as it is now, written by any other process
+        current = _readManifest(entry_dir)
+        if current is not None and current["content_hash"] != manifest["content_hash"]:
+            stat = os.stat(file_path)
+            if (current["size"], current["mtime_ns"]) == (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                # the entry was rewritten for newer contents of the file: the parsed columns are stale
+                _removeFiles(
+                    entry_dir, [file_name for file_name, _ in written.values()]
+                )
+                return
+            # the entry of previous contents of the file
+            _removeFiles(entry_dir, current["columns"].values())
+            current = None
+        if current is None:
+            current = dict(manifest, columns={}, n_bytes=0)
+        for col, (file_name, n_bytes) in written.items():
+            if col not in current["columns"]:
+                current["columns"][col] = file_name
+                current["n_bytes"] += n_bytes
+        current["complete"] = all([col in current["columns"] for col in header])
+        current["last_access"] = time.time()
+        _writeManifest(entry_dir, current)
+    _touchEntry(entry_dir)
+    evictCache(cacheSizeLimit())
+
+
+def evictCache(size_limit: int = DEFAULT_CACHE_SIZE):
+    """_summary_
+    Evicts the least recently used entries of the cache until its size fits the size limit.
+    Args:
+        size_limit (int, optional): The size limit of the cache (in bytes). Defaults to DEFAULT_CACHE_SIZE.
+    """
+    cache_dir = cacheDirectory()
+    if not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for key in os.listdir(cache_dir):
+        entry_dir = os.path.join(cache_dir, key)
+        manifest = _readManifest(entry_dir)
+        if manifest is None:
+            # entry still being written (or corrupted)
+            continue
+        entries.append(
+            (_lastAccess(entry_dir, manifest), manifest["n_bytes"], entry_dir)
+        )
+    total_size = sum([n_bytes for _, n_bytes, _ in entries])
+    for _, n_bytes, entry_dir in sorted(entries):
+        if total_size <= size_limit:
+            break
+        log.info(f"\nEvicting signals cache entry: {entry_dir}")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total_size -= n_bytes
+
+
+def clearCache():
+    """_summary_
+    Removes all the entries of the signals cache.
+    """
+    shutil.rmtree(cacheDirectory(), ignore_errors=True)
@@ -0,0 +1,138 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# order of the CIC (cascaded integrator-comb) stage: at least the order of the modulator plus one
+CIC_ORDER = 5
+# number of half-band stages following the CIC stage (each one decimating by 2)
+HALF_BAND_STAGES = 2
+# number of taps (4k + 3) and Kaiser window beta of the half-band filters:
+# passband [0, fs/8] flat within 5e-5 dB, stopband [3fs/8, fs/2] attenuated by 110 dB
+HALF_BAND_TAPS = 43
+HALF_BAND_BETA = 11.0
+
+
+def cicTaps(ratio: int, order: int = CIC_ORDER) -> np.ndarray:
+    """_summary_
+    Computes the impulse response of a CIC (cascaded integrator-comb) filter: the cascade of
+    order moving averages of ratio samples (sinc^order frequency response, with its nulls at
+    the multiples of the decimated sampling frequency), normalized to a unity DC gain.
+    Args:
+        ratio (int): The decimation ratio of the CIC filter (and its differential delay).
+        order (int, optional): The number of integrator-comb sections. Defaults to CIC_ORDER.
+    Returns:
+        np.ndarray: the order * (ratio - 1) + 1 taps of the filter.
+    """
+    taps = np.ones(1)
+    for _ in range(order):
+        taps = np.convolve(taps, np.ones(ratio))
+    return taps / ratio**order
+
+
+def halfBandTaps(
+    n_taps: int = HALF_BAND_TAPS, beta: float = HALF_BAND_BETA
+) -> np.ndarray:
+    """_summary_
+    Computes the taps of a (Kaiser windowed sinc) half-band low-pass filter, cut at a quarter of the
+    sampling frequency: every other tap (but the center tap) is null, so only half of the taps
+    are multiplied when decimating by 2.
+    Args:
+        n_taps (int, optional): The number of taps, of the form 4k + 3. Defaults to HALF_BAND_TAPS.
+        beta (float, optional): The beta of the Kaiser window. Defaults to HALF_BAND_BETA.
+    Returns:
+        np.ndarray: the taps of the filter, normalized to a unity DC gain.
+    """
+    if n_taps % 4 != 3:
+        raise ValueError(
+            f"{n_taps} is not a valid number of half-band taps. The number of taps must be of the form 4k + 3."
+        )
+    n = np.arange(n_taps) - (n_taps - 1) // 2
+    taps = 0.5 * np.sinc(n / 2) * np.kaiser(n_taps, beta)
+    # the sinc is not exactly null at its zeros in floating point
+    taps[(n % 2 == 0) & (n != 0)] = 0.0
+    return taps / np.sum(taps)
+
+
+class FirDecimator:
+    """_summary_
+    Polyphase FIR decimator of a streamed signal: only the output samples kept by the decimation
+    are computed, each one as the product of the window of its last n_taps input samples by the
+    non-null taps of the filter. The last n_taps - 1 input samples of a block are carried over to
+    the next block, so the output does not depend on how the signal is split into blocks.
+    The first output sample is computed from the first full window of the signal (no zero padding,
+    and so no start-up transient of the filter).
+    Args:
+        taps (np.ndarray): The taps of the FIR filter.
+        ratio (int): The decimation ratio.
+    """
+
+    def __init__(self, taps: np.ndarray, ratio: int):
+        self.ratio = int(ratio)
+        # y[m] = sum_j taps[j] x[m * ratio - j]: the windows are in increasing time order
+        reversed_taps = np.asarray(taps, dtype=np.float64)[::-1]
+        self.nonzero = np.flatnonzero(reversed_taps)
+        self.taps = reversed_taps[self.nonzero]
+        self.n_taps = len(reversed_taps)
+        self.history = np.zeros(0)
+        # index (in the next buffer) of the first sample of the window of the next output sample
+        self.start = 0
+
+    def decimate(self, x: np.ndarray) -> np.ndarray:
+        """_summary_
+        Filters and decimates the next block of samples of the signal.
+        Args:
+            x (np.ndarray): The next block of samples.
+        Returns:
+            np.ndarray: the output samples whose windows end within the block.
+        """
+        buffer = np.concatenate([self.history, np.asarray(x, dtype=np.float64)])
+        n_windows = len(buffer) - self.n_taps + 1
+        y = np.zeros(0)
+        if n_windows > self.start:
+            windows = sliding_window_view(buffer, self.n_taps)[self.start :: self.ratio]
+            y = windows[:, self.nonzero] @ self.taps
+            self.start += len(y) * self.ratio
+        # carry the samples of the windows of the next output samples
+        carried = min(len(buffer), self.n_taps - 1 + max(0, n_windows - self.start))
+        self.start -= len(buffer) - carried
+        self.history = buffer[len(buffer) - carried :]
+        return y
+
+
+class DecimationChain:
+    """_summary_
+    Streaming decimation chain of a (1-bit or multi-bit) sigma-delta modulator output: a CIC stage
+    decimating by osr / 2^(stages + 1), followed by stages half-band stages decimating by 2 each.
+    The decimated signal is sampled at 4 times the signal bandwidth (fs / 2osr), so the signal band
+    lies in the flat passband of the last half-band stage, and the band edge is free of aliasing.
+    Args:
+        osr (int): The oversampling ratio of the modulator (fs / 2 / bandwidth), a multiple of 2^(stages + 1).
+        stages (int, optional): The number of half-band stages. Defaults to HALF_BAND_STAGES.
+        cic_order (int, optional): The order of the CIC stage. Defaults to CIC_ORDER.
+    """
+
+    def __init__(
+        self, osr: int, stages: int = HALF_BAND_STAGES, cic_order: int = CIC_ORDER
+    ):
+        if not (int(osr) == osr and osr > 0 and osr % 2 ** (stages + 1) == 0):
+            raise ValueError(
+                f"{osr} is not a valid oversampling ratio. The oversampling ratio must be a multiple of {2 ** (stages + 1)}."
+            )
+        cic_ratio = int(osr) // 2 ** (stages + 1)
+        self.decimators = [FirDecimator(halfBandTaps(), 2) for _ in range(stages)]
+        if cic_ratio > 1:
+            self.decimators.insert(
+                0, FirDecimator(cicTaps(cic_ratio, cic_order), cic_ratio)
+            )
+        self.ratio = int(osr) // 2
+
+    def decimate(self, x: np.ndarray) -> np.ndarray:
+        """_summary_
+        Decimates the next block of samples of the modulator output through all the stages.
+        Args:
+            x (np.ndarray): The next block of samples.
+        Returns:
+            np.ndarray: the decimated samples.
+        """
+        for decimator in self.decimators:
+            x = decimator.decimate(x)
+        return x
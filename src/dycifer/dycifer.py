@@ -94,6 +94,55 @@ __cmd_args = {
             bool,
             "opt",
         ),
+        "-lin": (
+            "--linearity",
+            "Static linearity (INL/DNL) evaluation of the ADC from the code density of a sine or ramp stimulus",
+            "STIMULUS",
+            str,
+            "opt",
+        ),
+        "-bth": (
+            "--bit-threshold",
+            "Decision level of the bit signals of the ADC linearity evaluation [V]. Defaults to the average level of each bit signal",
+            "VOLTAGE",
+            float,
+            "opt",
+        ),
+        "-bw": (
+            "--bandwidth",
+            "Signal bandwidth of the Sigma Delta ADC/DAC (e.g. 1M): the in-band metrics are computed over [0, BANDWIDTH]",
+            "FREQUENCY",
+            str,
+            "opt",
+        ),
+        "-osr": (
+            "--oversampling-ratio",
+            "Oversampling ratio of the Sigma Delta ADC modulator (a multiple of 8, setting its decimation), or of the signal band of the Sigma Delta DAC output",
+            "OSR",
+            int,
+            "opt",
+        ),
+        "-os": (
+            "--output-signal",
+            "Analog output signal of the DAC",
+            "NAME",
+            str,
+            "opt",
+        ),
+        "-cds": (
+            "--code-signals",
+            "Input code signals of the DAC (one signal per bit, or a single decimal code signal), enabling the settling and glitch evaluation of each code transition",
+            "NAMES",
+            [str],
+            "opt",
+        ),
+        "-uf": (
+            "--update-frequency",
+            "Update frequency of the DAC (e.g. 100M): the spectrum is computed from the settled output of each update period",
+            "FREQUENCY",
+            str,
+            "opt",
+        ),
     },
     "-a": {
         "-daos": (
@@ -126,9 +175,9 @@ __cmd_args = {
         ),  # sampling frequency of the parsed signals is obligatory
         "-os": (
             "--output-signal",
-            "Target output signal of the analysis",
+            "Target output signal of the analysis. Several signals (or \"all\", every signal but the input signal) are evaluated at once, through a single FFT, into a table with one row per signal",
             "NAME",
-            str,
+            [str],
             "",
         ),
         "-wf": (
@@ -163,9 +212,9 @@ __cmd_args = {
     "all": {
         "-s": (
             "--signals",
-            "Path of the file containing the time-series signals to analyse",
+            "Path of the file containing the time-series signals to analyse, or the ordered paths (or glob patterns) of the segment files of a single record",
             "FILEPATH",
-            str,
+            [str],
             "",
         ),
         "-o": (
@@ -203,6 +252,118 @@ __cmd_args = {
             bool,
             "opt",
         ),
+        "-nc": (
+            "--no-cache",
+            "Parse the signals file without reading or writing the binary signals cache",
+            "",
+            bool,
+            "opt",
+        ),
+        "-cs": (
+            "--chunk-size",
+            "Stream the signals file in blocks of ROWS rows, parsing only the analysed signals",
+            "ROWS",
+            int,
+            "opt",
+        ),
+        "-rs": (
+            "--resampling",
+            "Resample the signals onto the sampling frequency grid using the METHOD interpolation (linear, cubic or hold)",
+            "METHOD",
+            str,
+            "opt",
+        ),
+        "-re": (
+            "--reader-engine",
+            "Parse CSV signals files with the ENGINE parser: pandas (default), pyarrow (multithreaded) or native (parallel pandas parser)",
+            "ENGINE",
+            str,
+            "opt",
+        ),
+        "-pr": (
+            "--precision",
+            "Floating point PRECISION of the signals and of the FFT: double (default) or single (float32 samples and complex64 FFT, half the memory)",
+            "PRECISION",
+            str,
+            "opt",
+        ),
+        "-win": (
+            "--window",
+            "WINDOW applied to the signals before the FFT, for non-coherent sampling: rectangular (default), hann, blackmanharris, kaiser[:beta] or flattop",
+            "WINDOW",
+            str,
+            "opt",
+        ),
+        "-sg": (
+            "--segments",
+            "Average the power spectra of N overlapping segments of the signals (Welch's method): bounds the FFT memory to the segment length and lowers the variance of the noise floor",
+            "N",
+            int,
+            "opt",
+        ),
+        "-ov": (
+            "--overlap",
+            "OVERLAP of consecutive averaged segments, in [0, 1) (default: 0.5)",
+            "OVERLAP",
+            float,
+            "opt",
+        ),
+        "-fb": (
+            "--fft-backend",
+            "FFT BACKEND: numpy, scipy (default, multi-threaded) or pyfftw (multi-threaded, with the plans persisted across runs). Can also be set through the DYCIFER_FFT_BACKEND environment variable",
+            "BACKEND",
+            str,
+            "opt",
+        ),
+        "-tg": (
+            "--targeted",
+            "Targeted mode: measure the signal power, THD, SNR, SNDR, HD2 and HD3 from the fundamental tone and its harmonics only (no SFDR), in a single pass over the (streamed) signals and without computing any spectrum",
+            "",
+            bool,
+            "opt",
+        ),
+        "-tf": (
+            "--tone-frequency",
+            "FREQUENCY of the fundamental tone of the targeted mode (e.g. \"1.5 M\" or 1.5e6). Defaults to the strongest tone of the signals",
+            "FREQUENCY",
+            str,
+            "opt",
+        ),
+        "-co": (
+            "--coherent",
+            "Trim the record to its longest sub-window holding an integer number of periods of the fundamental tone (see --tone-frequency), of FFT-friendly (5-smooth) length. The chosen window and its coherence error are reported with the indicators",
+            "",
+            bool,
+            "opt",
+        ),
+        "-t0": (
+            "--t-start",
+            "Start TIME of the analysis window (e.g. \"10 u\" or 1e-5): the earlier rows of the signals file are skipped before parsing",
+            "TIME",
+            str,
+            "opt",
+        ),
+        "-t1": (
+            "--t-stop",
+            "Stop TIME of the analysis window (e.g. \"20 u\" or 2e-5): the later rows of the signals file are skipped before parsing",
+            "TIME",
+            str,
+            "opt",
+        ),
+        "-n0": (
+            "--start-sample",
+            "Index of the first sample of the analysis window (instead of --t-start)",
+            "N",
+            int,
+            "opt",
+        ),
+        "-ns": (
+            "--n-samples",
+            "Number of samples of the analysis window (instead of --t-stop)",
+            "N",
+            int,
+            "opt",
+        ),
     },
 }
 
@@ -387,11 +548,15 @@ def setupParser(
                         help=arg_desc,
                     )
                 else:
+                    # arguments of type [type] accept one or more values
+                    nargs, arg_type = (
+                        ("+", arg_type[0]) if isinstance(arg_type, list) else (1, arg_type)
+                    )
                     if arg_opt in ["opt", "optional"]:
                         optional.add_argument(
                             arg,
                             arg_literal,
-                            nargs=1,
+                            nargs=nargs,
                             type=arg_type,
                             help=arg_desc,
                             metavar=arg_metavar,
@@ -400,7 +565,7 @@ def setupParser(
                         required.add_argument(
                             arg,
                             arg_literal,
-                            nargs=1,
+                            nargs=nargs,
                             type=arg_type,
                             help=arg_desc,
                             required=True,
@@ -418,11 +583,15 @@ def setupParser(
                     help=arg_desc,
                 )
             else:
+                # arguments of type [type] accept one or more values
+                nargs, arg_type = (
+                    ("+", arg_type[0]) if isinstance(arg_type, list) else (1, arg_type)
+                )
                 if arg_opt in ["opt", "optional"]:
                     optional.add_argument(
                         arg,
                         arg_literal,
-                        nargs=1,
+                        nargs=nargs,
                         type=arg_type,
                         help=arg_desc,
                         metavar=arg_metavar,
@@ -431,7 +600,7 @@ def setupParser(
                     required.add_argument(
                         arg,
                         arg_literal,
-                        nargs=1,
+                        nargs=nargs,
                         type=arg_type,
                         help=arg_desc,
                         required=True,
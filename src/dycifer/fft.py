@@ -0,0 +1,157 @@
+import os
+import atexit
+import pickle
+from importlib.util import find_spec
+import numpy as np
+from enum import Enum
+from loguru import logger as log
+from dycifer.cache import cacheDirectory
+
+# default number of threads of the multi-threaded FFT backends (-1: all the cores)
+DEFAULT_FFT_WORKERS = -1
+# planning effort of the pyFFTW plans (the plans are only measured once per length: see fftwWisdomFile)
+FFTW_PLANNER_EFFORT = "FFTW_MEASURE"
+FFTW_WISDOM = "fftw_wisdom.pickle"
+
+
+class FFTBackends(Enum):
+    """_summary_
+
+    Args:
+        NUMPY (str): numpy.fft (single threaded, complex128 transforms only)
+        SCIPY (str): scipy.fft, multi-threaded through its workers
+        PYFFTW (str): pyFFTW (FFTW3), multi-threaded, with the plans persisted in a wisdom file
+    """
+
+    NUMPY = "numpy"
+    SCIPY = "scipy"
+    PYFFTW = "pyfftw"
+
+
+_fftw_wisdom_loaded = False
+
+
+def fftBackend(backend: str = None) -> str:
+    """_summary_
+    Returns the FFT backend: the given backend, or the backend set through the DYCIFER_FFT_BACKEND
+    environment variable, or scipy (numpy if scipy is not installed).
+    Args:
+        backend (str, optional): "numpy", "scipy" or "pyfftw". Defaults to None (configured backend).
+    Returns:
+        str: the FFT backend
+    """
+    if backend is None:
+        backend = os.environ.get("DYCIFER_FFT_BACKEND", None)
+    if backend is None:
+        backend = (
+            FFTBackends.SCIPY.value
+            if find_spec("scipy") is not None
+            else FFTBackends.NUMPY.value
+        )
+    if not (backend in [elem.value for elem in FFTBackends]):
+        raise ValueError(
+            f"{backend} is not a valid FFT backend. Possible backends are: {[elem.value for elem in FFTBackends]}."
+        )
+    return backend
+
+
+def fftWorkers() -> int:
+    """_summary_
+    Returns the number of threads of the multi-threaded FFT backends. The number of threads can be
+    set through the DYCIFER_FFT_WORKERS environment variable (-1: all the cores).
+    Returns:
+        int: the number of threads
+    """
+    workers = int(os.environ.get("DYCIFER_FFT_WORKERS", DEFAULT_FFT_WORKERS))
+    return (os.cpu_count() or 1) if workers < 0 else workers
+
+
+def fftwWisdomFile() -> str:
+    """_summary_
+    Returns the path of the file persisting the pyFFTW wisdom (the measured FFTW plans), so each
+    transform length is only planned once across runs. The path can be set through the
+    DYCIFER_FFTW_WISDOM environment variable.
+    Returns:
+        str: the path of the wisdom file
+    """
+    return os.environ.get(
+        "DYCIFER_FFTW_WISDOM", os.path.join(cacheDirectory(), FFTW_WISDOM)
+    )
+
+
+def _saveFftwWisdom():
+    """_summary_
+    Persists the pyFFTW wisdom gathered by the process into the wisdom file.
+    """
+    import pyfftw
+
+    wisdom_file = fftwWisdomFile()
+    try:
+        os.makedirs(os.path.dirname(wisdom_file), exist_ok=True)
+        with open(wisdom_file, "wb") as fp:
+            pickle.dump(pyfftw.export_wisdom(), fp)
+    except OSError as e:
+        log.warning(f"\nCould not save the FFTW wisdom to {wisdom_file}: {e}")
+
+
+def _loadFftwWisdom():
+    """_summary_
+    Loads the persisted pyFFTW wisdom (once per process), enables the cache of the pyFFTW plans
+    and registers the wisdom to be saved when the process exits.
+    """
+    global _fftw_wisdom_loaded
+    if _fftw_wisdom_loaded:
+        return
+    import pyfftw
+
+    wisdom_file = fftwWisdomFile()
+    if os.path.exists(wisdom_file):
+        try:
+            with open(wisdom_file, "rb") as fp:
+                pyfftw.import_wisdom(pickle.load(fp))
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError) as e:
+            log.warning(f"\nIgnoring the unreadable FFTW wisdom of {wisdom_file}: {e}")
+    pyfftw.interfaces.cache.enable()
+    atexit.register(_saveFftwWisdom)
+    _fftw_wisdom_loaded = True
+
+
+def rfft(x: np.ndarray, backend: str = None, axis: int = 0) -> np.ndarray:
+    """_summary_
+    Computes the real input FFT of a signal through the chosen backend, in the precision of the
+    samples: complex64 for float32 samples and complex128 for float64 samples.
+    numpy.fft always computes in complex128 (the result is cast back to complex64 for float32 samples).
+    scipy.fft and pyFFTW run on fftWorkers() threads, and reuse the plans of previous transforms
+    of the same length (pyFFTW also persists them across runs: see fftwWisdomFile).
+    Args:
+        x (np.ndarray): The (float32 or float64) samples of the signal, or of several signals (one per column).
+        backend (str, optional): "numpy", "scipy" or "pyfftw". Defaults to None (see fftBackend).
+        axis (int, optional): The axis of the samples (the signals are transformed at once along it). Defaults to 0.
+    Returns:
+        np.ndarray: the n_samples // 2 + 1 non-negative frequency bins of the FFT (along the axis).
+    """
+    backend = fftBackend(backend)
+    complex_type = np.complex64 if x.dtype == np.float32 else np.complex128
+    if backend == FFTBackends.PYFFTW.value:
+        try:
+            import pyfftw
+
+            _loadFftwWisdom()
+            return pyfftw.interfaces.numpy_fft.rfft(
+                x, axis=axis, threads=fftWorkers(), planner_effort=FFTW_PLANNER_EFFORT
+            ).astype(complex_type, copy=False)
+        except ImportError:
+            log.warning(
+                "\npyFFTW is not installed: the FFT is computed through scipy.fft (pip install pyfftw)."
+            )
+            backend = FFTBackends.SCIPY.value
+    if backend == FFTBackends.SCIPY.value:
+        try:
+            from scipy import fft as sp_fft
+
+            return sp_fft.rfft(x, axis=axis, workers=fftWorkers())
+        except ImportError:
+            log.warning(
+                "\nscipy is not installed: the FFT is computed through numpy.fft, in double precision (pip install scipy)."
+            )
+    return np.fft.rfft(x, axis=axis).astype(complex_type, copy=False)
@@ -4,12 +4,53 @@ import os
 import pdb
 from loguru import logger as log
 import traceback
-from pandas import DataFrame
+from enum import Enum
+from itertools import chain, tee
+from pandas import DataFrame, concat
 import numpy as np
-from dycifer.read import readSignals
+from dycifer.read import (
+    readSignals,
+    streamSignals,
+    collectSignals,
+    analysisWindow,
+    Reiterable,
+    isReiterable,
+    countSamples,
+)
+from dycifer.resample import (
+    sampleSignals,
+    sampleBlocks,
+    resampleBlocks,
+    Interpolations,
+)
+from dycifer.spectrum import (
+    Spectrum,
+    signalSpectrum,
+    spectralMetrics,
+    floatType,
+    windowGains,
+    windowSpan,
+    estimateToneFrequency,
+    streamHarmonics,
+    harmonicMetrics,
+    coherentRecord,
+    WelchAccumulator,
+    streamWelchSpectra,
+    cumulativePower,
+    bandMetrics,
+    outOfBandMetrics,
+)
+from dycifer.decimation import DecimationChain, HALF_BAND_STAGES, CIC_ORDER
 from dycifer.utils import plotPrettyFFT
 from modelling_utils import stof, timer
 
+# number of samples of the blocks in which the bit signals are decoded
+DECODE_BLOCK_LENGTH = 2**16
+# number of samples of the segments of the averaged spectrum of a sigma-delta modulator output
+SIGMA_DELTA_SEGMENT_LENGTH = 2**16
+# number of samples of the blocks in which a sigma-delta modulator output is decimated
+SIGMA_DELTA_BLOCK_LENGTH = 2**20
+
 
 def mixedSignalsDynamicEval(subparser, *args, **kwargs):
     import warnings
@@ -27,8 +68,73 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
         log.error(traceback.format_exc())
     # from the signals argument (containing the signals file filepath)
     # extract the signals
-    signals = readSignals(argv.signals[0])
-    if argv.analog_to_digital:
+    # analysis window: the rows outside of it are skipped before parsing
+    time_range, row_range = analysisWindow(
+        t_start=argv.t_start[0] if bool(argv.t_start) else None,
+        t_stop=argv.t_stop[0] if bool(argv.t_stop) else None,
+        start_sample=argv.start_sample[0] if bool(argv.start_sample) else None,
+        n_samples=argv.n_samples[0] if bool(argv.n_samples) else None,
+    )
+    if bool(argv.chunk_size):
+        # the file is streamed again at each pass over the signals (e.g. to decode the bit signals)
+        signals = Reiterable(
+            streamSignals,
+            argv.signals,
+            chunk_size=argv.chunk_size[0],
+            use_cache=not argv.no_cache,
+            time_range=time_range,
+            row_range=row_range,
+        )
+    else:
+        signals = readSignals(
+            argv.signals,
+            use_cache=not argv.no_cache,
+            engine=argv.reader_engine[0] if bool(argv.reader_engine) else "pandas",
+            dtype=floatType(argv.precision[0]) if bool(argv.precision) else None,
+            time_range=time_range,
+            row_range=row_range,
+        )
+    if argv.analog_to_digital and bool(argv.linearity):
+        sampling_freq = stof(argv.sampling_frequency[0])
+        (
+            linearity,
+            dnl_max,
+            dnl_min,
+            inl_max,
+            inl_min,
+            missing_codes,
+        ) = adcLinearityEval(
+            signals,
+            sampling_freq,
+            n_bits=argv.bit_resolution[0] if bool(argv.bit_resolution) else -1,
+            stimulus=argv.linearity[0],
+            asceding_bit_order=argv.ascending,
+            bit_threshold=argv.bit_threshold[0] if bool(argv.bit_threshold) else None,
+            resampling=argv.resampling[0] if bool(argv.resampling) else None,
+        )
+        static_eval_indicators = DataFrame(
+            data={
+                "DNL max (LSB)": dnl_max,
+                "DNL min (LSB)": dnl_min,
+                "INL max (LSB)": inl_max,
+                "INL min (LSB)": inl_min,
+                "Missing Codes": len(missing_codes),
+                "Samples": int(linearity["counts"].sum()),
+            },
+            index=["Static Evaluation Indicators"],
+        )
+        if bool(argv.output_file) and argv.generate_table:
+            tablename = argv.output_file[0]
+            static_eval_indicators.to_csv(tablename + ".csv")
+            static_eval_indicators.to_json(tablename + ".json")
+            static_eval_indicators.to_markdown(tablename + ".md")
+            static_eval_indicators.to_latex(tablename + ".tex")
+            # the counts, DNL and INL of each code
+            linearity.to_csv(tablename + "_codes.csv")
+        # print indicators to console
+        print()
+        print(static_eval_indicators.T)
+    elif argv.analog_to_digital:
         sampling_freq = stof(
             argv.sampling_frequency[0]
         )  # convert the parsed string to a float
@@ -37,6 +143,15 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
         harmonics = argv.harmonics[0] if bool(argv.harmonics) else 7
         signal_span = argv.signal_span[0] if bool(argv.signal_span) else 0.0
         noise_power = argv.noise_power[0] if bool(argv.noise_power) else -1.0
+        resampling = argv.resampling[0] if bool(argv.resampling) else None
+        precision = argv.precision[0] if bool(argv.precision) else "double"
+        window = argv.window[0] if bool(argv.window) else "rectangular"
+        segments = argv.segments[0] if bool(argv.segments) else 1
+        overlap = argv.overlap[0] if bool(argv.overlap) else 0.5
+        fft_backend = argv.fft_backend[0] if bool(argv.fft_backend) else None
+        tone_frequency = (
+            stof(argv.tone_frequency[0]) if bool(argv.tone_frequency) else None
+        )
         # pdb.set_trace()
         # perform dynamic performance evaluation
         (
@@ -60,6 +175,15 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
             signal_span_factor=signal_span,
             asceding_bit_order=argv.ascending,
             noise_power=noise_power,
+            resampling=resampling,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            fft_backend=fft_backend,
+            targeted=argv.targeted,
+            tone_frequency=tone_frequency,
+            coherent=argv.coherent,
         )
         # prepare to plot resulting information
         dynamic_eval_indicators = DataFrame(
@@ -76,12 +200,19 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
             },
             index=["Dynamic Evaluation Indicators"],
         )
-        if argv.plot:
+        if spectrum is not None and spectrum.record is not None:
+            # report the coherent record the spectrum was computed from
+            start, length = spectrum.record
+            dynamic_eval_indicators[
+                "Coherent Record (samples)"
+            ] = f"[{start}, {start + length})"
+            dynamic_eval_indicators[
+                "Coherence Error (cycles)"
+            ] = spectrum.coherence_error
+        # (no spectrum is computed by the targeted evaluation)
+        if argv.plot and spectrum is not None:
             plotPrettyFFT(
-                spectrum[
-                    spectrum.index.values >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
+                spectrum,  # one-sided spectrum
                 title="Signal Spectrum (dB)",
                 xlabel="Frequency (GHz)",
                 ylabel="Power (dB)",
@@ -90,19 +221,121 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
                 plot_to_terminal=argv.plot_to_terminal,
                 xscale="G",
             )
+        if bool(argv.output_file):
+            if spectrum is not None:
+                plotPrettyFFT(
+                    spectrum,  # one-sided spectrum
+                    title="Signal Spectrum (dB)",
+                    xlabel="Frequency (GHz)",
+                    ylabel="Power (dB)",
+                    show=False,
+                    file_path=argv.output_file[0] + ".png",
+                    target_harmonics=target_harmonics,
+                    xscale="G",
+                )
+            if argv.generate_table:
+                tablename = argv.output_file[0]
+                dynamic_eval_indicators.to_csv(tablename + ".csv")
+                dynamic_eval_indicators.to_json(tablename + ".json")
+                dynamic_eval_indicators.to_markdown(tablename + ".md")
+                dynamic_eval_indicators.to_latex(tablename + ".tex")
+        # print indicators to console
+        print()
+        print(dynamic_eval_indicators.T)
+    elif bool(argv.digital_to_analog):
+        if not bool(argv.output_signal):
+            raise ValueError(
+                "No analog output signal of the DAC was specified. Missing --output-signal."
+            )
+        sampling_freq = stof(argv.sampling_frequency[0])
+        (
+            spectrum,
+            target_harmonics,
+            signal_power,
+            dc_power,
+            sfdr,
+            thd,
+            snr,
+            sndr,
+            enob,
+            hd2,
+            hd3,
+            transitions,
+        ) = dacDynamicEval(
+            signals,
+            sampling_freq,
+            argv.output_signal[0],
+            code_signal_names=argv.code_signals,
+            n_bits=argv.bit_resolution[0] if bool(argv.bit_resolution) else -1,
+            update_frequency=stof(argv.update_frequency[0])
+            if bool(argv.update_frequency)
+            else None,
+            harmonics=argv.harmonics[0] if bool(argv.harmonics) else 7,
+            signal_span_factor=argv.signal_span[0] if bool(argv.signal_span) else 0.0,
+            ascending_bit_order=argv.ascending,
+            resampling=argv.resampling[0] if bool(argv.resampling) else None,
+            precision=argv.precision[0] if bool(argv.precision) else "double",
+            window=argv.window[0] if bool(argv.window) else "rectangular",
+            segments=argv.segments[0] if bool(argv.segments) else 1,
+            overlap=argv.overlap[0] if bool(argv.overlap) else 0.5,
+            fft_backend=argv.fft_backend[0] if bool(argv.fft_backend) else None,
+        )
+        dynamic_eval_indicators = DataFrame(
+            data={
+                "Signal Power (dB)": signal_power,
+                "DC Power (dB)": dc_power,
+                "SFDR (dB)": sfdr,
+                "THD (dB)": thd,
+                "SNR (dB)": snr,
+                "SNDR (dB)": sndr,
+                "ENOB": enob,
+                "HD2 (dB)": hd2,
+                "HD3 (dB)": hd3,
+            },
+            index=["Dynamic Evaluation Indicators"],
+        )
+        if transitions is not None:
+            # summary of the settling and glitch metrics of the code transitions
+            major_carries = transitions[transitions["major carry"]]
+            dynamic_eval_indicators["Transitions"] = len(transitions)
+            dynamic_eval_indicators["Max Settling Time (s)"] = transitions[
+                "settling time (s)"
+            ].max()
+            dynamic_eval_indicators["Mean Settling Time (s)"] = transitions[
+                "settling time (s)"
+            ].mean()
+            dynamic_eval_indicators["Max Glitch Area (V.s)"] = (
+                transitions["glitch area (V.s)"].abs().max()
+            )
+            dynamic_eval_indicators["Major Carry Transitions"] = len(major_carries)
+            if len(major_carries) > 0:
+                dynamic_eval_indicators[
+                    "Major Carry Settling Time (s)"
+                ] = major_carries["settling time (s)"].max()
+                dynamic_eval_indicators["Major Carry Glitch Area (V.s)"] = (
+                    major_carries["glitch area (V.s)"].abs().max()
+                )
+        if argv.plot:
+            plotPrettyFFT(
+                spectrum,  # one-sided spectrum
+                title="Signal Spectrum (dB)",
+                xlabel="Frequency (MHz)",
+                ylabel="Power (dB)",
+                show=True,
+                target_harmonics=target_harmonics,
+                plot_to_terminal=argv.plot_to_terminal,
+                xscale="M",
+            )
         if bool(argv.output_file):
             plotPrettyFFT(
-                spectrum[
-                    spectrum.index >= 0
-                ].index,  # plot only positive frequencies spectrum
-                spectrum[spectrum.index.values >= 0]["power_db"],
+                spectrum,  # one-sided spectrum
                 title="Signal Spectrum (dB)",
-                xlabel="Frequency (GHz)",
+                xlabel="Frequency (MHz)",
                 ylabel="Power (dB)",
                 show=False,
                 file_path=argv.output_file[0] + ".png",
                 target_harmonics=target_harmonics,
-                xscale="G",
+                xscale="M",
             )
             if argv.generate_table:
                 tablename = argv.output_file[0]
@@ -110,15 +343,137 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
                 dynamic_eval_indicators.to_json(tablename + ".json")
                 dynamic_eval_indicators.to_markdown(tablename + ".md")
                 dynamic_eval_indicators.to_latex(tablename + ".tex")
+                if transitions is not None:
+                    # the metrics of each code transition
+                    transitions.to_csv(tablename + "_transitions.csv")
         # print indicators to console
         print()
         print(dynamic_eval_indicators.T)
-    elif bool(argv.digital_to_analog):
-        raise NotImplementedError("digital_to_analog: Not implemented yet.")
     elif bool(argv.sigma_delta_adc):
-        raise NotImplementedError("sigma_delta_adc: Not implemented yet.")
+        sampling_freq = stof(argv.sampling_frequency[0])
+        (
+            modulator_spectrum,
+            decimated_spectrum,
+            target_harmonics,
+            dynamic_eval_indicators,
+        ) = sigmaDeltaAdcDynamicEval(
+            signals,
+            sampling_freq,
+            bandwidth=stof(argv.bandwidth[0]) if bool(argv.bandwidth) else None,
+            osr=argv.oversampling_ratio[0] if bool(argv.oversampling_ratio) else None,
+            harmonics=argv.harmonics[0] if bool(argv.harmonics) else 7,
+            signal_span_factor=argv.signal_span[0] if bool(argv.signal_span) else 0.0,
+            resampling=argv.resampling[0] if bool(argv.resampling) else None,
+            precision=argv.precision[0] if bool(argv.precision) else "double",
+            window=argv.window[0] if bool(argv.window) else "kaiser",
+            overlap=argv.overlap[0] if bool(argv.overlap) else 0.5,
+            fft_backend=argv.fft_backend[0] if bool(argv.fft_backend) else None,
+        )
+        for spectrum, title, suffix in [
+            (modulator_spectrum, "Modulator Spectrum (dB)", ""),
+            (decimated_spectrum, "Decimated Spectrum (dB)", "_decimated"),
+        ]:
+            if argv.plot:
+                plotPrettyFFT(
+                    spectrum,  # one-sided spectrum
+                    title=title,
+                    xlabel="Frequency (MHz)",
+                    ylabel="Power (dB)",
+                    show=True,
+                    target_harmonics=target_harmonics,
+                    plot_to_terminal=argv.plot_to_terminal,
+                    xscale="M",
+                )
+            if bool(argv.output_file):
+                plotPrettyFFT(
+                    spectrum,  # one-sided spectrum
+                    title=title,
+                    xlabel="Frequency (MHz)",
+                    ylabel="Power (dB)",
+                    show=False,
+                    file_path=argv.output_file[0] + suffix + ".png",
+                    target_harmonics=target_harmonics,
+                    xscale="M",
+                )
+        if bool(argv.output_file) and argv.generate_table:
+            tablename = argv.output_file[0]
+            dynamic_eval_indicators.to_csv(tablename + ".csv")
+            dynamic_eval_indicators.to_json(tablename + ".json")
+            dynamic_eval_indicators.to_markdown(tablename + ".md")
+            dynamic_eval_indicators.to_latex(tablename + ".tex")
+        # print indicators to console
+        print()
+        print(dynamic_eval_indicators.T)
     elif bool(argv.sigma_delta_dac):
-        raise NotImplementedError("sigma_delta_dac: Not implemented yet.")
+        sampling_freq = stof(argv.sampling_frequency[0])
+        (
+            spectrum,
+            target_harmonics,
+            signal_power,
+            thd,
+            snr,
+            sndr,
+            enob,
+            oob_noise,
+            oob_spur,
+            spur_frequency,
+        ) = sigmaDeltaDacDynamicEval(
+            signals,
+            sampling_freq,
+            bandwidth=stof(argv.bandwidth[0]) if bool(argv.bandwidth) else None,
+            osr=argv.oversampling_ratio[0] if bool(argv.oversampling_ratio) else None,
+            harmonics=argv.harmonics[0] if bool(argv.harmonics) else 7,
+            signal_span_factor=argv.signal_span[0] if bool(argv.signal_span) else 0.0,
+            resampling=argv.resampling[0] if bool(argv.resampling) else None,
+            precision=argv.precision[0] if bool(argv.precision) else "double",
+            window=argv.window[0] if bool(argv.window) else "kaiser",
+            overlap=argv.overlap[0] if bool(argv.overlap) else 0.5,
+            fft_backend=argv.fft_backend[0] if bool(argv.fft_backend) else None,
+        )
+        dynamic_eval_indicators = DataFrame(
+            data={
+                "Signal Power (dB)": signal_power,
+                "THD (dB)": thd,
+                "SNR (dB)": snr,
+                "SNDR (dB)": sndr,
+                "ENOB": enob,
+                "Out-of-Band Noise (dBc)": oob_noise,
+                "Out-of-Band Spur (dBc)": oob_spur,
+                "Out-of-Band Spur Frequency (Hz)": spur_frequency,
+            },
+            index=["Dynamic Evaluation Indicators"],
+        )
+        if argv.plot:
+            plotPrettyFFT(
+                spectrum,  # one-sided spectrum
+                title="Signal Spectrum (dB)",
+                xlabel="Frequency (MHz)",
+                ylabel="Power (dB)",
+                show=True,
+                target_harmonics=target_harmonics,
+                plot_to_terminal=argv.plot_to_terminal,
+                xscale="M",
+            )
+        if bool(argv.output_file):
+            plotPrettyFFT(
+                spectrum,  # one-sided spectrum
+                title="Signal Spectrum (dB)",
+                xlabel="Frequency (MHz)",
+                ylabel="Power (dB)",
+                show=False,
+                file_path=argv.output_file[0] + ".png",
+                target_harmonics=target_harmonics,
+                xscale="M",
+            )
+            if argv.generate_table:
+                tablename = argv.output_file[0]
+                dynamic_eval_indicators.to_csv(tablename + ".csv")
+                dynamic_eval_indicators.to_json(tablename + ".json")
+                dynamic_eval_indicators.to_markdown(tablename + ".md")
+                dynamic_eval_indicators.to_latex(tablename + ".tex")
+        # print indicators to console
+        print()
+        print(dynamic_eval_indicators.T)
     else:
         raise ValueError(
             "No mixed-signals system class was specified was specified. Missing --analog-to-digital, --digital-to-analog, --sigma-delta-adc or --sigma-delta-dac."
@@ -127,6 +482,395 @@ def mixedSignalsDynamicEval(subparser, *args, **kwargs):
     return
 
 
+class ColumnStatistics:
+    """_summary_
+    Running count, mean, minimum and maximum of each column of a signal, updated one block
+    of samples at a time (the block means are merged into the running mean as in Welford's
+    algorithm), so streamed signals are summarized in a single pass.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, block: np.ndarray) -> "ColumnStatistics":
+        """_summary_
+        Merges a block of samples (n_samples, n_columns) into the statistics.
+        Args:
+            block (np.ndarray): The block of samples.
+        Returns:
+            ColumnStatistics: the updated statistics.
+        """
+        block = np.asarray(block)
+        block = block.reshape(len(block), -1)
+        if len(block) == 0:
+            return self
+        # the block mean is accumulated in double precision
+        mean = block.mean(axis=0, dtype=np.float64)
+        minimum = block.min(axis=0)
+        maximum = block.max(axis=0)
+        if self.count == 0:
+            self.mean, self.minimum, self.maximum = mean, minimum, maximum
+        else:
+            self.mean = self.mean + (mean - self.mean) * (
+                len(block) / (self.count + len(block))
+            )
+            self.minimum = np.minimum(self.minimum, minimum)
+            self.maximum = np.maximum(self.maximum, maximum)
+        self.count += len(block)
+        return self
+
+
+def decodeBits(
+    bits: np.ndarray, thresholds: np.ndarray = None, ascending: bool = False
+) -> np.ndarray:
+    """_summary_
+    Decodes the bit signals of a digital word into its (unsigned) decimal codes, thresholding
+    all the bit columns at once into a boolean matrix and shifting each bit column into its weight
+    of the word, at a cost proportional to the number of samples times the number of bits.
+    Args:
+        bits (np.ndarray): The bit signals (n_samples, n_bits).
+        thresholds (np.ndarray, optional): The decision level of each bit signal (n_bits,).
+                                            Defaults to None (the average value of each bit signal).
+        ascending (bool, optional): If True, the columns are in ascending bit order (the first column
+                                    is the least significant bit). Defaults to False (most significant bit first).
+    Returns:
+        np.ndarray: the decimal codes of the digital word (n_samples,).
+    """
+    bits = np.asarray(bits)
+    bits = bits.reshape(len(bits), -1)
+    n_bits = bits.shape[1]
+    if n_bits > 63:
+        raise ValueError(
+            f"{n_bits} bit signals cannot be decoded into a 64 bit integer word."
+        )
+    if thresholds is None:
+        thresholds = bits.mean(axis=0)
+    levels = bits > thresholds
+    codes = np.zeros(len(bits), dtype=np.int64)
+    for col in range(n_bits):
+        weight = col if ascending else n_bits - 1 - col
+        codes |= levels[:, col].astype(np.int64) << weight
+    return codes
+
+
+def rowBlocks(signals: DataFrame, length: int = DECODE_BLOCK_LENGTH):
+    """_summary_
+    Splits the signals into blocks of consecutive samples.
+    Args:
+        signals (DataFrame): The time series data.
+        length (int, optional): The number of samples of each block. Defaults to DECODE_BLOCK_LENGTH.
+    Yields:
+        DataFrame: the blocks of the signals.
+    """
+    for start in range(0, len(signals), length):
+        yield signals.iloc[start : start + length]
+
+
+def sampledBlocks(
+    signals: DataFrame,
+    f_sampling: float,
+    resampling: str = None,
+    length: int = DECODE_BLOCK_LENGTH,
+):
+    """_summary_
+    Brings the signals (or the streamed blocks of signals) to the sampling frequency of the analysis,
+    holding the levels between non-uniform time steps (see dycifer.resample.sampleSignals), and
+    yields them in blocks of consecutive samples.
+    Args:
+        signals (DataFrame): The time series data, or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency of the analysis.
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold"). Defaults to None.
+        length (int, optional): The number of samples of the blocks of a DataFrame. Defaults to DECODE_BLOCK_LENGTH.
+    Returns:
+        iterable: the blocks of the sampled signals, re-iterable (see dycifer.read.Reiterable) unless
+        the signals are a one-shot iterator.
+    """
+    if isinstance(signals, DataFrame):
+        return Reiterable(
+            rowBlocks,
+            sampleSignals(
+                signals,
+                f_sampling,
+                resampling=resampling,
+                fallback=Interpolations.HOLD.value,
+            ),
+            length=length,
+        )
+    blocks = Reiterable(
+        sampleBlocks,
+        signals,
+        f_sampling,
+        resampling=resampling,
+        fallback=Interpolations.HOLD.value,
+    )
+    return blocks if isReiterable(signals) else iter(blocks)
+
+
+def bitStatistics(blocks, dtype: np.dtype = None) -> ColumnStatistics:
+    """_summary_
+    Gathers the statistics of the bit signals in a pass over their (streamed) blocks.
+    Args:
+        blocks (iterable): The DataFrame blocks of the bit signals.
+        dtype (np.dtype, optional): The floating point type of the blocks. Defaults to None (as read).
+    Returns:
+        ColumnStatistics: the statistics of the bit signals.
+    """
+    statistics = ColumnStatistics()
+    for block in blocks:
+        if len(block) > 0:
+            statistics.update(np.asarray(block.values, dtype=dtype))
+    if statistics.count == 0:
+        raise ValueError("No signals were streamed.")
+    return statistics
+
+
+def decodeBlocks(
+    blocks, ascending: bool = False, dtype: np.dtype = None
+) -> tuple[DataFrame, ColumnStatistics]:
+    """_summary_
+    Decodes the bit signals of a digital word into its decimal codes, thresholding the bits at the
+    average value of each bit signal (see decodeBits), which is only known once all the blocks were read.
+    - Re-iterable blocks (a DataFrame, a list of blocks or a dycifer.read.Reiterable stream) are read in
+    two passes: the statistics of the bit signals are gathered in the first pass, and each block is
+    decoded and released in the second pass. Only one block of bit signals is held at a time, so the
+    peak memory is the decoded record (the int64 codes and the time axis: 16 bytes per sample).
+    - One-shot iterators (e.g. generators) are read once: their blocks are held (in dtype) until the
+    statistics are complete, so the peak memory is the whole record of bit signals (n_bits * itemsize
+    bytes per sample) on top of the decoded record.
+    Args:
+        blocks (iterable): The DataFrame blocks of the bit signals (indexed by the time axis),
+                            or a DataFrame (decoded in blocks of DECODE_BLOCK_LENGTH samples).
+        ascending (bool, optional): If True, the columns are in ascending bit order. Defaults to False.
+        dtype (np.dtype, optional): The floating point type of the blocks. Defaults to None (as read).
+    Returns:
+        tuple(DataFrame, ColumnStatistics):
+            DataFrame: the decimal codes ("dec_word"), indexed by the time axis.
+            ColumnStatistics: the statistics of the bit signals.
+    """
+    if isinstance(blocks, DataFrame):
+        blocks = Reiterable(rowBlocks, blocks)
+    if not isReiterable(blocks):
+        # hold the blocks of a one-shot iterator until the statistics are complete
+        blocks = [
+            block if dtype is None else block.astype(dtype, copy=False)
+            for block in blocks
+        ]
+    statistics = bitStatistics(blocks, dtype=dtype)
+    codes = np.empty(statistics.count, dtype=np.int64)
+    index = np.empty(statistics.count, dtype=np.float64)
+    index_name = None
+    start = 0
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        codes[start : start + len(block)] = decodeBits(
+            np.asarray(block.values, dtype=dtype),
+            thresholds=statistics.mean,
+            ascending=ascending,
+        )
+        index[start : start + len(block)] = block.index.values
+        index_name = block.index.name
+        start += len(block)
+    dout = DataFrame({"dec_word": codes}, index=index)
+    dout.index.name = index_name
+    return dout, statistics
+
+
+def decodedWords(
+    blocks,
+    statistics: ColumnStatistics,
+    ascending: bool = False,
+    dtype: np.dtype = None,
+):
+    """_summary_
+    Decodes the blocks of the bit signals of a digital word one at a time, thresholding the bits
+    at the average value of each bit signal gathered beforehand (see bitStatistics and decodeBits).
+    Args:
+        blocks (iterable): The DataFrame blocks of the bit signals.
+        statistics (ColumnStatistics): The statistics of the bit signals.
+        ascending (bool, optional): If True, the columns are in ascending bit order. Defaults to False.
+        dtype (np.dtype, optional): The floating point type of the blocks. Defaults to None (as read).
+    Yields:
+        np.ndarray: the decimal codes of each block.
+    """
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        yield decodeBits(
+            np.asarray(block.values, dtype=dtype),
+            thresholds=statistics.mean,
+            ascending=ascending,
+        )
+
+
+def wordBlocks(blocks):
+    """_summary_
+    Extracts the constructed digital output word from the blocks of the signals of an ADC.
+    Args:
+        blocks (iterable): The DataFrame blocks of the digital output word.
+    Yields:
+        np.ndarray: the decimal codes of each block.
+    """
+    for block in blocks:
+        if len(block.columns) > 1:
+            raise ValueError(
+                f"The number of bits was provided as input, but the signals data frame does not present the constructed digital output word of the ADC. Expected {1} signal, found {len(block.columns)} signals."
+            )
+        yield block.values[:, 0]
+
+
+def outputWords(
+    words,
+    resolution: int,
+    vsource: float,
+    noise_power: float = -1.0,
+    dtype: np.dtype = None,
+):
+    """_summary_
+    Scales the blocks of decimal codes of an ADC into its output signal, recentered in 0 and
+    spanning [-vsource; +vsource], adding the artificial noise.
+    Args:
+        words (iterable): The blocks of decimal codes.
+        resolution (int): The number of bits of the ADC.
+        vsource (float): The voltage of the source of the ADC.
+        noise_power (float, optional): The noise power (in dBm) added to the output signal. Defaults to -1.0 (none).
+        dtype (np.dtype, optional): The floating point type of the output signal. Defaults to None (float64).
+    Yields:
+        np.ndarray: the output signal of each block.
+    """
+    for word in words:
+        vout = word / (2**resolution - 1) * 2 - 1.0
+        vout = vout * vsource
+        if noise_power > 0:
+            noise_watt = (10 ** (noise_power / 10)) * 1e-3
+            vout = vout + np.random.normal(0, np.sqrt(noise_watt), size=len(vout))
+        yield vout.astype(dtype, copy=False)
+
+
+class Stimuli(Enum):
+    """_summary_
+
+    Args:
+        SINE (str): Sine wave stimulus (arcsine code density)
+        RAMP (str): Ramp (or triangle wave) stimulus (uniform code density)
+    """
+
+    SINE = "sine"
+    RAMP = "ramp"
+
+
+def codeHistogram(code_blocks, n_codes: int) -> np.ndarray:
+    """_summary_
+    Accumulates the number of hits of each code of a converter over (streamed) blocks of codes,
+    so only the histogram (and not the codes) is held in memory.
+    Args:
+        code_blocks (iterable): The blocks of (integer) codes.
+        n_codes (int): The number of codes of the converter (2^n_bits).
+    Returns:
+        np.ndarray: the number of hits of each code (n_codes,).
+    """
+    counts = np.zeros(n_codes, dtype=np.int64)
+    for codes in code_blocks:
+        if len(codes) == 0:
+            continue
+        if codes.min() < 0 or codes.max() >= n_codes:
+            raise ValueError(
+                f"Codes outside of the range of the converter [0, {n_codes - 1}] were found: [{codes.min()}, {codes.max()}]."
+            )
+        counts += np.bincount(codes, minlength=n_codes)
+    return counts
+
+
+def codeDensity(
+    counts: np.ndarray, stimulus: str = "sine"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """_summary_
+    Code density (histogram) test of the static linearity of a converter (IEEE Std 1241).
+    The transition levels of the converter are recovered from the cumulative histogram of the codes:
+    linearly for a ramp stimulus, and through the inverse of the cumulative distribution of a
+    sine wave (the arcsine correction, -cos(pi * H)) for a sine stimulus. The amplitude and the offset
+    of the stimulus cancel out, as the levels are normalized to the average code width (endpoint fit).
+    The stimulus must slightly overdrive the converter, so that the end codes (which collect the
+    overrange) are hit and every transition level is exercised.
+    Args:
+        counts (np.ndarray): The number of hits of each code (see codeHistogram).
+        stimulus (str, optional): "sine" or "ramp". Defaults to "sine".
+    Returns:
+        tuple(np.ndarray, np.ndarray, np.ndarray):
+            np.ndarray: the (normalized) transition levels between consecutive codes (n_codes - 1,)
+            np.ndarray: the Differential Non-Linearity of each code, in LSB (nan for the end codes)
+            np.ndarray: the Integral Non-Linearity of each code, in LSB (nan for the first code)
+    """
+    if not (stimulus in [elem.value for elem in Stimuli]):
+        raise ValueError(
+            f"{stimulus} is not a valid stimulus. Possible stimuli are: {[elem.value for elem in Stimuli]}."
+        )
+    n_codes = len(counts)
+    if n_codes < 3:
+        raise ValueError("At least 3 codes are required by the code density test.")
+    if counts[0] == 0 or counts[-1] == 0:
+        log.warning(
+            "\nThe end codes of the converter were not hit: the stimulus does not overdrive the converter, and the outer transition levels are not measured."
+        )
+    # fraction of the samples below each transition level
+    cumulative = np.cumsum(counts[:-1]) / np.sum(counts)
+    if stimulus == Stimuli.SINE.value:
+        transitions = -np.cos(np.pi * cumulative)
+    else:
+        transitions = cumulative
+    # average code width (least significant bit) of the inner codes
+    lsb = (transitions[-1] - transitions[0]) / (n_codes - 2)
+    dnl = np.full(n_codes, np.nan)
+    dnl[1:-1] = np.diff(transitions) / lsb - 1.0
+    inl = np.full(n_codes, np.nan)
+    inl[1:] = (transitions - transitions[0]) / lsb - np.arange(n_codes - 1)
+    return transitions, dnl, inl
+
+
+def adcTargetedEval(
+    vout_blocks, fs: float, tone_frequency: float = None, harmonics: int = 7
+) -> tuple:
+    """_summary_
+    Targeted dynamic performance evaluation of an ADC: its output signal is only measured at the fundamental
+    tone and its harmonics (see dycifer.spectrum.streamHarmonics), in a single pass over its blocks.
+    Args:
+        vout_blocks (iterable): The blocks of the output signal of the ADC.
+        fs (float): The sampling frequency [Hz].
+        tone_frequency (float, optional): The frequency of the fundamental tone [Hz]. Defaults to None (estimated).
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+    Returns:
+        tuple: the results of adcDynamicEval, without the spectrum and the SFDR.
+    """
+    (
+        tone_frequency,
+        harmonic_bins,
+        harmonics_power,
+        dc_power,
+        residual_power,
+    ) = streamHarmonics(vout_blocks, fs, tone_frequency, harmonics=harmonics)
+    SIGNAL_POWER_DB, DC_POWER_DB, THD, SNR, SNDR, HD2, HD3 = harmonicMetrics(
+        harmonics_power[:, 0], dc_power[0], residual_power[0]
+    )
+    ENOB = (SNDR - 1.76) / 6.02
+    target_harmonics = list(zip(harmonic_bins, 10 * np.log10(harmonics_power[:, 0])))
+    return (
+        None,
+        target_harmonics,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        np.nan,
+        THD,
+        SNR,
+        SNDR,
+        ENOB,
+        HD2,
+        HD3,
+    )
+
+
 @timer
 def adcDynamicEval(
     signals: DataFrame,
@@ -137,12 +881,22 @@ def adcDynamicEval(
     signal_span_factor: float = 0.0,
     asceding_bit_order: bool = False,
     noise_power: float = -1.0,
-) -> tuple[DataFrame, float, float, float, float, float, float, float]:
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+    targeted: bool = False,
+    tone_frequency: float = None,
+    coherent: bool = False,
+) -> tuple[Spectrum, float, float, float, float, float, float, float]:
     print("\nPerforming Dynamic performance evaluation of ADC...")
     """_summary_
     Dynamic performance evaluation of Analog-to-Digital Converter circuits
     Args:
-        signals (DataFrame): The signals corresponding to each of the bits generated by the ADC to be analysed.
+        signals (DataFrame): The signals corresponding to each of the bits generated by the ADC to be analysed,
+                            or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
         NOTE: signals can either be:
             - dataframe with index = time axis, and columns = digital word (in decimal, from 0 to 2^n_bits-1)
             - dataframe with index = time axis, and columns = rectangular signals corresponding to each bit of the digital word
@@ -156,9 +910,32 @@ def adcDynamicEval(
         ascending_bit_order (bool, optional): When parsing bit signals (and not output word), indicate if the columns of each bit (in the signals dataframe)
                                                 are in ascending or descending order. Defaults to False.
         noise_power (float, optional):Artificially added noise power (in dBm) to the signal. Defaults to -1.0
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+                                    the sampling frequency grid. Defaults to None (hold, and only for non-uniform time steps).
+        precision (str, optional): "double" (float64 samples and complex128 FFT) or "single" (float32 samples and
+                                    complex64 FFT, halving the memory at the cost of the accuracy documented in docs/precision.md).
+                                    Defaults to "double".
+        window (str, optional): The window applied to the output word before the FFT ("rectangular", "hann", "blackmanharris",
+                                "kaiser[:beta]" or "flattop"), for non-coherently sampled signals. The powers are corrected for the
+                                coherent gain and the equivalent noise bandwidth of the window. Defaults to "rectangular".
+        segments (int, optional): The number of overlapping segments of the output word whose power spectra are averaged
+                                (Welch's method), bounding the FFT memory to the segment length and lowering the variance
+                                of the noise floor. Defaults to 1.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend ("numpy", "scipy" or "pyfftw", see dycifer.fft.fftBackend).
+        Defaults to None (the DYCIFER_FFT_BACKEND environment variable, or scipy).
+        targeted (bool, optional): Measure the output word at the fundamental tone and its harmonics only (see
+                                dycifer.spectrum.targetedMetrics), without any spectrum: neither the spectrum nor
+                                the SFDR are returned. Re-iterable streamed signals are decoded and measured one
+                                block at a time. Defaults to False.
+        tone_frequency (float, optional): The frequency of the fundamental tone of the targeted mode and of the
+                                coherent record [Hz]. Defaults to None (estimated from the output word).
+        coherent (bool, optional): Trim the output word to its longest coherent record of FFT-friendly (5-smooth)
+                                length (see dycifer.spectrum.coherentRecord), reported through the record and
+                                coherence_error of the spectrum. Defaults to False.
     Returns:
         tuple(DataFrame, float(1), float(2), float(3), float(4), float(5), float(6), float(7)):
-            DataFrame: The frequency spectrum of the ADC's output signal in volt, volt squared (power) and decibels.
+            Spectrum: The frequency spectrum of the ADC's output signal (see dycifer.spectrum.Spectrum).
             float(1): Signal's power in decibels
             float(2): Signal's DC power
             float(3): Spurious Free Dynamic Range metric
@@ -171,101 +948,134 @@ def adcDynamicEval(
     # extract the sampling frequency from the function inputs
     ts = 1.0 / f_sampling
     fs = f_sampling
-    downsampling = 1
-    if bool(signals.index.name):
-        downsampling = int(
-            round(
-                (1.0 / f_sampling) / (signals.index.values[1] - signals.index.values[0])
-            )
-        )
-        if downsampling < 1:
-            raise ValueError(
-                "Sampling time period must be equal or higher than the signals' time resolution."
-            )
-    else:
-        # in case there is no time axis frame
-        # automatically generate one from the sampling frequency
-        t = np.arange(0, len(signals) * ts, ts)
-        signals.set_index(t, inplace=True)
-
-    # downsample the signals to the sampling frequency effectively parsed as input
-    signals = signals[::downsampling]
     """
     * ***********************************************************************************
     * * If the resolution of the ADC was parsed as input, it is assumed that the signals
     * * data frame already contains the constructed dout decimal words.
+    * * Otherwise, the Dout signal is decoded from the signals of each bit.
     * ***********************************************************************************
     """
-    if n_bits > 0 and len(signals.columns) > 1:
-        raise ValueError(
-            f"The number of bits was provided as input, but the signals data frame does not present the constructed digital output word of the ADC. Expected {1} signal, found {len(signals.columns)} signals."
+    streamed = not isinstance(signals, DataFrame) and isReiterable(signals)
+    if streamed and (targeted or (segments > 1 and not coherent)):
+        # targeted metrics or averaged spectrum of re-iterable streamed blocks: the output word is
+        # decoded and scaled one block at a time, and only the segments being accumulated are held
+        blocks = sampledBlocks(signals, f_sampling, resampling=resampling)
+        if n_bits < 0:
+            # the bits are thresholded at the average value of each bit signal, gathered in a first pass
+            statistics = bitStatistics(blocks, dtype=floatType(precision))
+            resolution = len(statistics.mean)
+            vsource = float(statistics.maximum.max() + statistics.minimum.min())
+            words = decodedWords(
+                blocks,
+                statistics,
+                ascending=asceding_bit_order,
+                dtype=floatType(precision),
+            )
+        else:
+            resolution = n_bits
+            vsource = v_source
+            words = wordBlocks(blocks)
+        vout = outputWords(
+            words, resolution, vsource, noise_power, dtype=floatType(precision)
         )
-    # extract the number of bits of the ADC
-    resolution = n_bits if n_bits > 0 else len(signals.columns)
-    # v_step = v_source / ((2 ** resolution)-1)
-
-    """
-    * ***********************************************************************************
-    * * Compute the Dout signal if no resolution is provided as input, otherwise
-    * * the Dout signal is already available in the signals DataFrame in the required format
-    * ***********************************************************************************
-    """
-    # compute the Dout signal for each row of the signals DataFrame
-    dout = signals[signals.columns].copy()
-    vsource = v_source
-    if n_bits < 0:
-        # find the average value for the signals
-        means = {}
-        maxis = []
-        minies = []
-        for col in signals.columns:
-            means[col] = signals[col].mean()
-            maxis.append(signals[col].max())
-            minies.append(signals[col].min())
-
-        vsource = max(maxis) + min(minies)
-
-        for col in dout.columns:
-            dout[col][dout[col] <= means[col]] = 0
-            dout[col][dout[col] > means[col]] = 1
-
-        def join_bits(row):
-            if not asceding_bit_order:
-                return "".join(map(lambda b: str(int(b)), row.values))
-            else:
-                return "".join(map(lambda b: str(int(b))), np.flipud(row.values))
-
-        dout["bin_word"] = dout.apply(join_bits, axis=1)
-        dout["dec_word"] = dout["bin_word"].apply(lambda bin: int(bin, 2))
-        # recenter the decoded word in 0 and scale it to [-1; +1]
-        dout["vout"] = dout["dec_word"] / (2**resolution - 1) * 2 - 1.0
-        dout["vout"] = dout["vout"] * vsource
+        if targeted:
+            if tone_frequency is None:
+                log.warning(
+                    "\nNo tone frequency given: the fundamental tone is located from the first samples of the streamed signals (see --tone-frequency)."
+                )
+            return adcTargetedEval(vout, fs, tone_frequency, harmonics)
+        spectra, n_fft = streamWelchSpectra(
+            vout,
+            statistics.count if n_bits < 0 else countSamples(blocks),
+            ts,
+            segments,
+            overlap=overlap,
+            precision=precision,
+            window=window,
+            backend=fft_backend,
+        )
+        spectrum = spectra[0]
+        record = None
+        coherence_error = np.nan
     else:
-        dout["vout"] = dout[dout.columns] / (2**resolution - 1) * 2 - 1.0
-        dout["vout"] = dout["vout"] * vsource
-    if noise_power > 0:
-        noise_watt = (10 ** (noise_power / 10)) * 1e-3
-        dout["vout"] = dout["vout"] + np.random.normal(
-            0, np.sqrt(noise_watt), size=len(dout)
-        )
-    dout = dout["vout"]
-    n_samples = len(dout)
-    """
-    * ***********************************************************************************
-    * * Fast Fourier Transform (FFT) of the Dout Signal
-    * ***********************************************************************************
-    """
-    vout = np.abs(np.fft.fftshift(np.fft.fft(dout.values) / n_samples))  # [V]
-    freq = np.fft.fftshift(np.fft.fftfreq(n_samples, ts))  # [Hz]
-    power = (
-        vout * vout
-    )  # [V^2] - square the voltage spectrum to obtain the power spectrum
-    power_db = 10 * np.log10(power)  # [dB] - convert the power spectrum to dB
-    spectrum = DataFrame(
-        index=freq, data={"vout": vout, "power": power, "power_db": power_db}
-    )
-    # positive frequencies spectrum
-    pspectrum = spectrum[spectrum.index >= 0].copy()
+        if n_bits < 0:
+            # downsample (or resample) the bit signals to the sampling frequency effectively parsed as input
+            # (the digital levels of the ADC are held between non-uniform time steps)
+            blocks = sampledBlocks(signals, f_sampling, resampling=resampling)
+            # the statistics of the bit signals are gathered in a first pass over the (streamed) blocks,
+            # and the bits are thresholded at the average value of each bit signal in a second pass
+            dout, statistics = decodeBlocks(
+                blocks, ascending=asceding_bit_order, dtype=floatType(precision)
+            )
+            # extract the number of bits of the ADC
+            resolution = len(statistics.mean)
+            vsource = float(statistics.maximum.max() + statistics.minimum.min())
+            # recenter the decoded word in 0 and scale it to [-1; +1]
+            dout["vout"] = dout["dec_word"] / (2**resolution - 1) * 2 - 1.0
+            dout["vout"] = dout["vout"] * vsource
+        else:
+            if not isinstance(signals, DataFrame):
+                # streamed blocks of signals: gather the word signal
+                if bool(resampling):
+                    signals = resampleBlocks(signals, f_sampling, method=resampling)
+                signals = collectSignals(signals, dtype=floatType(precision))
+            # downsample (or resample) the signals to the sampling frequency effectively parsed as input
+            signals = sampleSignals(
+                signals,
+                f_sampling,
+                resampling=resampling,
+                fallback=Interpolations.HOLD.value,
+            )
+            if len(signals.columns) > 1:
+                raise ValueError(
+                    f"The number of bits was provided as input, but the signals data frame does not present the constructed digital output word of the ADC. Expected {1} signal, found {len(signals.columns)} signals."
+                )
+            resolution = n_bits
+            vsource = v_source
+            dout = signals[signals.columns].copy()
+            dout["vout"] = dout[dout.columns] / (2**resolution - 1) * 2 - 1.0
+            dout["vout"] = dout["vout"] * vsource
+        if noise_power > 0:
+            noise_watt = (10 ** (noise_power / 10)) * 1e-3
+            dout["vout"] = dout["vout"] + np.random.normal(
+                0, np.sqrt(noise_watt), size=len(dout)
+            )
+        # keep the output word in the floating point type of the chosen precision
+        dout = dout["vout"].astype(floatType(precision), copy=False)
+        if targeted:
+            # measure the output word at the fundamental tone and its harmonics only
+            if tone_frequency is None:
+                tone_frequency = estimateToneFrequency(dout.values, fs)
+            return adcTargetedEval([dout.values], fs, tone_frequency, harmonics)
+        record = None
+        coherence_error = np.nan
+        if coherent:
+            # trim the output word to a coherent record of FFT-friendly length
+            start, length, cycles, coherence_error = coherentRecord(
+                dout.values, fs, tone_frequency=tone_frequency
+            )
+            log.info(
+                f"\nCoherent record: samples [{start}, {start + length}) holding {cycles:.4f} periods of the fundamental tone (coherence error: {coherence_error:.2e} cycles)."
+            )
+            dout = dout.iloc[start : start + length]
+            record = (start, length)
+        """
+        * ***********************************************************************************
+        * * Fast Fourier Transform (FFT) of the Dout Signal
+        * ***********************************************************************************
+        """
+        spectrum, n_fft = signalSpectrum(
+            dout.values,
+            ts,
+            precision=precision,
+            window=window,
+            segments=segments,
+            overlap=overlap,
+            backend=fft_backend,
+        )
+    spectrum.record = record
+    spectrum.coherence_error = coherence_error
+    freq = spectrum.freq  # [Hz]
     """
     * ***********************************************************************************
     * * Computation of :
@@ -274,129 +1084,45 @@ def adcDynamicEval(
     * * SNR - Signal to Noise Ratio
     * * SNDR - Signal to Noise and Distortion Ratio
     * * ENOB - Effective Number Of Bits
-    * * INL - Integral Non-Linearity (TODO)
-    * * DFL - Differential Non-Linearity (TODO)
+    * * (INL - Integral Non-Linearity and DNL - Differential Non-Linearity are
+    * * evaluated from the code density of the ADC, see adcLinearityEval)
     * ***********************************************************************************
     """
     # ********************************************
-    # Obtaining the ADC's output signal power
+    # Computing the output signal power, SFDR, THD,
+    # SNR, SNDR, HD2 and HD3 from the integer bins
+    # of the one-sided spectrum
     # ********************************************
     # determine the span of the signal's spectrum to consider it's total dispersed power
-    span = np.max([1, int(np.floor(signal_span_factor * len(pspectrum.index)))])
-    # obtain the signal frequency bin
-    signal_bin = pspectrum["power"][
-        0 + span :
-    ].idxmax()  # don't count DC signal when searching for the signal bin
-    # obtain the harmonics of the signal from the signal bin
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (mult * signal_bin))
-            == np.min(np.abs(pspectrum.index - (mult * signal_bin)))
-        ][0]
-        for mult in range(1, harmonics + 1)
-        if mult * signal_bin <= np.max(freq)
-    ]
-    # tones that surpass Fs are aliased back to [0, Fs/2] spectrum
-    harmonic_bins = [
-        pspectrum.index[
-            np.abs(pspectrum.index - (fs - bin))
-            == np.min(np.abs(pspectrum.index - (fs - bin)))
-        ][0]
-        if bin > fs / 2
-        else bin
-        for bin in harmonic_bins
-    ]
-    # indexes of the harmonic bins
-    harmonic_bins_idxs = [pspectrum.index.get_loc(bin) for bin in harmonic_bins]
-    harmonics_power = np.array(
-        [
-            np.sum(
-                pspectrum["power"]
-                .iloc[harmonic_bin_idx - span : harmonic_bin_idx + span]
-                .values
-            )
-            for harmonic_bin_idx in harmonic_bins_idxs
-        ]
-    )
-    # obtain the signal_power
-
-    signal_power = harmonics_power[0]
-    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
-    signal_dc_power = np.sum(pspectrum["power"].iloc[0 : 0 + span].values)
-    DC_POWER_DB = 10 * np.log10(signal_dc_power)
-    # ********************************************
-    # Computing SFDR - Spurious Free Dynamic Range
-    #  - Obtain the power of the
-    #       strongest spurious component
-    #       of the spectrum (excluding the
-    #       DC component) and compute the SFDR.
-    # ********************************************
-    signal_bin_idx = harmonic_bins_idxs[0]  # get the index of the signal bin
-    spurious_spectrum = pspectrum["power"].copy()
-    # erase the signal bin from the spurious spectrum
-    spurious_spectrum.iloc[signal_bin_idx - span : signal_bin_idx + span] = np.min(
-        pspectrum["power"]
+    # (at least the mainlobe of the window)
+    span = np.max(
+        [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
     )
-    # erase the signal's DC component from the spurious spectrum
-    spurious_spectrum.iloc[0 : 0 + span] = np.min(pspectrum["power"])
-    # find the strongest spurious component
-    spur_bin = spurious_spectrum.idxmax()
-    spur_bin_idx = pspectrum.index.get_loc(spur_bin)
-    # measure the power of the strongest spurious component
-    spur_power = np.sum(
-        spurious_spectrum.iloc[spur_bin_idx - span : spur_bin_idx + span].values
+    (
+        harmonic_bins_idxs,
+        harmonics_power,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        SFDR,
+        THD,
+        SNR,
+        SNDR,
+        HD2,
+        HD3,
+    ) = spectralMetrics(
+        spectrum.power,
+        n_fft,
+        harmonics=harmonics,
+        span=span,
+        enbw=windowGains(window, n_fft)[1],
     )
-    # compute the SFDR
-    SFDR = 10 * np.log10(signal_power / spur_power)
+    harmonic_bins = freq[harmonic_bins_idxs]
     # ********************************************
-    # Computing THD - Total Harmonic Distortion
-    #  - Obtain the power of each harmonic component
+    # Computing ENOB - Effective Number of Bits
+    #  - Check deterioration of the ADC's
+    #    ideal resolution because of the SNDR
     # ********************************************
-    # compute the total power of the sum of the harmonics
-    THD = np.nan
-    SNR = np.nan
-    SNDR = np.nan
-    ENOB = np.nan
-    HD2 = np.nan
-    HD3 = np.nan
-    try:
-        total_distortion_power = np.sum(harmonics_power[1:])
-        THD = 10 * np.log10(total_distortion_power / harmonics_power[0])
-        # ********************************************
-        # Computing SNR - Signal to Noise Ratio
-        #  - Obtain the noise power in the spectrum
-        # ********************************************
-        noise_power = (
-            np.sum(pspectrum["power"].values)
-            - signal_dc_power
-            - signal_power
-            - total_distortion_power
-        )
-        SNR = 10 * np.log10(signal_power / noise_power)
-        # ********************************************
-        # Computing SNDR - Signal to Noise & Distortion Ratio
-        #  - Add the noise and distortion power in
-        #     the spectrum and compare them to the
-        #     signal power
-        # ********************************************
-        SNDR = 10 * np.log10(signal_power / (noise_power + total_distortion_power))
-        # ********************************************
-        # Computing ENOB - Effective Number of Bits
-        #  - Check deterioration of the ADC's
-        #    ideal resolution because of the SNDR
-        # ********************************************
-        ENOB = (SNDR - 1.76) / 6.02
-        # ********************************************
-        # Computing HD2 and HD3 - Fractional Harmonic
-        # Distortion of Second and Third order
-        # harmonics
-        # ********************************************
-        HD2 = 10 * np.log10(harmonics_power[1] / harmonics_power[0])
-        HD3 = 10 * np.log10(harmonics_power[2] / harmonics_power[0])
-    except IndexError:
-        log.warning(
-            f"\nTried to access an harmonic that was not found in the frequency domain of the analysed spectrum.\nThis is likely due to the fact that the chosen sampling frequency is \nviolating the Nyquist Theorem in relation to the 2nd or 3rd Order Harmonics.\nTry to increase the sampling frequency."
-        )
+    ENOB = (SNDR - 1.76) / 6.02
     target_harmonics = list(zip(harmonic_bins, 10 * np.log10(harmonics_power)))
     return (
         spectrum,
@@ -413,26 +1139,829 @@ def adcDynamicEval(
     )
 
 
-def dacDynamicEval(subparser, *args, **kwargs):
+@timer
+def adcLinearityEval(
+    signals: DataFrame,
+    f_sampling: float,
+    n_bits: int = -1,
+    stimulus: str = "sine",
+    asceding_bit_order: bool = False,
+    bit_threshold: float = None,
+    resampling: str = None,
+) -> tuple[DataFrame, float, float, float, float, np.ndarray]:
+    print("\nPerforming Static linearity evaluation of ADC...")
+    """_summary_
+    Static linearity (INL and DNL) evaluation of Analog-to-Digital Converter circuits, through the
+    code density (histogram) test of a sine wave or ramp stimulus (see codeDensity). The hits of each
+    code are counted block by block, so long (streamed) records are evaluated in a memory bounded by
+    the number of codes.
+    Args:
+        signals (DataFrame): The signals corresponding to each of the bits generated by the ADC, or to its output word
+                            (in decimal, from 0 to 2^n_bits-1), or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency (in Hertz (Hz)) of the ADC.
+        n_bits (int, optional): The number of bits (resolution) of the ADC, when the signals hold its output word. Defaults to -1.
+        stimulus (str, optional): The stimulus of the ADC, "sine" or "ramp". Defaults to "sine".
+        ascending_bit_order (bool, optional): When parsing bit signals (and not output word), indicate if the columns of each bit
+                                                are in ascending or descending order. Defaults to False.
+        bit_threshold (float, optional): The decision level of the bit signals [V]. Defaults to None (the average value of each
+                                        bit signal, gathered in a first pass over the signals: see decodeBlocks).
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+                                    the sampling frequency grid. Defaults to None (hold, and only for non-uniform time steps).
+    Returns:
+        tuple(DataFrame, float(1), float(2), float(3), float(4), np.ndarray):
+            DataFrame: The number of hits ("counts"), DNL ("dnl") and INL ("inl") of each code of the ADC, indexed by the code.
+            float(1): Maximum Differential Non-Linearity (LSB)
+            float(2): Minimum Differential Non-Linearity (LSB)
+            float(3): Maximum Integral Non-Linearity (LSB)
+            float(4): Minimum Integral Non-Linearity (LSB)
+            np.ndarray: The missing codes (inner codes without any hit)
+    """
+    if not (stimulus in [elem.value for elem in Stimuli]):
+        raise ValueError(
+            f"{stimulus} is not a valid stimulus. Possible stimuli are: {[elem.value for elem in Stimuli]}."
+        )
+    # bring the signals to the sampling frequency of the ADC (each sample is a conversion)
+    blocks = sampledBlocks(signals, f_sampling, resampling=resampling)
+    if n_bits < 0 and bit_threshold is None and isReiterable(blocks):
+        # the average value of each bit signal is gathered in a first pass,
+        # and the bits are decoded block by block into the histogram in a second pass
+        statistics = bitStatistics(blocks)
+        resolution = len(statistics.mean)
+        code_blocks = (
+            decodeBits(
+                block.values, thresholds=statistics.mean, ascending=asceding_bit_order
+            )
+            for block in blocks
+            if len(block) > 0
+        )
+    elif n_bits < 0 and bit_threshold is None:
+        # the blocks of a one-shot iterator are held until the average value of each bit signal is known
+        dout, statistics = decodeBlocks(blocks, ascending=asceding_bit_order)
+        resolution = len(statistics.mean)
+        code_blocks = [dout["dec_word"].values]
+    else:
+        blocks = iter(blocks)
+        first = next(blocks, None)
+        if first is None:
+            raise ValueError("No signals were streamed.")
+        if n_bits > 0 and len(first.columns) > 1:
+            raise ValueError(
+                f"The number of bits was provided as input, but the signals data frame does not present the constructed digital output word of the ADC. Expected {1} signal, found {len(first.columns)} signals."
+            )
+        resolution = n_bits if n_bits > 0 else len(first.columns)
+        thresholds = np.full(resolution, bit_threshold if n_bits < 0 else 0.0)
+
+        def outputCodes(block: DataFrame) -> np.ndarray:
+            if n_bits > 0:
+                return np.rint(block.values[:, 0]).astype(np.int64)
+            return decodeBits(
+                block.values, thresholds=thresholds, ascending=asceding_bit_order
+            )
+
+        code_blocks = map(outputCodes, chain([first], blocks))
+    if resolution > 24:
+        raise ValueError(
+            f"The code density test of a {resolution} bit converter is not supported (at most 24 bits)."
+        )
+    counts = codeHistogram(code_blocks, 2**resolution)
+    _, dnl, inl = codeDensity(counts, stimulus=stimulus)
+    missing_codes = np.flatnonzero(counts[1:-1] == 0) + 1
+    if bool(len(missing_codes)):
+        log.warning(f"\n{len(missing_codes)} missing codes: {missing_codes.tolist()}")
+    linearity = DataFrame({"counts": counts, "dnl": dnl, "inl": inl})
+    linearity.index.name = "code"
+    return (
+        linearity,
+        float(np.nanmax(dnl)),
+        float(np.nanmin(dnl)),
+        float(np.nanmax(inl)),
+        float(np.nanmin(inl)),
+        missing_codes,
+    )
+
+
+def _transitionLevels(vout: np.ndarray, codes: np.ndarray) -> tuple:
+    """_summary_
+    Finds the code transitions of a DAC (the edges of its input codes) and their final values.
+    Args:
+        vout (np.ndarray): The samples of the analog output of the DAC.
+        codes (np.ndarray): The input codes of the DAC at each sample.
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: the edge, the end (the next edge) and the final value
+        (the last output sample before the next edge) of each transition.
+    """
+    edges = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    ends = np.append(edges[1:], len(vout))
+    return edges, ends, vout[ends - 1]
+
+
+def _lsbFit(codes: np.ndarray, finals: np.ndarray) -> float:
     """_summary_
-    Dynamic performance evaluation of Digital-to-Analog Converter circuits
+    Measures the LSB of a DAC output: the least squares slope of the final values of its transitions over their codes.
+    Args:
+        codes (np.ndarray): The (new) code of each transition.
+        finals (np.ndarray): The final value of each transition.
+    Returns:
+        float: the LSB of the DAC output [V].
     """
-    raise NotImplementedError("dacDynamicEval: Not implemented yet.")
+    if np.ptp(codes) == 0:
+        raise ValueError(
+            "The LSB of the DAC cannot be measured from a single code: provide it."
+        )
+    return abs(np.polyfit(codes, finals, 1)[0])
 
 
-def sigmaDeltaAdcDynamicEval(*args, **kwargs):
+def dacTransitions(
+    vout: np.ndarray,
+    codes: np.ndarray,
+    ts: float,
+    n_bits: int,
+    lsb: float = None,
+    start: int = 0,
+) -> DataFrame:
     """_summary_
-    Dynamic evaluation of Sigma Delta Analog-to-Digital Converter circuits
-    Raises:
-        NotImplementedError: _description_
+    Computes the metrics of each code transition of a Digital-to-Analog Converter, from its analog output
+    and its input codes sampled on the same time grid. The transitions are the edges of the input codes,
+    found in a single pass, and all the metrics are computed at once through segmented reductions
+    (np.maximum.reduceat, np.add.reduceat) over the samples following each edge, without any loop over
+    the transitions or the codes:
+    - the final value of a transition is the last output sample before the next edge (its settled level);
+    - the settling time is the time from the edge until the output stays within +-1/2 LSB of the final value;
+    - the glitch impulse area is the net area of the output around the final value, from the edge to the
+    next edge (the area between the output and the ideal, instantaneous step) [V.s];
+    - the major-carry transitions are the transitions toggling all the bits of the code (e.g. at mid-scale).
+    Args:
+        vout (np.ndarray): The samples of the analog output of the DAC.
+        codes (np.ndarray): The input codes of the DAC at each sample.
+        ts (float): The sampling time period of the samples.
+        n_bits (int): The resolution of the DAC.
+        lsb (float, optional): The least significant bit of the DAC output [V]. Defaults to None (the least
+                                squares slope of the final values of the transitions over their codes).
+        start (int, optional): The index of the first sample in the record (of a segment of a streamed record). Defaults to 0.
+    Returns:
+        DataFrame: the time [s] of each transition, its codes, step (LSB), toggled bits, settling time [s],
+        glitch impulse area [V.s] and major-carry flag.
     """
-    raise NotImplementedError("sigmaDeltaAdcDynamicEval: Not implemented yet")
+    vout = np.asarray(vout, dtype=np.float64)
+    codes = np.asarray(codes, dtype=np.int64)
+    edges, ends, finals = _transitionLevels(vout, codes)
+    if len(edges) == 0:
+        raise ValueError(
+            "No code transitions were found in the input codes of the DAC."
+        )
+    old_codes = codes[edges - 1]
+    new_codes = codes[edges]
+    lsb = _lsbFit(new_codes, finals) if lsb is None else abs(lsb)
+    # deviation of each sample from the final value of its transition
+    error = vout[edges[0] :] - np.repeat(finals, ends - edges)
+    starts = edges - edges[0]
+    positions = np.arange(len(error))
+    # last sample of each transition outside of the +-1/2 LSB band
+    last_out = np.maximum.reduceat(
+        np.where(np.abs(error) > lsb / 2, positions, -1), starts
+    )
+    settling = np.where(last_out >= starts, last_out + 1 - starts, 0) * ts
+    glitch_area = np.add.reduceat(error, starts) * ts
+    toggled = old_codes ^ new_codes
+    toggled_bits = np.zeros(len(edges), dtype=np.int64)
+    for bit in range(n_bits):
+        toggled_bits += (toggled >> bit) & 1
+    transitions = DataFrame(
+        {
+            "time (s)": (start + edges) * ts,
+            "from code": old_codes,
+            "to code": new_codes,
+            "step (LSB)": (finals - np.append(vout[edges[0] - 1], finals[:-1])) / lsb,
+            "toggled bits": toggled_bits,
+            "settling time (s)": settling,
+            "glitch area (V.s)": glitch_area,
+            "major carry": toggled_bits == n_bits,
+        }
+    )
+    transitions.index.name = "transition"
+    return transitions
 
 
-def sigmaDeltaDacDynamicEval(*args, **kwargs):
+def dacSampleBlocks(
+    signals: DataFrame,
+    f_sampling: float,
+    output_signal_name: str,
+    code_signal_names: list = None,
+    resampling: str = None,
+    dtype: np.dtype = None,
+):
     """_summary_
-    Dynamic evaluation of Sigma Delta Analog-to-Digital Converter circuits
-    Raises:
-        NotImplementedError: _description_
+    Brings the analog output and the input code signals of a DAC (or their streamed blocks) to the
+    sampling frequency of the analysis, one block at a time (see dycifer.resample.sampleBlocks):
+    between non-uniform time steps, the output is interpolated and the digital levels of the codes are held.
+    Args:
+        signals (DataFrame): The time series data, or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency of the analysis.
+        output_signal_name (str): The name of the analog output signal.
+        code_signal_names (list, optional): The names of the input code signals. Defaults to None (no code signals).
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold"). Defaults to None.
+        dtype (np.dtype, optional): The floating point type of the signals. Defaults to None (as read).
+    Yields:
+        tuple[np.ndarray, np.ndarray]: the output (n_samples,) and the code signals (n_samples, n_code_signals)
+        of each block, or None without code signals.
+    """
+    code_signal_names = list(code_signal_names) if bool(code_signal_names) else []
+    columns = [output_signal_name] + code_signal_names
+    if isinstance(signals, DataFrame):
+        signals = rowBlocks(collectSignals(signals, columns=columns, dtype=dtype))
+    else:
+        signals = (
+            collectSignals(block, columns=columns, dtype=dtype) for block in signals
+        )
+    # the output and the codes are sampled alongside, from the same blocks
+    outputs, inputs = tee(signals)
+    vout_blocks = sampleBlocks(
+        (block[[output_signal_name]] for block in outputs),
+        f_sampling,
+        resampling=resampling,
+    )
+    if not bool(code_signal_names):
+        for block in vout_blocks:
+            yield block.values[:, 0], None
+        return
+    code_blocks = sampleBlocks(
+        (block[code_signal_names] for block in inputs),
+        f_sampling,
+        resampling=resampling,
+        fallback=Interpolations.HOLD.value,
+    )
+    for vout, codes in zip(vout_blocks, code_blocks):
+        yield vout.values[:, 0], codes.values
+
+
+def transitionSegments(blocks):
+    """_summary_
+    Splits the streamed blocks of the output and of the input codes of a DAC into segments of whole code
+    transitions: the samples following the last edge of a block (the transition still settling) are carried
+    over to the next block, so each transition is evaluated with all its samples (see dacTransitions).
+    Each segment starts one sample before its first edge, at the final value of the previous transition.
+    Args:
+        blocks (iterable): The (vout, codes) arrays of consecutive blocks of samples.
+    Yields:
+        tuple[np.ndarray, np.ndarray, int]: the output and the codes of each segment, and the index of its first sample.
+    """
+    tail_vout = tail_codes = None
+    start = 0  # index of the first carried sample
+    for vout, codes in blocks:
+        if tail_vout is not None:
+            vout = np.concatenate([tail_vout, vout])
+            codes = np.concatenate([tail_codes, codes])
+        if len(codes) == 0:
+            continue
+        edges = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        if len(edges) > 1:
+            yield vout[: edges[-1]], codes[: edges[-1]], start
+        # only the last transition (or the last level, before the first edge) is carried over
+        keep = edges[-1] - 1 if len(edges) > 0 else len(codes) - 1
+        tail_vout, tail_codes = vout[keep:], codes[keep:]
+        start += keep
+    if tail_codes is not None and np.any(tail_codes != tail_codes[0]):
+        yield tail_vout, tail_codes, start
+
+
+def dacLsb(blocks) -> float:
+    """_summary_
+    Measures the LSB of a DAC output in a pass over the streamed blocks of its output and input codes:
+    the least squares slope of the final values of the transitions over their codes (see dacTransitions).
+    Args:
+        blocks (iterable): The (vout, codes) arrays of consecutive blocks of samples.
+    Returns:
+        float: the LSB of the DAC output [V].
+    """
+    codes = []
+    finals = []
+    for vout, segment_codes, _ in transitionSegments(blocks):
+        edges, _, segment_finals = _transitionLevels(vout, segment_codes)
+        codes.append(segment_codes[edges])
+        finals.append(segment_finals)
+    if not bool(codes):
+        raise ValueError(
+            "No code transitions were found in the input codes of the DAC."
+        )
+    return _lsbFit(np.concatenate(codes), np.concatenate(finals))
+
+
+def dacTransitionBlocks(blocks, ts: float, n_bits: int, lsb: float = None) -> DataFrame:
+    """_summary_
+    Computes the metrics of each code transition of a DAC (see dacTransitions) over the streamed blocks of its
+    output and input codes, one segment of whole transitions at a time (see transitionSegments), so only the
+    samples of the transitions of a block are held. Without a given LSB, it is measured in a first pass over
+    the blocks (see dacLsb), and the blocks of a one-shot iterator are held until then.
+    Args:
+        blocks (iterable): The (vout, codes) arrays of consecutive blocks of samples.
+        ts (float): The sampling time period of the samples.
+        n_bits (int): The resolution of the DAC.
+        lsb (float, optional): The least significant bit of the DAC output [V]. Defaults to None (measured).
+    Returns:
+        DataFrame: the metrics of each code transition (see dacTransitions).
+    """
+    if lsb is None:
+        if not isReiterable(blocks):
+            blocks = list(blocks)
+        lsb = dacLsb(blocks)
+    segments = [
+        dacTransitions(vout, codes, ts, n_bits, lsb=lsb, start=start)
+        for vout, codes, start in transitionSegments(blocks)
+    ]
+    if not bool(segments):
+        raise ValueError(
+            "No code transitions were found in the input codes of the DAC."
+        )
+    transitions = concat(segments, ignore_index=True)
+    transitions.index.name = "transition"
+    return transitions
+
+
+def _settledBlocks(blocks, settled: list, samples_per_update: int = 1):
+    """_summary_
+    Passes the blocks of the output and input codes of a DAC through, gathering the settled output:
+    the last sample of each update period (the update periods run on from one block to the next).
+    Args:
+        blocks (iterable): The (vout, codes) arrays of consecutive blocks of samples.
+        settled (list): The list the settled output of each block is appended to.
+        samples_per_update (int, optional): The number of samples of each update period. Defaults to 1 (all the samples).
+    Yields:
+        tuple[np.ndarray, np.ndarray]: the blocks.
     """
-    raise NotImplementedError("sigmaDeltaAdcDynamicEval: Not implemented yet")
+    offset = samples_per_update - 1  # index of the next settled sample in the block
+    for vout, codes in blocks:
+        settled.append(vout[offset::samples_per_update])
+        offset = (offset - len(vout)) % samples_per_update
+        yield vout, codes
+
+
+@timer
+def dacDynamicEval(
+    signals: DataFrame,
+    f_sampling: float,
+    output_signal_name: str,
+    code_signal_names: list = None,
+    n_bits: int = -1,
+    update_frequency: float = None,
+    lsb: float = None,
+    harmonics: int = 7,
+    signal_span_factor: float = 0.0,
+    ascending_bit_order: bool = False,
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+) -> tuple[
+    Spectrum,
+    list,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    DataFrame,
+]:
+    """_summary_
+    Dynamic performance evaluation of Digital-to-Analog Converter circuits, from the analog output of the DAC
+    and (optionally) its digital input codes.
+    The signals are read in blocks: only the (settled) output is gathered for the spectrum, and the code transitions
+    are evaluated one block at a time (see dacTransitionBlocks). Re-iterable signals (see dycifer.read.Reiterable) are
+    read in a first pass for the average value of each bit signal (or the highest decimal code), and in another pass
+    to measure the LSB when it is not given; the sampled blocks of a one-shot iterator are held for these passes.
+    Args:
+        signals (DataFrame): The time series data with the analog output and the input code signals of the DAC,
+                            or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency (in Hertz (Hz)) of the analysis, resolving the transitions of the output.
+        output_signal_name (str): The name of the analog output signal.
+        code_signal_names (list, optional): The names of the input code signals: the signals of each bit of the code,
+                                            or a single signal with the decimal code. Defaults to None (no transition metrics).
+        n_bits (int, optional): The resolution of the DAC. Defaults to -1 (the number of bit signals, or the number
+                                of bits of the highest decimal code).
+        update_frequency (float, optional): The update frequency of the DAC. When given, the dynamic metrics are computed
+                                            from the settled output: the last sample of each update period. Defaults to None
+                                            (the output at the sampling frequency of the analysis).
+        lsb (float, optional): The least significant bit of the DAC output [V] (see dacTransitions). Defaults to None (measured).
+        harmonics (int, optional): The number of harmonics considered in the analysis of the harmonic distortion. Defaults to 7.
+        signal_span_factor (float, optional): Percentual factor determining how much of the signal's
+                                                power is dispersed onto the remanescent spectrum of the signal's spectrum. Defaults to 0.0
+        ascending_bit_order (bool, optional): Indicate if the bit signals are in ascending bit order. Defaults to False.
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+                                    the sampling frequency grid. Defaults to None (linear for the output and hold for the
+                                    codes, and only for non-uniform time steps).
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to the output before the FFT (see dycifer.spectrum.parseWindow). Defaults to "rectangular".
+        segments (int, optional): The number of averaged segments of the spectrum. Defaults to 1.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple(Spectrum, list, float(1), ..., float(9), DataFrame):
+            Spectrum: The frequency spectrum of the DAC's output signal.
+            list: The (frequency, power in dB) of the fundamental and of its harmonics.
+            float(1): Signal's power in decibels
+            float(2): Signal's DC power
+            float(3): Spurious Free Dynamic Range metric
+            float(4): Total Harmonic Distortion metric
+            float(5): Signal to Noise Ratio metric
+            float(6): Signal to Noise & Distortion Ratio metric
+            float(7): Effective Number of Bits metric
+            float(8): Fractional Second-Harmonic Distortion (HD2) metric
+            float(9): Fractional Third-Harmonic Distortion (HD3) metric
+            DataFrame: The metrics of each code transition (see dacTransitions), or None without code signals.
+    """
+    print("\nPerforming Dynamic performance evaluation of DAC...")
+    code_signal_names = list(code_signal_names) if bool(code_signal_names) else []
+    ts = 1.0 / f_sampling
+    samples_per_update = 1
+    if update_frequency is not None:
+        samples_per_update = int(round(f_sampling / update_frequency))
+        if samples_per_update < 1:
+            raise ValueError(
+                "The sampling frequency must be equal or higher than the update frequency of the DAC."
+            )
+    blocks = Reiterable(
+        dacSampleBlocks,
+        signals,
+        f_sampling,
+        output_signal_name,
+        code_signal_names,
+        resampling=resampling,
+        dtype=floatType(precision),
+    )
+    if not isReiterable(signals):
+        blocks = iter(blocks)
+    # settled output: the last sample of each update period
+    settled = []
+    transitions = None
+    if bool(code_signal_names):
+        if not isReiterable(signals):
+            # the sampled blocks of a one-shot iterator are held for the passes over the codes
+            blocks = list(blocks)
+        if len(code_signal_names) > 1 or n_bits <= 0:
+            # the average value of each bit signal (or the highest code) is gathered in a first pass
+            statistics = ColumnStatistics()
+            for _, code_signals in blocks:
+                statistics.update(code_signals)
+            if statistics.count == 0:
+                raise ValueError("No signals were streamed.")
+        if len(code_signal_names) > 1:
+            resolution = len(code_signal_names)
+        else:
+            resolution = (
+                n_bits
+                if n_bits > 0
+                else max(1, int(np.rint(statistics.maximum[0])).bit_length())
+            )
+
+        def decodedBlocks():
+            for vout, code_signals in blocks:
+                if len(code_signal_names) > 1:
+                    codes = decodeBits(
+                        code_signals,
+                        thresholds=statistics.mean,
+                        ascending=ascending_bit_order,
+                    )
+                else:
+                    codes = np.rint(code_signals[:, 0]).astype(np.int64)
+                yield vout, codes
+
+        if lsb is None:
+            lsb = dacLsb(decodedBlocks())
+        transitions = dacTransitionBlocks(
+            _settledBlocks(decodedBlocks(), settled, samples_per_update),
+            ts,
+            resolution,
+            lsb=lsb,
+        )
+    else:
+        for _ in _settledBlocks(blocks, settled, samples_per_update):
+            pass
+    if not bool(settled):
+        raise ValueError("No signals were streamed.")
+    vout = np.concatenate(settled)
+    ts = samples_per_update * ts
+    spectrum, n_fft = signalSpectrum(
+        vout,
+        ts,
+        precision=precision,
+        window=window,
+        segments=segments,
+        overlap=overlap,
+        backend=fft_backend,
+    )
+    span = np.max(
+        [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
+    )
+    (
+        harmonic_bins_idxs,
+        harmonics_power,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        SFDR,
+        THD,
+        SNR,
+        SNDR,
+        HD2,
+        HD3,
+    ) = spectralMetrics(
+        spectrum.power,
+        n_fft,
+        harmonics=harmonics,
+        span=span,
+        enbw=windowGains(window, n_fft)[1],
+    )
+    ENOB = (SNDR - 1.76) / 6.02
+    target_harmonics = list(
+        zip(spectrum.freq[harmonic_bins_idxs], 10 * np.log10(harmonics_power))
+    )
+    return (
+        spectrum,
+        target_harmonics,
+        SIGNAL_POWER_DB,
+        DC_POWER_DB,
+        SFDR,
+        THD,
+        SNR,
+        SNDR,
+        ENOB,
+        HD2,
+        HD3,
+        transitions,
+    )
+
+
+@timer
+def sigmaDeltaAdcDynamicEval(
+    signals: DataFrame,
+    f_sampling: float,
+    bandwidth: float = None,
+    osr: int = None,
+    harmonics: int = 7,
+    signal_span_factor: float = 0.0,
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "kaiser",
+    segment_length: int = SIGMA_DELTA_SEGMENT_LENGTH,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+    stages: int = HALF_BAND_STAGES,
+    cic_order: int = CIC_ORDER,
+) -> tuple[Spectrum, Spectrum, list, DataFrame]:
+    """_summary_
+    Dynamic evaluation of Sigma Delta Analog-to-Digital Converter circuits, from the (1-bit or multi-bit)
+    output of the modulator, streamed in blocks. Each block of the modulator output is accumulated into the
+    averaged spectrum of the modulator (see dycifer.spectrum.WelchAccumulator), and decimated through a
+    CIC and half-band decimation chain (see dycifer.decimation.DecimationChain) whose output is accumulated
+    into its own averaged spectrum, so the memory is bounded whatever the length of the record.
+    The in-band metrics are computed over the signal band [0, bandwidth] of both spectra (see
+    dycifer.spectrum.bandMetrics), the dynamic range being referred to the full scale of the modulator
+    output (half of the span between its lowest and highest levels).
+    Args:
+        signals (DataFrame): The output signal of the modulator, or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency of the modulator [Hz].
+        bandwidth (float, optional): The bandwidth of the signal [Hz]. Defaults to None (f_sampling / 2 / osr).
+        osr (int, optional): The oversampling ratio of the modulator, a multiple of 2^(stages + 1).
+                            Defaults to None (the largest valid ratio below f_sampling / 2 / bandwidth).
+        harmonics (int, optional): The number of harmonics considered in the analysis of the harmonic distortion. Defaults to 7.
+        signal_span_factor (float, optional): Percentual factor determining how much of the signal's
+                                                power is dispersed onto the remanescent spectrum of the signal's spectrum. Defaults to 0.0
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+                                    the sampling frequency grid. Defaults to None (hold, and only for non-uniform time steps).
+        precision (str, optional): "double" or "single" (the floating point type of the spectra). Defaults to "double".
+        window (str, optional): The window applied to the segments of the spectra (see dycifer.spectrum.parseWindow).
+                                The shaped quantization noise of the modulator is orders of magnitude above the in-band noise:
+                                the window must have very low sidelobes. Defaults to "kaiser".
+        segment_length (int, optional): The number of samples of the segments of the spectrum of the modulator (the segments of
+                                        the decimated spectrum have the same frequency resolution). Defaults to SIGMA_DELTA_SEGMENT_LENGTH.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+        stages (int, optional): The number of half-band stages of the decimation chain. Defaults to HALF_BAND_STAGES.
+        cic_order (int, optional): The order of the CIC stage of the decimation chain. Defaults to CIC_ORDER.
+    Returns:
+        tuple(Spectrum, Spectrum, list, DataFrame):
+            Spectrum: The averaged spectrum of the modulator output.
+            Spectrum: The averaged spectrum of the decimated output.
+            list: The (frequency, power in dB) of the fundamental and of its in-band harmonics (modulator spectrum).
+            DataFrame: The Signal Power, THD, SNR, SNDR, ENOB and DR of the modulator ("Modulator") and decimated ("Decimated") outputs.
+    """
+    print("\nPerforming Dynamic performance evaluation of Sigma Delta ADC...")
+    if bandwidth is None and osr is None:
+        raise ValueError(
+            "The signal bandwidth or the oversampling ratio of the modulator is required."
+        )
+    decimation = 2 ** (stages + 1)
+    if osr is None:
+        if not (0 < bandwidth <= f_sampling / 2 / decimation):
+            raise ValueError(
+                f"{bandwidth} Hz is not a valid signal bandwidth. The bandwidth of the modulator must be in (0, {f_sampling / 2 / decimation}] Hz (an oversampling ratio of at least {decimation})."
+            )
+        osr = decimation * int(f_sampling / 2 / bandwidth / decimation)
+    if bandwidth is None:
+        bandwidth = f_sampling / 2 / osr
+    decimator = DecimationChain(osr, stages=stages, cic_order=cic_order)
+    ts = 1.0 / f_sampling
+    # the decimated spectrum has the same frequency resolution as the modulator spectrum
+    decimated_length = segment_length // decimator.ratio
+    modulator_welch = WelchAccumulator(
+        segment_length, overlap, precision=precision, window=window, backend=fft_backend
+    )
+    decimated_welch = WelchAccumulator(
+        decimated_length,
+        overlap,
+        precision=precision,
+        window=window,
+        backend=fft_backend,
+    )
+    statistics = ColumnStatistics()
+    # bring the signals to the sampling frequency of the modulator
+    blocks = sampledBlocks(
+        signals, f_sampling, resampling=resampling, length=SIGMA_DELTA_BLOCK_LENGTH
+    )
+    for block in blocks:
+        if len(block.columns) > 1:
+            raise ValueError(
+                f"The signals data frame does not present the output of the modulator. Expected {1} signal, found {len(block.columns)} signals."
+            )
+        x = block.values[:, 0]
+        statistics.update(x)
+        modulator_welch.update(x)
+        decimated_welch.update(decimator.decimate(x))
+    modulator_spectrum = modulator_welch.spectrum(ts)
+    decimated_spectrum = decimated_welch.spectrum(ts * decimator.ratio)
+    # full scale sine wave of the modulator output levels
+    full_scale_power = ((statistics.maximum[0] - statistics.minimum[0]) / 2) ** 2 / 2
+    indicators = {}
+    for name, spectrum in [
+        ("Modulator", modulator_spectrum),
+        ("Decimated", decimated_spectrum),
+    ]:
+        span = np.max(
+            [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
+        )
+        band_bins = int(np.floor(bandwidth * spectrum.n_fft * spectrum.ts))
+        (
+            harmonic_bins_idxs,
+            harmonics_power,
+            SIGNAL_POWER_DB,
+            THD,
+            SNR,
+            SNDR,
+            DR,
+        ) = bandMetrics(
+            spectrum.power,
+            spectrum.n_fft,
+            band_bins,
+            harmonics=harmonics,
+            span=span,
+            enbw=windowGains(window, spectrum.n_fft)[1],
+            full_scale_power=full_scale_power,
+        )
+        ENOB = (SNDR - 1.76) / 6.02
+        indicators[name] = {
+            "Signal Power (dB)": SIGNAL_POWER_DB,
+            "THD (dB)": THD,
+            "SNR (dB)": SNR,
+            "SNDR (dB)": SNDR,
+            "ENOB": ENOB,
+            "DR (dB)": DR,
+        }
+        if name == "Modulator":
+            target_harmonics = list(
+                zip(
+                    modulator_spectrum.freq[harmonic_bins_idxs],
+                    10 * np.log10(harmonics_power),
+                )
+            )
+    indicators = DataFrame(indicators).T
+    indicators["Bandwidth (Hz)"] = bandwidth
+    indicators["OSR"] = osr
+    return modulator_spectrum, decimated_spectrum, target_harmonics, indicators
+
+
+@timer
+def sigmaDeltaDacDynamicEval(
+    signals: DataFrame,
+    f_sampling: float,
+    bandwidth: float = None,
+    osr: int = None,
+    harmonics: int = 7,
+    signal_span_factor: float = 0.0,
+    resampling: str = None,
+    precision: str = "double",
+    window: str = "kaiser",
+    segment_length: int = SIGMA_DELTA_SEGMENT_LENGTH,
+    overlap: float = 0.5,
+    fft_backend: str = None,
+) -> tuple[Spectrum, list, float, float, float, float, float, float, float, float]:
+    """_summary_
+    Dynamic evaluation of Sigma Delta Digital-to-Analog Converter circuits, from the analog output of the DAC
+    (after its reconstruction filter), streamed in blocks and accumulated into an averaged spectrum
+    (see dycifer.spectrum.WelchAccumulator), so the memory is bounded whatever the length of the record.
+    All the band powers are integrated from the prefix sums of the spectrum (see dycifer.spectrum.cumulativePower):
+    the in-band metrics over the signal band [0, bandwidth] (see dycifer.spectrum.bandMetrics), and the
+    out-of-band noise and strongest spur over (bandwidth, fs/2] (see dycifer.spectrum.outOfBandMetrics).
+    Args:
+        signals (DataFrame): The analog output signal of the DAC, or an iterable of DataFrame blocks (see dycifer.read.streamSignals).
+        f_sampling (float): The sampling frequency of the analysis [Hz].
+        bandwidth (float, optional): The bandwidth of the signal [Hz]. Defaults to None (f_sampling / 2 / osr).
+        osr (int, optional): The oversampling ratio of the signal band at the sampling frequency of the analysis.
+                            Defaults to None (f_sampling / 2 / bandwidth).
+        harmonics (int, optional): The number of harmonics considered in the analysis of the harmonic distortion. Defaults to 7.
+        signal_span_factor (float, optional): Percentual factor determining how much of the signal's
+                                                power is dispersed onto the remanescent spectrum of the signal's spectrum. Defaults to 0.0
+        resampling (str, optional): The interpolation ("linear", "cubic" or "hold") used to resample the signals onto
+                                    the sampling frequency grid. Defaults to None (hold, and only for non-uniform time steps).
+        precision (str, optional): "double" or "single" (the floating point type of the spectrum). Defaults to "double".
+        window (str, optional): The window applied to the segments of the spectrum (see dycifer.spectrum.parseWindow). Defaults to "kaiser".
+        segment_length (int, optional): The number of samples of the segments of the spectrum. Defaults to SIGMA_DELTA_SEGMENT_LENGTH.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        fft_backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple(Spectrum, list, float(1), float(2), float(3), float(4), float(5), float(6), float(7), float(8)):
+            Spectrum: The averaged spectrum of the DAC's output signal.
+            list: The (frequency, power in dB) of the fundamental and of its in-band harmonics.
+            float(1): Signal's power in decibels
+            float(2): Total Harmonic Distortion metric (in-band harmonics)
+            float(3): Signal to Noise Ratio metric (in-band noise)
+            float(4): Signal to Noise & Distortion Ratio metric
+            float(5): Effective Number of Bits metric
+            float(6): Out-of-band noise power (dBc)
+            float(7): Strongest out-of-band spur power (dBc)
+            float(8): Frequency of the strongest out-of-band spur [Hz]
+    """
+    print("\nPerforming Dynamic performance evaluation of Sigma Delta DAC...")
+    if bandwidth is None and osr is None:
+        raise ValueError(
+            "The signal bandwidth or the oversampling ratio of the DAC is required."
+        )
+    if bandwidth is None:
+        bandwidth = f_sampling / 2 / osr
+    welch = WelchAccumulator(
+        segment_length, overlap, precision=precision, window=window, backend=fft_backend
+    )
+    # bring the signals to the sampling frequency of the analysis
+    blocks = sampledBlocks(
+        signals, f_sampling, resampling=resampling, length=SIGMA_DELTA_BLOCK_LENGTH
+    )
+    for block in blocks:
+        if len(block.columns) > 1:
+            raise ValueError(
+                f"The signals data frame does not present the output of the DAC. Expected {1} signal, found {len(block.columns)} signals."
+            )
+        welch.update(block.values[:, 0])
+    spectrum = welch.spectrum(1.0 / f_sampling)
+    span = np.max(
+        [windowSpan(window), int(np.floor(signal_span_factor * len(spectrum)))]
+    )
+    enbw = windowGains(window, spectrum.n_fft)[1]
+    band_bins = int(np.floor(bandwidth * spectrum.n_fft * spectrum.ts))
+    # the prefix sums of the spectrum are shared by all the band powers
+    cumulative = cumulativePower(spectrum.power)
+    (
+        harmonic_bins_idxs,
+        harmonics_power,
+        SIGNAL_POWER_DB,
+        THD,
+        SNR,
+        SNDR,
+        _,
+    ) = bandMetrics(
+        spectrum.power,
+        spectrum.n_fft,
+        band_bins,
+        harmonics=harmonics,
+        span=span,
+        enbw=enbw,
+        cumulative=cumulative,
+    )
+    OOB_NOISE, OOB_SPUR, spur_bin = outOfBandMetrics(
+        spectrum.power,
+        band_bins,
+        harmonics_power[0],
+        span=span,
+        enbw=enbw,
+        cumulative=cumulative,
+        signal_bin=int(harmonic_bins_idxs[0]),
+    )
+    ENOB = (SNDR - 1.76) / 6.02
+    target_harmonics = list(
+        zip(spectrum.freq[harmonic_bins_idxs], 10 * np.log10(harmonics_power))
+    )
+    spur_frequency = spectrum.freq[spur_bin] if spur_bin >= 0 else np.nan
+    return (
+        spectrum,
+        target_harmonics,
+        SIGNAL_POWER_DB,
+        THD,
+        SNR,
+        SNDR,
+        ENOB,
+        OOB_NOISE,
+        OOB_SPUR,
+        spur_frequency,
+    )
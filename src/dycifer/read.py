@@ -1,5 +1,10 @@
 import os
+import io
+import queue
+import threading
 import traceback as tb
+import numpy as np
+from loguru import logger as log
 from modelling_utils import (
     Scale,
     Units,
@@ -8,51 +13,1476 @@ from modelling_utils import (
 from pandas import (
     read_csv,
     DataFrame,
+    concat,
 )
+from enum import Enum
+from dycifer.cache import loadCachedSignals, storeCachedSignals
 
+# default number of rows of each block yielded by the streaming reader
+DEFAULT_CHUNK_SIZE = 2**20
+# extensions of the binary SPICE waveform files (ngspice/LTspice rawfiles)
+RAW_EXTENSIONS = [".raw"]
+# extensions of the columnar waveform files
+PARQUET_EXTENSIONS = [".parquet", ".pq"]
+FEATHER_EXTENSIONS = [".feather", ".arrow", ".ipc"]
+HDF5_EXTENSIONS = [".h5", ".hdf5", ".hdf"]
+# extensions and magic bytes of the compressed signals files
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".bz2": "bz2",
+}
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\xfd\x37\x7a\x58\x5a\x00": "xz",
+    b"\x42\x5a\x68": "bz2",
+}
+# size of the decompressed blocks and number of blocks decompressed ahead of the parser
+DECOMPRESSION_BLOCK_SIZE = 2**20
+DECOMPRESSION_QUEUE_DEPTH = 8
+# largest gap (in time steps) between the last and the first samples of consecutive segment files
+SEGMENT_GAP_TOLERANCE = 2.0
+# size (in bytes) of the byte ranges of a CSV file parsed by each worker of the native engine
+CSV_RANGE_SIZE = 2**24
 
-def readSignals(file_path: str = None) -> DataFrame:
+
+class ReaderEngines(Enum):
     """_summary_
-    Reads a time series table data into a pandas DataFrame and returns it.
+
+    Args:
+        PANDAS (str): Single-threaded pandas C parser
+        PYARROW (str): Multithreaded Arrow CSV parser
+        NATIVE (str): pandas C parser running in parallel over byte ranges of the file (one process per core)
+    """
+
+    PANDAS = "pandas"
+    PYARROW = "pyarrow"
+    NATIVE = "native"
+
+
+def compressionFormat(file_path: str) -> str:
+    """_summary_
+    Identifies the compression of a signals file from its magic bytes
+    (or from its extension, if the file can not be read).
     Args:
-        file_path (str, optional): The file path of the Comma Separated Values (.CSV) file generated by Cadence (or other EDA software).
-                                    Defaults to None.
-        time_col (bool, optional): If True, the csv file is assume to have a time column. Otherwise, time column is discarded.
+        file_path (str): The path of the signals file.
     Returns:
-        DataFrame: the pandas DataFrame containing the time series data with all the correspondant signals.
+        str: one of "gzip", "zstd", "xz" or "bz2", or None if the file is not compressed.
     """
-    time_col = "t"
-    if file_path is None:
-        raise ValueError("The file path was not provided.")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File {file_path} not found.")
-    signals = None
     try:
-        signals = read_csv(file_path, header=0)
-    except Exception as e:
-        tb.format_exc()
+        with open(file_path, "rb") as fp:
+            head = fp.read(6)
+        for magic, compression in COMPRESSION_MAGIC.items():
+            if head.startswith(magic):
+                return compression
         return None
-    # preprocess the headers of the data - search for the time column
+    except OSError:
+        extension = os.path.splitext(file_path)[1].lower()
+        return COMPRESSION_EXTENSIONS.get(extension, None)
+
+
+def fileFormat(file_path: str) -> str:
+    """_summary_
+    Identifies the format of a signals file from its extension. The extension
+    of the compression (e.g. "signals.csv.gz") is ignored.
+    Args:
+        file_path (str): The path of the signals file.
+    Returns:
+        str: one of "raw", "parquet", "feather", "hdf5" or "csv" (default).
+    """
+    root, extension = os.path.splitext(file_path)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(root)[1]
+    extension = extension.lower()
+    if extension in RAW_EXTENSIONS:
+        return "raw"
+    if extension in PARQUET_EXTENSIONS:
+        return "parquet"
+    if extension in FEATHER_EXTENSIONS:
+        return "feather"
+    if extension in HDF5_EXTENSIONS:
+        return "hdf5"
+    return "csv"
+
+
+def findTimeColumn(columns: list) -> str:
+    """_summary_
+    Searches the headers of a time series table for the time column.
+    Args:
+        columns (list): The column names (headers) of the time series table.
+    Returns:
+        str: the name of the time column, or None if no time column was found.
+    """
     possible_time_cols = ["time", "t", "Time", "T", "TIME"]
-    ordered = False
-    signals_columns_order = signals.columns.tolist()
-    for column in list(signals.columns):
-        tokens = column.split(" ")
+    for column in list(columns):
+        tokens = str(column).split(" ")
         for token in tokens:
             if token in possible_time_cols + [
                 Units.TIME.value,
                 f"[{Units.TIME.value}]",
                 f"({Units.TIME.value})",
             ]:
-                # place the time column in the first column of the DataFrame
-                signals_columns_order = [column] + list(
-                    signals.drop(columns=[column]).columns
-                )
-                ordered = True
-                break
-        if ordered:
+                return column
+    return None
+
+
+def _selectColumns(header: list, columns: list = None) -> tuple:
+    """_summary_
+    Computes the columns to be parsed from a time series table.
+    Args:
+        header (list): The column names (headers) of the time series table.
+        columns (list, optional): The names of the signals to keep. Defaults to None (keep all signals).
+    Returns:
+        tuple(list, str): the ordered columns to parse (time column first) and the time column name.
+    """
+    time_col = findTimeColumn(header)
+    if columns is None:
+        selected = list(header)
+    else:
+        columns = [col for col in columns if bool(col)]
+        for col in columns:
+            if not (col in header):
+                raise ValueError(f"{col} does not belong to the parsed signals.")
+        selected = [col for col in header if col in columns or col == time_col]
+    if time_col is not None:
+        selected = [time_col] + [col for col in selected if col != time_col]
+    return selected, time_col
+
+
+def _openCompressed(file_path: str, compression: str):
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(file_path, "rb")
+    if compression == "xz":
+        import lzma
+
+        return lzma.open(file_path, "rb")
+    if compression == "bz2":
+        import bz2
+
+        return bz2.open(file_path, "rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading zstd compressed files requires zstandard. Install it with: pip install zstandard"
+            )
+        return zstandard.ZstdDecompressor().stream_reader(
+            open(file_path, "rb"), closefd=True
+        )
+    raise ValueError(f"{compression} is not a supported compression.")
+
+
+class DecompressionStream(io.RawIOBase):
+    """_summary_
+    Read-only binary stream of the decompressed contents of a file. The file is decompressed
+    in a background thread, DECOMPRESSION_BLOCK_SIZE bytes at a time, and at most
+    DECOMPRESSION_QUEUE_DEPTH blocks are decompressed ahead of the reader, so that the
+    decompression overlaps with the parsing (the decompressors release the GIL) without
+    ever writing an uncompressed copy of the file.
+    Args:
+        file_path (str): The path of the compressed file.
+        compression (str): The compression of the file ("gzip", "zstd", "xz" or "bz2").
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        compression: str,
+        block_size: int = DECOMPRESSION_BLOCK_SIZE,
+        queue_depth: int = DECOMPRESSION_QUEUE_DEPTH,
+    ):
+        super().__init__()
+        self._source = _openCompressed(file_path, compression)
+        self._block_size = block_size
+        self._blocks = queue.Queue(maxsize=queue_depth)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._offset = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._decompress, daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decompress(self):
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(self._block_size)
+                if not block:
+                    break
+                if not self._put(block):
+                    return
+        except Exception as e:
+            self._put(e)
+            return
+        self._put(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._eof:
+            return 0
+        while self._offset >= len(self._buffer):
+            block = self._blocks.get()
+            if isinstance(block, Exception):
+                self._eof = True
+                raise block
+            if not block:
+                self._eof = True
+                return 0
+            self._buffer = memoryview(block)
+            self._offset = 0
+        n_bytes = min(len(buffer), len(self._buffer) - self._offset)
+        buffer[:n_bytes] = self._buffer[self._offset : self._offset + n_bytes]
+        self._offset += n_bytes
+        return n_bytes
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def openSignalsFile(file_path: str):
+    """_summary_
+    Opens a signals file for parsing. Compressed files (gzip, zstd, xz or bz2, identified
+    by their magic bytes) are returned as a buffered stream decompressed in a background thread.
+    Args:
+        file_path (str): The path of the signals file.
+    Returns:
+        str | io.BufferedReader: the file path of uncompressed files, or the decompressed stream.
+    """
+    compression = compressionFormat(file_path)
+    if compression is None:
+        return file_path
+    return io.BufferedReader(
+        DecompressionStream(file_path, compression),
+        buffer_size=DECOMPRESSION_BLOCK_SIZE,
+    )
+
+
+def _readCsvHeader(file_path: str) -> list:
+    compression = compressionFormat(file_path)
+    if compression is None:
+        return read_csv(file_path, header=0, nrows=0).columns.tolist()
+    # only the first line is needed: no need to decompress ahead
+    with _openCompressed(file_path, compression) as source:
+        return read_csv(source, header=0, nrows=0).columns.tolist()
+
+
+def _checkWindow(time_range: tuple = None, row_range: tuple = None):
+    if time_range is not None and row_range is not None:
+        raise ValueError(
+            "The analysis window can be selected either by time or by samples, not both."
+        )
+
+
+def _rowWindow(n_rows: int, row_range: tuple = None) -> tuple:
+    """_summary_
+    Computes the [start, stop) rows of the (start_row, stop_row) sample window.
+    """
+    if row_range is None:
+        return 0, n_rows
+    start, stop = row_range
+    start = 0 if start is None else min(max(int(start), 0), n_rows)
+    stop = n_rows if stop is None else min(max(int(stop), start), n_rows)
+    return start, stop
+
+
+def _searchTime(t, value: float, side: str = "left", absolute: bool = False) -> int:
+    """_summary_
+    Binary search of a time value in an increasing (possibly memory-mapped) time axis:
+    only O(log N) samples of the time axis are read.
+    If absolute is True, the search is made over the absolute values of the time axis.
+    """
+    if not absolute:
+        return int(np.searchsorted(t, value, side=side))
+    lo, hi = 0, len(t)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if abs(t[mid]) < value or (side == "right" and abs(t[mid]) == value):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _timeWindow(t, time_range: tuple = None, absolute: bool = False) -> tuple:
+    """_summary_
+    Computes the [start, stop) rows of the samples inside the [t_start, t_stop] time window.
+    """
+    t_start, t_stop = (None, None) if time_range is None else time_range
+    start = 0 if t_start is None else _searchTime(t, t_start, "left", absolute)
+    stop = len(t) if t_stop is None else _searchTime(t, t_stop, "right", absolute)
+    return start, max(start, stop)
+
+
+class _FileRange(io.RawIOBase):
+    """_summary_
+    Read-only binary stream of the [start, stop) byte range of a file.
+    """
+
+    def __init__(self, file_path: str, start: int, stop: int):
+        super().__init__()
+        self._fp = open(file_path, "rb")
+        self._fp.seek(start)
+        self._remaining = max(stop - start, 0)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n_bytes = min(len(buffer), self._remaining)
+        if n_bytes <= 0:
+            return 0
+        n_bytes = self._fp.readinto(memoryview(buffer)[:n_bytes])
+        self._remaining -= n_bytes
+        return n_bytes
+
+    def close(self):
+        if not self.closed:
+            self._fp.close()
+        super().close()
+
+
+def _csvTimeOffset(
+    fp, size: int, data_start: int, time_idx: int, value: float, strict: bool
+) -> int:
+    """_summary_
+    Binary search (over the byte offsets of a CSV file sorted by time) of the first row
+    whose time is >= value (or > value if strict). Only the time field of O(log N) rows is parsed.
+    Returns:
+        int: the byte offset of the row (size if no row was found).
+    """
+
+    def rowAt(offset: int) -> int:
+        # byte offset of the first row starting at (or after) offset
+        if offset <= data_start:
+            return data_start
+        fp.seek(offset - 1)
+        fp.readline()
+        return fp.tell()
+
+    def found(offset: int) -> bool:
+        row = rowAt(offset)
+        if row >= size:
+            return True
+        fp.seek(row)
+        t = float(fp.readline().split(b",")[time_idx].strip().strip(b'"'))
+        return t > value if strict else t >= value
+
+    lo, hi = data_start, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if found(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return min(rowAt(lo), size)
+
+
+def _csvRowOffset(fp, start: int, n_rows: int) -> int:
+    """_summary_
+    Returns the byte offset n_rows rows after the start offset, counting the line breaks
+    of the file (without parsing any field).
+    """
+    fp.seek(start)
+    offset = start
+    while n_rows > 0:
+        chunk = fp.read(CSV_RANGE_SIZE)
+        if not chunk:
             break
-    if ordered:
-        return signals[signals_columns_order].set_index(signals_columns_order[0])
+        n_breaks = chunk.count(b"\n")
+        if n_breaks < n_rows:
+            n_rows -= n_breaks
+            offset += len(chunk)
+            continue
+        position = -1
+        for _ in range(n_rows):
+            position = chunk.index(b"\n", position + 1)
+        return offset + position + 1
+    return offset
+
+
+def _csvWindow(
+    file_path: str,
+    header: list,
+    time_col: str,
+    time_range: tuple = None,
+    row_range: tuple = None,
+) -> tuple:
+    """_summary_
+    Computes the [start, stop) byte range of the rows of an uncompressed CSV file inside the
+    time (or sample) window, so that the rows outside the window are never parsed.
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, "rb") as fp:
+        fp.readline()
+        data_start = fp.tell()
+        start, stop = data_start, size
+        if row_range is not None:
+            row_start, row_stop = row_range
+            row_start = 0 if row_start is None else max(int(row_start), 0)
+            start = _csvRowOffset(fp, data_start, row_start)
+            if row_stop is not None:
+                stop = _csvRowOffset(fp, start, max(int(row_stop) - row_start, 0))
+        t_start, t_stop = _timeFilter(time_col, time_range)
+        time_idx = header.index(time_col) if time_col is not None else None
+        if t_start is not None:
+            start = _csvTimeOffset(fp, size, data_start, time_idx, t_start, False)
+        if t_stop is not None:
+            stop = _csvTimeOffset(fp, size, data_start, time_idx, t_stop, True)
+    return start, max(start, stop)
+
+
+def _parseCsvRange(
+    file_path: str,
+    start: int,
+    stop: int,
+    header: list,
+    selected: list,
+    dtypes: dict = None,
+) -> DataFrame:
+    with open(file_path, "rb") as fp:
+        fp.seek(start)
+        data = fp.read(stop - start)
+    return read_csv(
+        io.BytesIO(data), header=None, names=header, usecols=selected, dtype=dtypes
+    )
+
+
+def _readCsvNative(
+    file_path: str,
+    header: list,
+    selected: list,
+    dtypes: dict = None,
+    byte_range: tuple = None,
+) -> DataFrame:
+    """_summary_
+    Parses the selected columns of an (uncompressed) CSV file with the pandas C parser,
+    splitting the file (or the byte_range of its rows) into byte ranges at line boundaries
+    and parsing each range in a separate process. The parsed values are identical to those
+    of a single read_csv call.
+    NOTE: quoted fields spanning several lines are not supported.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with open(file_path, "rb") as fp:
+        fp.readline()
+        start, size = (
+            (fp.tell(), os.path.getsize(file_path))
+            if byte_range is None
+            else byte_range
+        )
+        bounds = [start]
+        n_ranges = int(np.ceil((size - bounds[0]) / CSV_RANGE_SIZE))
+        for idx in range(1, n_ranges):
+            fp.seek(max(bounds[0] + idx * CSV_RANGE_SIZE, bounds[-1]))
+            fp.readline()
+            if fp.tell() >= size:
+                break
+            bounds.append(fp.tell())
+    bounds.append(size)
+    n_workers = min(os.cpu_count() or 1, len(bounds) - 1)
+    if n_workers < 2:
+        if byte_range is not None:
+            return _parseCsvRange(file_path, start, size, header, selected, dtypes)
+        return read_csv(file_path, header=0, usecols=selected, dtype=dtypes)
+    n_ranges = len(bounds) - 1
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        blocks = list(
+            executor.map(
+                _parseCsvRange,
+                [file_path] * n_ranges,
+                bounds[:-1],
+                bounds[1:],
+                [header] * n_ranges,
+                [selected] * n_ranges,
+                [dtypes] * n_ranges,
+            )
+        )
+    return concat(blocks, ignore_index=True)
+
+
+def _readCsv(
+    file_path: str,
+    header: list,
+    selected: list,
+    engine: str,
+    dtypes: dict = None,
+    byte_range: tuple = None,
+) -> DataFrame:
+    """_summary_
+    Parses the selected columns of a (possibly compressed) CSV file with the chosen engine,
+    converting the columns in dtypes straight to their floating point type.
+    If byte_range is given, only the rows of the [start, stop) byte range of the (uncompressed) file are parsed.
+    """
+    compression = compressionFormat(file_path)
+    if byte_range is not None and byte_range[0] >= byte_range[1]:
+        # empty window
+        return DataFrame({col: np.array([], dtype=float) for col in selected})
+    if engine == ReaderEngines.NATIVE.value and compression is None:
+        return _readCsvNative(file_path, header, selected, dtypes, byte_range)
+    if engine == ReaderEngines.NATIVE.value:
+        # the byte ranges of a compressed file can not be decompressed independently
+        log.info(
+            f"\nThe native reader engine requires an uncompressed file: parsing {file_path} with the pandas engine."
+        )
+    if byte_range is not None:
+        source = io.BufferedReader(
+            _FileRange(file_path, *byte_range), buffer_size=DECOMPRESSION_BLOCK_SIZE
+        )
+    else:
+        source = openSignalsFile(file_path)
+    # the header line is not part of the byte range of the rows
+    names = None if byte_range is None else header
+    try:
+        if engine == ReaderEngines.PYARROW.value:
+            try:
+                from pyarrow import csv as arrow_csv
+            except ImportError:
+                raise ImportError(
+                    "The pyarrow reader engine requires pyarrow. Install it with: pip install pyarrow"
+                )
+            from pyarrow import from_numpy_dtype
+
+            column_types = {
+                col: from_numpy_dtype(dtype) for col, dtype in (dtypes or {}).items()
+            }
+            return arrow_csv.read_csv(
+                source,
+                read_options=arrow_csv.ReadOptions(
+                    use_threads=True, column_names=names
+                ),
+                convert_options=arrow_csv.ConvertOptions(
+                    include_columns=selected, column_types=column_types
+                ),
+            ).to_pandas()
+        return read_csv(
+            source,
+            header=0 if names is None else None,
+            names=names,
+            usecols=selected,
+            dtype=dtypes,
+        )
+    finally:
+        if not isinstance(source, str):
+            source.close()
+
+
+def _readRawHeader(file_path: str) -> dict:
+    """_summary_
+    Parses the text header of a SPICE binary rawfile (ngspice or LTspice).
+    The header is a list of "Key: value" lines followed by the table of variables:
+        Title: <title>
+        Plotname: Transient Analysis
+        Flags: real [forward] [double] [fastaccess] [compressed]
+        No. Variables: <N>
+        No. Points: <M>
+        Variables:
+            0   time    time
+            1   v(out)  voltage
+        Binary:
+    LTspice writes the header in UTF-16-LE, ngspice in ASCII.
+    Args:
+        file_path (str): The path of the rawfile.
+    Returns:
+        dict: the header fields, the variables (name, type) and the offset of the binary data.
+    """
+    with open(file_path, "rb") as fp:
+        head = fp.read(2)
+        encoding = "utf-16-le" if len(head) == 2 and head[1] == 0 else "latin-1"
+        fp.seek(0)
+        marker = "Binary:\n".encode(encoding)
+        raw_header = b""
+        while not (marker in raw_header):
+            chunk = fp.read(2**16)
+            if not chunk:
+                if "Values:\n".encode(encoding) in raw_header:
+                    raise ValueError(
+                        f"{file_path} is an ASCII rawfile. Only binary rawfiles are supported."
+                    )
+                raise ValueError(f"{file_path} is not a SPICE binary rawfile.")
+            raw_header += chunk
+    offset = raw_header.index(marker) + len(marker)
+    lines = raw_header[: offset - len(marker)].decode(encoding).splitlines()
+    header = {"variables": [], "offset": offset, "flags": []}
+    in_variables = False
+    for line in lines:
+        if in_variables and line.startswith(("\t", " ")):
+            tokens = line.split()
+            header["variables"].append((tokens[1], tokens[2]))
+            continue
+        in_variables = False
+        key, _, value = line.partition(":")
+        key = key.strip().lower()
+        if key == "flags":
+            header["flags"] = value.lower().split()
+        elif key == "no. variables":
+            header["n_variables"] = int(value)
+        elif key == "no. points":
+            header["n_points"] = int(value)
+        elif key == "variables":
+            in_variables = True
+    if not ("real" in header["flags"]):
+        raise ValueError(
+            f"{file_path}: only real (transient) rawfiles are supported. Flags: {header['flags']}"
+        )
+    if len(header["variables"]) != header["n_variables"]:
+        raise ValueError(f"{file_path}: corrupted table of variables.")
+    return header
+
+
+def readRawSignals(
+    file_path: str = None,
+    columns: list = None,
+    time_range: tuple = None,
+    row_range: tuple = None,
+) -> DataFrame:
+    """_summary_
+    Reads the traces of a SPICE binary rawfile (ngspice or LTspice) through numpy.memmap.
+    The traces are zero-copy (strided) views of the memory-mapped file, so they are only
+    paged in from disk when accessed (e.g. by the FFT of the selected signal).
+    NOTE: ngspice stores every value as float64. LTspice stores the time axis as float64 and
+    the remaining traces as float32 (unless the "double" flag is set), and marks compressed
+    points with a negative time value, which is restored to its absolute value.
+    Args:
+        file_path (str, optional): The path of the rawfile. Defaults to None.
+        columns (list, optional): The names of the traces to read. The time trace is always kept.
+                                    Defaults to None (read all the traces).
+        time_range (tuple, optional): The (t_start, t_stop) time window of the points to keep (in seconds),
+                                    found by a binary search over the memory-mapped time trace. Defaults to None.
+        row_range (tuple, optional): The (start, stop) window of the points to keep. Defaults to None.
+    Returns:
+        DataFrame: the traces of the rawfile, indexed by the time trace.
+    """
+    _checkWindow(time_range, row_range)
+    if file_path is None:
+        raise ValueError("The file path was not provided.")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found.")
+    header = _readRawHeader(file_path)
+    names = [name for name, _ in header["variables"]]
+    types = [var_type for _, var_type in header["variables"]]
+    selected, time_col = _selectColumns(names, columns)
+    if "time" in types:
+        # the time trace is identified by its variable type
+        time_col = names[types.index("time")]
+        selected = [time_col] + [name for name in selected if name != time_col]
+    ltspice = "forward" in header["flags"] or "backward" in header["flags"]
+    single = ltspice and not ("double" in header["flags"])
+    dtypes = [
+        np.dtype("<f8") if (not single) or (var_type == "time") else np.dtype("<f4")
+        for var_type in types
+    ]
+    n_points = header["n_points"]
+    traces = {}
+    if "fastaccess" in header["flags"]:
+        # column-major layout: all the points of each variable are contiguous
+        offset = header["offset"]
+        for name, dtype in zip(names, dtypes):
+            if name in selected:
+                traces[name] = np.memmap(
+                    file_path, dtype=dtype, mode="r", offset=offset, shape=(n_points,)
+                )
+            offset += dtype.itemsize * n_points
+    else:
+        # row-major layout: one record with all the variables per point
+        record = np.dtype([(f"v{idx}", dtype) for idx, dtype in enumerate(dtypes)])
+        table = np.memmap(
+            file_path,
+            dtype=record,
+            mode="r",
+            offset=header["offset"],
+            shape=(n_points,),
+        )
+        for idx, name in enumerate(names):
+            if name in selected:
+                traces[name] = table[f"v{idx}"]
+    compressed = "compressed" in header["flags"]
+    if time_col is not None and time_range is not None:
+        start, stop = _timeWindow(traces[time_col], time_range, absolute=compressed)
     else:
+        start, stop = _rowWindow(n_points, row_range)
+    # only the analysis window of the memory-mapped traces is ever paged in
+    traces = {name: trace[start:stop] for name, trace in traces.items()}
+    data = {name: traces[name] for name in selected if name != time_col}
+    signals = DataFrame(data, columns=list(data.keys()), copy=False)
+    if time_col is not None:
+        time = traces[time_col]
+        signals.index = np.abs(time) if compressed else time
+        signals.index.name = time_col
+    return signals
+
+
+def _arrowDataset(file_path: str, file_format: str):
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError(
+            f"Reading {file_format} files requires pyarrow. Install it with: pip install pyarrow"
+        )
+    return ds.dataset(
+        file_path, format="parquet" if file_format == "parquet" else "ipc"
+    )
+
+
+def readSchema(file_path: str) -> list:
+    """_summary_
+    Reads the column names of a Parquet, Arrow IPC (Feather) or HDF5 signals file
+    from its schema metadata, without loading any data.
+    Args:
+        file_path (str): The path of the signals file.
+    Returns:
+        list: the column names of the file (including the stored index, if named).
+    """
+    file_format = fileFormat(file_path)
+    if file_format == "hdf5":
+        from pandas import HDFStore
+
+        with HDFStore(file_path, mode="r") as store:
+            empty = store.select(store.keys()[0], start=0, stop=0)
+        return ([empty.index.name] if bool(empty.index.name) else []) + list(
+            empty.columns
+        )
+    if file_format in ["parquet", "feather"]:
+        names = _arrowDataset(file_path, file_format).schema.names
+        # unnamed indexes stored by pandas are not signals
+        return [name for name in names if not name.startswith("__index_level_")]
+    raise ValueError(f"{file_path} is not a Parquet, Arrow IPC or HDF5 file.")
+
+
+def _timeFilter(time_col: str, time_range: tuple) -> tuple:
+    if time_col is None or time_range is None:
+        return None, None
+    return time_range
+
+
+def _arrowRows(file_path: str, file_format: str, selected: list, row_range: tuple):
+    """_summary_
+    Reads the (start, stop) rows of the selected columns of a Parquet or Arrow IPC file,
+    decoding only the Parquet row groups (or the memory-mapped IPC record batches) that overlap them.
+    Returns:
+        pyarrow.Table: the rows of the selected columns.
+    """
+    _arrowDataset(file_path, file_format)
+    import pyarrow as pa
+
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        source = pq.ParquetFile(file_path)
+        counts = [
+            source.metadata.row_group(idx).num_rows
+            for idx in range(source.num_row_groups)
+        ]
+
+        def read(groups):
+            return source.read_row_groups(groups, columns=selected)
+
+    else:
+        source = pa.ipc.open_file(pa.memory_map(file_path, "r"))
+        counts = [
+            source.get_batch(idx).num_rows for idx in range(source.num_record_batches)
+        ]
+
+        def read(groups):
+            return pa.Table.from_batches(
+                [source.get_batch(idx) for idx in groups], schema=source.schema
+            ).select(selected)
+
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(int)
+    start, stop = _rowWindow(int(offsets[-1]), row_range)
+    groups = [
+        idx
+        for idx in range(len(counts))
+        if offsets[idx + 1] > start and offsets[idx] < stop
+    ]
+    if not bool(groups):
+        schema = source.schema_arrow if file_format == "parquet" else source.schema
+        return schema.empty_table().select(selected)
+    return read(groups).slice(start - offsets[groups[0]], stop - start)
+
+
+def _tableBlocks(
+    file_path: str,
+    selected: list,
+    time_col: str,
+    time_range: tuple = None,
+    chunk_size: int = None,
+    row_range: tuple = None,
+):
+    """_summary_
+    Reads the selected columns of a Parquet, Arrow IPC (Feather) or HDF5 file, pushing the
+    column projection and the time (or row) window down into the file format reader.
+    Yields:
+        DataFrame: the whole table (chunk_size=None), or blocks of at most chunk_size rows.
+    """
+    file_format = fileFormat(file_path)
+    t_start, t_stop = _timeFilter(time_col, time_range)
+    if file_format in ["parquet", "feather"] and row_range is not None:
+        table = _arrowRows(file_path, file_format, selected, row_range)
+        if chunk_size is None:
+            yield table.to_pandas()
+        else:
+            for batch in table.to_batches(max_chunksize=chunk_size):
+                if batch.num_rows > 0:
+                    yield batch.to_pandas()
+        return
+    if file_format in ["parquet", "feather"]:
+        import pyarrow.dataset as ds
+
+        dataset = _arrowDataset(file_path, file_format)
+        row_filter = None
+        if t_start is not None:
+            row_filter = ds.field(time_col) >= t_start
+        if t_stop is not None:
+            stop_filter = ds.field(time_col) <= t_stop
+            row_filter = stop_filter if row_filter is None else row_filter & stop_filter
+        if chunk_size is None:
+            yield dataset.to_table(columns=selected, filter=row_filter).to_pandas()
+        else:
+            for batch in dataset.to_batches(
+                columns=selected, filter=row_filter, batch_size=chunk_size
+            ):
+                if batch.num_rows > 0:
+                    yield batch.to_pandas()
+        return
+    from pandas import HDFStore
+
+    with HDFStore(file_path, mode="r") as store:
+        key = store.keys()[0]
+        index_name = store.select(key, start=0, stop=0).index.name
+        target = "index" if time_col == index_name else f"{time_col}"
+        where = []
+        if t_start is not None:
+            where.append(f"{target} >= {t_start!r}")
+        if t_stop is not None:
+            where.append(f"{target} <= {t_stop!r}")
+        data_columns = [col for col in selected if col != index_name]
+        start, stop = (None, None) if row_range is None else row_range
+        try:
+            blocks = store.select(
+                key,
+                where=where if bool(where) else None,
+                start=start,
+                stop=stop,
+                columns=data_columns,
+                chunksize=chunk_size,
+            )
+            blocks = [blocks] if chunk_size is None else blocks
+        except (ValueError, TypeError, SyntaxError, NotImplementedError):
+            # fixed format stores (or non-queryable time columns) are filtered after reading
+            signals = store.select(key, start=start, stop=stop)
+            signals = (
+                signals.reset_index()
+                if time_col == index_name and bool(index_name)
+                else signals
+            )[selected]
+            if t_start is not None:
+                signals = signals[signals[time_col] >= t_start]
+            if t_stop is not None:
+                signals = signals[signals[time_col] <= t_stop]
+            blocks = (
+                [signals]
+                if chunk_size is None
+                else [
+                    signals.iloc[row : row + chunk_size]
+                    for row in range(0, len(signals), chunk_size)
+                ]
+            )
+        for block in blocks:
+            yield block
+
+
+def _indexSignals(signals: DataFrame, selected: list, time_col: str) -> DataFrame:
+    """_summary_
+    Places the time column as the index of a block of signals, keeping the selected columns order.
+    """
+    if time_col is not None and time_col in signals.columns:
+        return signals[selected].set_index(time_col)
+    if time_col is not None:
+        # the time column was restored as the index by the file format reader
+        return signals[[col for col in selected if col != time_col]]
+    return signals[selected]
+
+
+def _sliceWindow(
+    signals: DataFrame, time_range: tuple = None, row_range: tuple = None
+) -> DataFrame:
+    """_summary_
+    Keeps the rows of the signals inside the [t_start, t_stop] time window
+    (binary search over the time index), or inside the (start, stop) rows window.
+    """
+    if row_range is not None:
+        start, stop = _rowWindow(len(signals), row_range)
+        return signals.iloc[start:stop]
+    t_start, t_stop = _timeFilter(signals.index.name, time_range)
+    if t_start is None and t_stop is None:
         return signals
+    start, stop = _timeWindow(signals.index.values, (t_start, t_stop))
+    return signals.iloc[start:stop]
+
+
+def _castSignals(signals: DataFrame, dtype: np.dtype = None) -> DataFrame:
+    """_summary_
+    Converts the signals (but not the time index) to the floating point type dtype.
+    """
+    if dtype is None:
+        return signals
+    return signals.astype(dtype, copy=False)
+
+
+def analysisWindow(
+    t_start: str = None,
+    t_stop: str = None,
+    start_sample: int = None,
+    n_samples: int = None,
+) -> tuple:
+    """_summary_
+    Builds the time (or rows) window of the analysis from the command line arguments.
+    Args:
+        t_start (str, optional): The start time of the window (e.g. "10 u" or "1e-5"). Defaults to None.
+        t_stop (str, optional): The stop time of the window (e.g. "20 u" or "2e-5"). Defaults to None.
+        start_sample (int, optional): The index of the first sample of the window. Defaults to None.
+        n_samples (int, optional): The number of samples of the window. Defaults to None.
+    Returns:
+        tuple(tuple, tuple): the (t_start, t_stop) time range and the (start, stop) rows range
+                            (None if not selected).
+    """
+
+    def toTime(value: str) -> float:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return stof(value)
+
+    time_range, row_range = None, None
+    if t_start is not None or t_stop is not None:
+        time_range = (toTime(t_start), toTime(t_stop))
+    if start_sample is not None or n_samples is not None:
+        start = 0 if start_sample is None else start_sample
+        row_range = (start, None if n_samples is None else start + n_samples)
+    _checkWindow(time_range, row_range)
+    return time_range, row_range
+
+
+def readSignals(
+    file_path: str = None,
+    columns: list = None,
+    use_cache: bool = True,
+    time_range: tuple = None,
+    engine: str = ReaderEngines.PANDAS.value,
+    dtype: np.dtype = None,
+    row_range: tuple = None,
+) -> DataFrame:
+    """_summary_
+    Reads a time series table data into a pandas DataFrame and returns it.
+    The loader is chosen from the file extension: SPICE binary rawfiles (.raw) are memory-mapped
+    (see readRawSignals), Parquet (.parquet), Arrow IPC/Feather (.feather, .arrow) and HDF5 (.h5, .hdf5)
+    files are read with the column projection and the time range pushed down into the format reader,
+    and any other file is parsed as a CSV file. Compressed CSV files (gzip, zstd, xz or bz2) are
+    decompressed on the fly, in a background thread feeding the parser (see DecompressionStream).
+    Args:
+        file_path (str | list, optional): The file path of the Comma Separated Values (.CSV) file generated by Cadence (or other EDA software),
+                                    or of a rawfile, Parquet, Arrow IPC or HDF5 waveform file. An ordered list of paths (or a glob pattern)
+                                    of the segment files of a single record is read as one record (see streamSegments). Defaults to None.
+        columns (list, optional): The names of the signals to parse. The time column is always kept.
+                                    Defaults to None (parse all the signals).
+        use_cache (bool, optional): If True, the parsed columns are memory-mapped from (and stored into)
+                                    the binary signals cache (see dycifer.cache). Defaults to True.
+        time_range (tuple, optional): The (t_start, t_stop) time window of the rows to keep (in seconds).
+                                    Any of the limits can be None. Defaults to None (keep all the rows).
+        engine (str, optional): The CSV parsing engine: "pandas" (single-threaded C parser), "pyarrow"
+                                    (multithreaded Arrow parser) or "native" (pandas C parser running in parallel
+                                    over byte ranges of the file, yielding the same values as "pandas").
+                                    NOTE: the Arrow parser rounds decimal numbers exactly (as float_precision="round_trip"),
+                                    so its values may differ from the pandas parser in the last bit. Defaults to "pandas".
+        dtype (np.dtype, optional): The floating point type of the signals (e.g. np.float32 to halve their memory).
+                                    The time column is always kept in double precision. Defaults to None (as parsed).
+        row_range (tuple, optional): The (start, stop) window of the rows (samples) to keep, as an alternative
+                                    to the time_range. Any of the limits can be None. Defaults to None (keep all the rows).
+        NOTE: the rows outside the time (or rows) window are skipped before parsing: through a binary search over the
+        memory-mapped time column of rawfiles and cached signals, by decoding only the overlapping row groups (Parquet),
+        record batches (Arrow IPC) or rows (HDF5), and, for uncompressed CSV files, through a binary search over the
+        byte offsets of the rows (parsing only their time field) or by counting the line breaks of the skipped rows.
+    Returns:
+        DataFrame: the pandas DataFrame containing the time series data with all the correspondant signals.
+                    Segment files are never gathered into a single DataFrame: their stitched record is returned
+                    as a re-iterable stream of blocks (see streamSegments and Reiterable), consumed block by block
+                    by the evaluators (use collectSignals to gather it).
+    """
+    if file_path is None:
+        raise ValueError("The file path was not provided.")
+    if isSegmented(file_path):
+        # the segments are stitched while streaming, at each pass over the record
+        return Reiterable(
+            _castSegments,
+            file_path,
+            columns,
+            dtype=dtype,
+            use_cache=use_cache,
+            time_range=time_range,
+            row_range=row_range,
+        )
+    if not isinstance(file_path, str):
+        file_path = segmentFiles(file_path)[0]
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found.")
+    _checkWindow(time_range, row_range)
+    signals = None
+    file_format = fileFormat(file_path)
+    if file_format != "csv" and compressionFormat(file_path) is not None:
+        raise ValueError(
+            f"{file_path}: only CSV signals files can be parsed from a compressed file."
+        )
+    if file_format == "raw":
+        signals = readRawSignals(file_path, columns, time_range, row_range)
+        return _castSignals(signals, dtype)
+    if file_format in ["parquet", "feather", "hdf5"]:
+        selected, time_col = _selectColumns(readSchema(file_path), columns)
+        signals = next(
+            _tableBlocks(file_path, selected, time_col, time_range, row_range=row_range)
+        )
+        return _castSignals(_indexSignals(signals, selected, time_col), dtype)
+    if not (engine in [elem.value for elem in ReaderEngines]):
+        raise ValueError(
+            f"{engine} is not a valid reader engine. Possible engines are: {[elem.value for elem in ReaderEngines]}."
+        )
+    if use_cache:
+        signals = loadCachedSignals(file_path, columns)
+        if signals is not None:
+            return _castSignals(_sliceWindow(signals, time_range, row_range), dtype)
+    try:
+        header = _readCsvHeader(file_path)
+    except Exception as e:
+        tb.format_exc()
+        return None
+    selected, time_col = _selectColumns(header, columns)
+    dtypes = (
+        None if dtype is None else {col: dtype for col in selected if col != time_col}
+    )
+    byte_range = None
+    if time_range is not None or row_range is not None:
+        if compressionFormat(file_path) is not None:
+            # compressed files can only be read sequentially: keep only the window of each block
+            return collectSignals(
+                streamSignals(
+                    file_path,
+                    columns,
+                    use_cache=False,
+                    time_range=time_range,
+                    row_range=row_range,
+                ),
+                dtype=dtype,
+            )
+        byte_range = _csvWindow(file_path, header, time_col, time_range, row_range)
+    try:
+        signals = _readCsv(file_path, header, selected, engine, dtypes, byte_range)
+    except ImportError:
+        raise
+    except Exception as e:
+        tb.format_exc()
+        return None
+    # place the time column in the first column of the DataFrame
+    if time_col is not None:
+        signals = signals[selected].set_index(time_col)
+    else:
+        signals = signals[selected]
+    if use_cache and dtype is None and byte_range is None:
+        # only the (whole) signals parsed in their original precision are cached
+        try:
+            storeCachedSignals(file_path, signals, header)
+        except Exception as e:
+            log.warning(f"\nCould not cache the signals of {file_path}: {e}")
+    # the window limits are checked against the time values parsed by the engine
+    return _sliceWindow(signals, time_range)
+
+
+def streamSignals(
+    file_path: str = None,
+    columns: list = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_cache: bool = True,
+    time_range: tuple = None,
+    row_range: tuple = None,
+):
+    """_summary_
+    Streams a time series table in blocks of a fixed number of rows, parsing only the selected signals.
+    The peak memory of the reader depends on the selected columns and on the chunk size, and not on the
+    width or the length of the file.
+    Args:
+        file_path (str | list, optional): The file path of the Comma Separated Values (.CSV) file
+                                    (or of a SPICE binary rawfile), compressed or not, or the ordered paths
+                                    (or a glob pattern) of the segment files of a record. Defaults to None.
+        columns (list, optional): The names of the signals to parse. The time column is always kept.
+                                    Defaults to None (parse all the signals).
+        chunk_size (int, optional): The number of rows of each block. Defaults to DEFAULT_CHUNK_SIZE.
+        use_cache (bool, optional): If True and the signals are cached, the blocks are sliced from the
+                                    memory-mapped cache instead of parsed. Defaults to True.
+        time_range (tuple, optional): The (t_start, t_stop) time window of the rows to keep (in seconds).
+                                    Defaults to None (keep all the rows).
+        row_range (tuple, optional): The (start, stop) window of the rows (samples) to keep. Defaults to None.
+                                    The rows outside the window are skipped as in readSignals.
+    Yields:
+        DataFrame: blocks of the time series data, indexed by the time column (if found).
+    """
+    if file_path is None:
+        raise ValueError("The file path was not provided.")
+    if isSegmented(file_path):
+        yield from streamSegments(
+            file_path,
+            columns,
+            chunk_size=chunk_size,
+            use_cache=use_cache,
+            time_range=time_range,
+            row_range=row_range,
+        )
+        return
+    if not isinstance(file_path, str):
+        file_path = segmentFiles(file_path)[0]
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found.")
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be a positive number of rows: {chunk_size}")
+    _checkWindow(time_range, row_range)
+    signals = None
+    file_format = fileFormat(file_path)
+    if file_format != "csv" and compressionFormat(file_path) is not None:
+        raise ValueError(
+            f"{file_path}: only CSV signals files can be parsed from a compressed file."
+        )
+    if file_format in ["parquet", "feather", "hdf5"]:
+        selected, time_col = _selectColumns(readSchema(file_path), columns)
+        for block in _tableBlocks(
+            file_path,
+            selected,
+            time_col,
+            time_range,
+            chunk_size=chunk_size,
+            row_range=row_range,
+        ):
+            yield _indexSignals(block, selected, time_col)
+        return
+    if file_format == "raw":
+        signals = readRawSignals(file_path, columns, time_range, row_range)
+    elif use_cache:
+        signals = loadCachedSignals(file_path, columns)
+        if signals is not None:
+            signals = _sliceWindow(signals, time_range, row_range)
+    if signals is not None:
+        for start in range(0, len(signals), chunk_size):
+            yield signals.iloc[start : start + chunk_size]
+        return
+    header = _readCsvHeader(file_path)
+    selected, time_col = _selectColumns(header, columns)
+    t_stop = _timeFilter(time_col, time_range)[1]
+    names, skiprows, nrows = None, None, None
+    if compressionFormat(file_path) is None and (
+        time_range is not None or row_range is not None
+    ):
+        byte_range = _csvWindow(file_path, header, time_col, time_range, row_range)
+        if byte_range[0] >= byte_range[1]:
+            return
+        source = io.BufferedReader(
+            _FileRange(file_path, *byte_range), buffer_size=DECOMPRESSION_BLOCK_SIZE
+        )
+        # the header line is not part of the byte range of the rows
+        names = header
+    else:
+        source = openSignalsFile(file_path)
+        if row_range is not None:
+            # skipped rows are tokenized, but never converted
+            start = 0 if row_range[0] is None else max(int(row_range[0]), 0)
+            skiprows = range(1, start + 1)
+            nrows = None if row_range[1] is None else max(int(row_range[1]) - start, 0)
+    empty_window, sliced = time_range is not None, None
+    try:
+        if nrows == 0:
+            return
+        for block in read_csv(
+            source,
+            header=0 if names is None else None,
+            names=names,
+            usecols=selected,
+            skiprows=skiprows,
+            nrows=nrows,
+            chunksize=chunk_size,
+        ):
+            block = _indexSignals(block, selected, time_col)
+            if time_range is not None:
+                sliced = _sliceWindow(block, time_range)
+                if len(sliced) > 0:
+                    empty_window = False
+                    yield sliced
+                if t_stop is not None and len(block) > 0 and block.index[-1] > t_stop:
+                    # the remaining rows are past the time window
+                    break
+                continue
+            yield block
+        if empty_window and sliced is not None:
+            # no rows inside the time window: yield a single empty block
+            yield sliced
+    finally:
+        if not isinstance(source, str):
+            source.close()
+
+
+class Reiterable:
+    """_summary_
+    Iterable whose blocks are produced anew by calling its factory at each iteration, so a record
+    can be read in several passes (e.g. Reiterable(streamSignals, file_path, chunk_size=...) streams
+    the file again at each pass) while only one block at a time is held in memory.
+    Args:
+        factory (callable): The function returning an iterator over the blocks.
+        *args, **kwargs: The arguments of the factory.
+    """
+
+    def __init__(self, factory, *args, **kwargs):
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        return iter(self.factory(*self.args, **self.kwargs))
+
+
+def isReiterable(blocks) -> bool:
+    """_summary_
+    Checks if the signals (or blocks of signals) can be iterated more than once.
+    Args:
+        blocks (iterable): A DataFrame, a list (or tuple) of blocks, a Reiterable or a one-shot iterator.
+    Returns:
+        bool: False for one-shot iterators (e.g. generators).
+    """
+    return isinstance(blocks, (DataFrame, list, tuple, Reiterable))
+
+
+def countSamples(blocks) -> int:
+    """_summary_
+    Counts the samples of streamed blocks of signals, in a pass over the blocks.
+    Args:
+        blocks (iterable): The blocks of signals (DataFrames or arrays).
+    Returns:
+        int: the number of samples of the record.
+    """
+    return sum([len(block) for block in blocks])
+
+
+def segmentFiles(file_paths) -> list:
+    """_summary_
+    Expands the ordered paths (or glob patterns) of the segment files of a record.
+    The files matched by each glob pattern are sorted by name (with the digits of the
+    names compared as numbers, so that "run_10.csv" comes after "run_9.csv").
+    Args:
+        file_paths (str | list): A path, a glob pattern, or an ordered list of paths and glob patterns.
+    Returns:
+        list: the ordered paths of the segment files.
+    """
+    import re
+    import glob
+
+    def naturalKey(path: str) -> list:
+        return [
+            int(token) if token.isdigit() else token
+            for token in re.split(r"(\d+)", path)
+        ]
+
+    file_paths = [file_paths] if isinstance(file_paths, str) else list(file_paths)
+    segments = []
+    for file_path in file_paths:
+        if os.path.exists(file_path) or not glob.has_magic(file_path):
+            segments.append(file_path)
+            continue
+        matches = sorted(glob.glob(file_path), key=naturalKey)
+        if not bool(matches):
+            raise FileNotFoundError(f"No files match {file_path}.")
+        segments += matches
+    return segments
+
+
+def isSegmented(file_paths) -> bool:
+    """_summary_
+    Checks if the signals are stored in several segment files (a list of paths or a glob pattern).
+    """
+    if isinstance(file_paths, str):
+        import glob
+
+        return not os.path.exists(file_paths) and glob.has_magic(file_paths)
+    return len(file_paths) > 1 or any([isSegmented(path) for path in file_paths])
+
+
+def streamSegments(
+    file_paths,
+    columns: list = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_cache: bool = True,
+    time_range: tuple = None,
+    row_range: tuple = None,
+    gap_tolerance: float = SEGMENT_GAP_TOLERANCE,
+):
+    """_summary_
+    Streams the segment files of a record (one per save interval or per restarted run) as a single
+    logical record, one block at a time, without ever concatenating the segments in memory.
+    At each boundary between segments:
+        - the signals of both segments must match;
+        - the rows of the next segment overlapping the previous segment (t <= last time of the
+            previous segment, e.g. re-simulated by a restarted run) are dropped;
+        - a gap larger than gap_tolerance times the time step around the boundary raises a ValueError.
+    Args:
+        file_paths (str | list): The ordered paths (or glob patterns) of the segment files (see segmentFiles).
+        columns (list, optional): The names of the signals to parse. Defaults to None (parse all the signals).
+        chunk_size (int, optional): The number of rows of each block. Defaults to DEFAULT_CHUNK_SIZE.
+        use_cache (bool, optional): If True, the cached segments are sliced from the cache. Defaults to True.
+        time_range (tuple, optional): The (t_start, t_stop) time window of the record. Defaults to None.
+        row_range (tuple, optional): The (start, stop) rows window of the (stitched) record. Defaults to None.
+        gap_tolerance (float, optional): The largest gap between segments, in time steps. Defaults to SEGMENT_GAP_TOLERANCE.
+    Yields:
+        DataFrame: blocks of the stitched record, indexed by the time column (if found).
+    """
+    _checkWindow(time_range, row_range)
+    segments = segmentFiles(file_paths)
+    if not bool(segments):
+        raise ValueError("No segment files were provided.")
+    row_start, row_stop = (0, None) if row_range is None else row_range
+    row_start = 0 if row_start is None else max(int(row_start), 0)
+    previous = (
+        None  # (file path, signals, last time, last time step) of the previous segment
+    )
+    row = 0  # index of the next row of the record
+    for segment in segments:
+        first_block = True
+        for block in streamSignals(
+            segment,
+            columns=columns,
+            chunk_size=chunk_size,
+            use_cache=use_cache,
+            time_range=time_range,
+        ):
+            if len(block) == 0:
+                continue
+            if first_block and previous is not None:
+                first_block = False
+                prev_path, prev_columns, t_last, dt_last = previous
+                if list(block.columns) != prev_columns:
+                    raise ValueError(
+                        f"The signals of {segment} {list(block.columns)} do not match the signals of {prev_path} {prev_columns}."
+                    )
+                if bool(block.index.name) and t_last is not None:
+                    t = block.index.values
+                    overlap = np.searchsorted(t, t_last, side="right")
+                    if overlap > 0:
+                        log.info(
+                            f"\nDropping {overlap} rows of {segment} overlapping {prev_path} (t <= {t_last})."
+                        )
+                        block = block.iloc[overlap:]
+                        if len(block) == 0:
+                            # the whole block overlaps: check the next one
+                            first_block = True
+                            continue
+                    gap = block.index.values[0] - t_last
+                    dt_next = (
+                        block.index.values[1] - block.index.values[0]
+                        if len(block) > 1
+                        else gap
+                    )
+                    if gap > gap_tolerance * max(dt_last, dt_next):
+                        raise ValueError(
+                            f"Time gap of {gap} s between {prev_path} (t = {t_last}) and {segment} (t = {block.index.values[0]})."
+                        )
+            first_block = False
+            # keep the last time (and time step) of the record to check the next boundary
+            t_last, dt_last = None, None
+            if bool(block.index.name):
+                t = block.index.values
+                t_last = t[-1]
+                if len(t) > 1:
+                    dt_last = t[-1] - t[-2]
+                elif previous is not None and previous[3] is not None:
+                    dt_last = previous[3]
+                else:
+                    dt_last = 0.0
+            previous = (segment, list(block.columns), t_last, dt_last)
+            # rows window over the stitched record
+            start = min(max(row_start - row, 0), len(block))
+            stop = (
+                len(block)
+                if row_stop is None
+                else min(max(row_stop - row, 0), len(block))
+            )
+            row += len(block)
+            if start < stop:
+                yield block.iloc[start:stop]
+            if row_stop is not None and row >= row_stop:
+                return
+
+
+def _castSegments(file_paths, columns: list = None, dtype: np.dtype = None, **kwargs):
+    for block in streamSegments(file_paths, columns, **kwargs):
+        yield _castSignals(block, dtype)
+
+
+def collectSignals(blocks, columns: list = None, dtype: np.dtype = None) -> DataFrame:
+    """_summary_
+    Gathers the blocks of a streamed time series into a single DataFrame, keeping only the selected signals.
+    Only the numeric arrays of the selected columns are accumulated, so the peak memory depends
+    on the selected signals and not on the width of the streamed blocks.
+    Args:
+        blocks (iterable): The DataFrame blocks yielded by streamSignals (or a DataFrame).
+        columns (list, optional): The names of the signals to keep. Defaults to None (keep all signals).
+        dtype (np.dtype, optional): The floating point type of the gathered signals. Defaults to None (as streamed).
+    Returns:
+        DataFrame: the time series data with the selected signals.
+    """
+    if isinstance(blocks, DataFrame):
+        if columns is None:
+            return _castSignals(blocks, dtype)
+        return _castSignals(blocks[[col for col in columns if bool(col)]], dtype)
+    index_name = None
+    names = None
+    index_parts = []
+    column_parts = {}
+    for block in blocks:
+        if names is None:
+            names = (
+                list(block.columns)
+                if columns is None
+                else [col for col in columns if bool(col)]
+            )
+            for col in names:
+                if not (col in block.columns):
+                    raise ValueError(f"{col} does not belong to the parsed signals.")
+            index_name = block.index.name
+            column_parts = {col: [] for col in names}
+        index_parts.append(block.index.values)
+        for col in names:
+            # copy the column so that the (wider) block can be released
+            column_parts[col].append(np.array(block[col].values, dtype=dtype))
+    if names is None:
+        raise ValueError("No signals were streamed.")
+    data = {col: np.concatenate(parts) for col, parts in column_parts.items()}
+    signals = DataFrame(data, columns=names, copy=False)
+    if bool(index_name):
+        signals.index = np.concatenate(index_parts)
+        signals.index.name = index_name
+    return signals
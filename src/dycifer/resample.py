@@ -0,0 +1,262 @@
+import numpy as np
+from loguru import logger as log
+from pandas import DataFrame, concat
+from enum import Enum
+from itertools import chain
+
+# maximum relative deviation of the time steps of a grid considered uniform
+GRID_TOLERANCE = 0.05
+
+
+class Interpolations(Enum):
+    """_summary_
+
+    Args:
+        LINEAR (str): Linear interpolation between the simulated time steps
+        CUBIC (str): Cubic (Catmull-Rom Hermite) interpolation between the simulated time steps
+        HOLD (str): Sample-and-hold (zero order hold) of the last simulated time step
+    """
+
+    LINEAR = "linear"
+    CUBIC = "cubic"
+    HOLD = "hold"
+
+
+def isUniformGrid(t: np.ndarray, tolerance: float = GRID_TOLERANCE) -> bool:
+    """_summary_
+    Checks (in a single vectorized pass) if a time axis has uniform time steps.
+    Args:
+        t (np.ndarray): The time axis.
+        tolerance (float, optional): The maximum relative deviation of each time step
+                                    from the average time step. Defaults to GRID_TOLERANCE.
+    Returns:
+        bool: True if the time axis is uniform.
+    """
+    if len(t) < 3:
+        return True
+    dt = np.diff(t)
+    mean_dt = (t[-1] - t[0]) / (len(t) - 1)
+    return bool(np.max(np.abs(dt - mean_dt)) <= tolerance * mean_dt)
+
+
+def interpolate(
+    t: np.ndarray, x: np.ndarray, t_new: np.ndarray, method: str = "linear"
+) -> np.ndarray:
+    """_summary_
+    Interpolates the samples of one or more signals onto a new time axis.
+    Args:
+        t (np.ndarray): The (increasing, possibly non-uniform) time axis of the samples.
+        x (np.ndarray): The samples (n_samples,) or (n_samples, n_signals).
+        t_new (np.ndarray): The new time axis, inside [t[0], t[-1]].
+        method (str, optional): "linear", "cubic" or "hold". Defaults to "linear".
+    Returns:
+        np.ndarray: the samples of the signals at the new time axis.
+    """
+    if not (method in [elem.value for elem in Interpolations]):
+        raise ValueError(
+            f"{method} is not a valid interpolation. Possible interpolations are: {[elem.value for elem in Interpolations]}."
+        )
+    x = np.asarray(x)
+    columns = x.reshape(len(x), -1)
+    # index of the simulated time step preceding each new time stamp
+    idx = np.clip(np.searchsorted(t, t_new, side="right") - 1, 0, len(t) - 1)
+    if method == Interpolations.HOLD.value:
+        return columns[idx].reshape((len(t_new),) + x.shape[1:])
+    idx = np.minimum(idx, len(t) - 2)
+    # interpolated samples keep the floating point type (precision) of the signals
+    dtype = columns.dtype if columns.dtype.kind == "f" else np.dtype(np.float64)
+    h = t[idx + 1] - t[idx]
+    u = ((t_new - t[idx]) / h).astype(dtype)[:, None]
+    x0, x1 = columns[idx], columns[idx + 1]
+    if method == Interpolations.LINEAR.value:
+        result = x0 + u * (x1 - x0)
+    else:
+        # Catmull-Rom slopes over the non-uniform grid (one-sided at the ends)
+        slopes = np.empty_like(columns, dtype=dtype)
+        slopes[1:-1] = (columns[2:] - columns[:-2]) / (t[2:] - t[:-2])[:, None]
+        slopes[0] = (columns[1] - columns[0]) / (t[1] - t[0])
+        slopes[-1] = (columns[-1] - columns[-2]) / (t[-1] - t[-2])
+        h = h.astype(dtype)[:, None]
+        m0, m1 = slopes[idx] * h, slopes[idx + 1] * h
+        u2 = u * u
+        u3 = u2 * u
+        result = (
+            (2 * u3 - 3 * u2 + 1) * x0
+            + (u3 - 2 * u2 + u) * m0
+            + (-2 * u3 + 3 * u2) * x1
+            + (u3 - u2) * m1
+        )
+    return result.reshape((len(t_new),) + x.shape[1:])
+
+
+def resampleSignals(
+    signals: DataFrame, sampling_frequency: float, method: str = "linear"
+) -> DataFrame:
+    """_summary_
+    Resamples the signals (indexed by a possibly non-uniform time axis)
+    onto the uniform time grid t[0] + k/sampling_frequency.
+    Args:
+        signals (DataFrame): The time series data, indexed by the time axis.
+        sampling_frequency (float): The sampling frequency of the uniform time grid.
+        method (str, optional): "linear", "cubic" or "hold". Defaults to "linear".
+    Returns:
+        DataFrame: the resampled signals, indexed by the uniform time grid.
+    """
+    t = signals.index.values.astype(np.float64)
+    ts = 1.0 / sampling_frequency
+    n_samples = int(np.floor((t[-1] - t[0]) / ts * (1 + 1e-12))) + 1
+    t_new = t[0] + np.arange(n_samples) * ts
+    data = interpolate(t, signals.values, t_new, method=method)
+    resampled = DataFrame(data, columns=signals.columns, index=t_new)
+    resampled.index.name = signals.index.name
+    return resampled
+
+
+def resampleBlocks(blocks, sampling_frequency: float, method: str = "linear"):
+    """_summary_
+    Resamples streamed blocks of signals onto the uniform time grid t[0] + k/sampling_frequency,
+    one block at a time. The last simulated time steps of each block are carried over to the
+    next block, so the result matches resampleSignals over the whole record, with the memory
+    bounded by the block size.
+    Args:
+        blocks (iterable): The DataFrame blocks (indexed by the time axis) yielded by dycifer.read.streamSignals.
+        sampling_frequency (float): The sampling frequency of the uniform time grid.
+        method (str, optional): "linear", "cubic" or "hold". Defaults to "linear".
+    Yields:
+        DataFrame: blocks of the resampled signals.
+    """
+    ts = 1.0 / sampling_frequency
+    tail = None
+    t0 = None
+    k = 0  # index of the next uniform time stamp
+    for block in blocks:
+        if tail is not None:
+            block = concat([tail, block])
+        if t0 is None:
+            t0 = float(block.index.values[0])
+        t = block.index.values.astype(np.float64)
+        if len(t) < 4:
+            tail = block
+            continue
+        # only the time stamps with two simulated steps ahead are computed
+        # (the cubic interpolation needs the samples around each interval)
+        k_stop = int(np.ceil((t[-2] - t0) / ts))
+        if k_stop > k:
+            t_new = t0 + np.arange(k, k_stop) * ts
+            data = interpolate(t, block.values, t_new, method=method)
+            resampled = DataFrame(data, columns=block.columns, index=t_new)
+            resampled.index.name = block.index.name
+            yield resampled
+            k = k_stop
+        tail = block.iloc[-3:]
+    if tail is not None:
+        t = tail.index.values.astype(np.float64)
+        k_stop = int(np.floor((t[-1] - t0) / ts * (1 + 1e-12))) + 1
+        if k_stop > k and len(t) > 1:
+            t_new = t0 + np.arange(k, k_stop) * ts
+            data = interpolate(t, tail.values, t_new, method=method)
+            resampled = DataFrame(data, columns=tail.columns, index=t_new)
+            resampled.index.name = tail.index.name
+            yield resampled
+
+
+def sampleSignals(
+    signals: DataFrame,
+    sampling_frequency: float,
+    resampling: str = None,
+    fallback: str = "linear",
+) -> DataFrame:
+    """_summary_
+    Brings the signals to the uniform time grid of the sampling frequency of the analysis.
+    - Signals without a time axis are assumed to be sampled at the sampling frequency.
+    - Signals with a uniform time axis are decimated by the (integer) ratio between
+        the sampling period and the time step of the signals.
+    - Signals with a non-uniform time axis (e.g. the adaptive time steps of a SPICE transient),
+        or with an explicit resampling method, are interpolated onto the uniform grid.
+    Args:
+        signals (DataFrame): The time series data.
+        sampling_frequency (float): The sampling frequency of the analysis.
+        resampling (str, optional): The interpolation method ("linear", "cubic" or "hold").
+                                    Defaults to None (fallback, and only for non-uniform time axes).
+        fallback (str, optional): The interpolation method used for non-uniform time axes when no
+                                    resampling method is given. Defaults to "linear".
+    Returns:
+        DataFrame: the signals sampled at the sampling frequency, indexed by the time axis.
+    """
+    ts = 1.0 / sampling_frequency
+    if not bool(signals.index.name):
+        # in case there is no time axis frame
+        # automatically generate one from the sampling frequency
+        return signals.set_index(np.arange(len(signals)) * ts)
+    t = signals.index.values
+    if resampling is None and not isUniformGrid(t):
+        log.info(
+            f"\nNon-uniform time steps found in the signals: resampling them onto the sampling frequency grid ({fallback} interpolation)."
+        )
+        resampling = fallback
+    if bool(resampling):
+        if ts < (t[-1] - t[0]) / (len(t) - 1):
+            log.warning(
+                "\nThe sampling time period is smaller than the signals' time resolution: the resampled signals are interpolated."
+            )
+        return resampleSignals(signals, sampling_frequency, method=resampling)
+    downsampling = int(round(ts / (t[1] - t[0])))
+    if downsampling < 1:
+        raise ValueError(
+            "Sampling time period must be equal or higher than the signals' time resolution."
+        )
+    # downsample the signals to the sampling frequency effectively parsed as input
+    return signals[::downsampling]
+
+
+def sampleBlocks(
+    blocks,
+    sampling_frequency: float,
+    resampling: str = None,
+    fallback: str = "linear",
+):
+    """_summary_
+    Brings streamed blocks of signals to the uniform time grid of the sampling frequency of the
+    analysis, one block at a time (see sampleSignals). The kind of time axis is decided from the
+    first block, and the decimation stride is carried over from one block to the next.
+    Args:
+        blocks (iterable): The DataFrame blocks (indexed by the time axis) yielded by dycifer.read.streamSignals.
+        sampling_frequency (float): The sampling frequency of the analysis.
+        resampling (str, optional): The interpolation method ("linear", "cubic" or "hold").
+                                    Defaults to None (fallback, and only for non-uniform time axes).
+        fallback (str, optional): The interpolation method used for non-uniform time axes when no
+                                    resampling method is given. Defaults to "linear".
+    Yields:
+        DataFrame: blocks of the signals sampled at the sampling frequency, indexed by the time axis.
+    """
+    ts = 1.0 / sampling_frequency
+    blocks = iter(blocks)
+    first = next(blocks, None)
+    if first is None:
+        return
+    blocks = chain([first], blocks)
+    if not bool(first.index.name):
+        # no time axis: the signals are sampled at the sampling frequency
+        k = 0
+        for block in blocks:
+            yield block.set_index((k + np.arange(len(block))) * ts)
+            k += len(block)
+        return
+    t = first.index.values
+    if resampling is None and (len(t) < 2 or not isUniformGrid(t)):
+        log.info(
+            f"\nNon-uniform time steps found in the signals: resampling them onto the sampling frequency grid ({fallback} interpolation)."
+        )
+        resampling = fallback
+    if bool(resampling):
+        yield from resampleBlocks(blocks, sampling_frequency, method=resampling)
+        return
+    downsampling = int(round(ts / (t[1] - t[0])))
+    if downsampling < 1:
+        raise ValueError(
+            "Sampling time period must be equal or higher than the signals' time resolution."
+        )
+    offset = 0  # index of the first sample of the next block kept by the decimation
+    for block in blocks:
+        yield block.iloc[offset::downsampling]
+        offset = (offset - len(block)) % downsampling
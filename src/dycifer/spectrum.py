@@ -0,0 +1,1335 @@
+import numpy as np
+from loguru import logger as log
+from pandas import DataFrame
+from enum import Enum
+from functools import cached_property
+from itertools import chain
+from numpy.lib.stride_tricks import sliding_window_view
+from dycifer.fft import rfft
+
+
+class Precisions(Enum):
+    """_summary_
+
+    Args:
+        DOUBLE (str): float64 samples and complex128 Fast Fourier Transforms
+        SINGLE (str): float32 samples and complex64 Fast Fourier Transforms (half the memory)
+    """
+
+    DOUBLE = "double"
+    SINGLE = "single"
+
+
+def floatType(precision: str = "double") -> np.dtype:
+    """_summary_
+    Returns the floating point type of the samples for the given precision.
+    Args:
+        precision (str, optional): "double" or "single". Defaults to "double".
+    Returns:
+        np.dtype: float64 (double precision) or float32 (single precision)
+    """
+    if not (precision in [elem.value for elem in Precisions]):
+        raise ValueError(
+            f"{precision} is not a valid precision. Possible precisions are: {[elem.value for elem in Precisions]}."
+        )
+    return np.dtype(np.float32 if precision == Precisions.SINGLE.value else np.float64)
+
+
+class Windows(Enum):
+    """_summary_
+
+    Args:
+        RECTANGULAR (str): No window (coherent sampling)
+        HANN (str): Hann window (-31 dB sidelobes, mainlobe of +/- 2 bins)
+        BLACKMAN_HARRIS (str): 4-term Blackman-Harris window (-92 dB sidelobes, mainlobe of +/- 4 bins)
+        KAISER (str): Kaiser window of shape parameter beta ("kaiser:<beta>", the sidelobes drop with beta)
+        FLATTOP (str): 5-term flat-top window (amplitude error below 0.01 dB, mainlobe of +/- 5 bins)
+    """
+
+    RECTANGULAR = "rectangular"
+    HANN = "hann"
+    BLACKMAN_HARRIS = "blackmanharris"
+    KAISER = "kaiser"
+    FLATTOP = "flattop"
+
+
+# default shape parameter of the Kaiser window (sidelobes below -180 dB)
+DEFAULT_KAISER_BETA = 20.0
+# number of samples of the coarse spectrum locating the fundamental tone of the targeted mode
+COARSE_SPECTRUM_LENGTH = 2**14
+# growth of the record prefixes refining the frequency of the fundamental tone
+COARSE_REFINEMENT = 4
+# number of (streamed) samples held in memory to locate the fundamental tone of the targeted mode
+TONE_ESTIMATION_LENGTH = 2**20
+# number of samples correlated at once with the DFT bank
+DFT_BANK_BLOCK_LENGTH = 2**14
+# shortest coherent record, as a fraction of the whole record
+COHERENT_RECORD_FRACTION = 0.5
+# coherence error (in cycles of the fundamental tone) of a record considered coherent
+COHERENCE_TOLERANCE = 1e-3
+# number of samples of the segments transformed at once by a streaming averaged periodogram
+WELCH_BATCH_LENGTH = 2**22
+# coefficients of the cosine-sum windows: w[n] = sum_k (-1)^k a_k cos(2 pi k n / N)
+COSINE_WINDOW_COEFFICIENTS = {
+    Windows.RECTANGULAR.value: [1.0],
+    Windows.HANN.value: [0.5, 0.5],
+    Windows.BLACKMAN_HARRIS.value: [0.35875, 0.48829, 0.14128, 0.01168],
+    Windows.FLATTOP.value: [
+        0.21557895,
+        0.41663158,
+        0.277263158,
+        0.083578947,
+        0.006947368,
+    ],
+}
+
+
+def parseWindow(window: str = "rectangular") -> tuple:
+    """_summary_
+    Parses a window selector ("rectangular", "hann", "blackmanharris", "flattop", "kaiser" or "kaiser:<beta>").
+    Args:
+        window (str, optional): The window selector. Defaults to "rectangular".
+    Returns:
+        tuple[str, float]: the name of the window and the Kaiser shape parameter (None for the other windows).
+    """
+    name, _, beta = str(window).lower().partition(":")
+    if not (name in [elem.value for elem in Windows]):
+        raise ValueError(
+            f"{window} is not a valid window. Possible windows are: {[elem.value for elem in Windows]}."
+        )
+    if name != Windows.KAISER.value:
+        return name, None
+    return name, float(beta) if bool(beta) else DEFAULT_KAISER_BETA
+
+
+def windowFunction(
+    window: str, n_samples: int, dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """_summary_
+    Computes the samples of a periodic (DFT-even) window, the variant suited to spectral analysis.
+    Args:
+        window (str): The window selector (see parseWindow).
+        n_samples (int): The number of samples of the window.
+        dtype (np.dtype, optional): The floating point type of the window. Defaults to np.float64.
+    Returns:
+        np.ndarray: the window samples.
+    """
+    name, beta = parseWindow(window)
+    if name == Windows.KAISER.value:
+        return np.kaiser(n_samples + 1, beta)[:-1].astype(dtype)
+    phase = 2 * np.pi * np.arange(n_samples) / n_samples
+    w = np.zeros(n_samples)
+    for k, a_k in enumerate(COSINE_WINDOW_COEFFICIENTS[name]):
+        w += (-1) ** k * a_k * np.cos(k * phase)
+    return w.astype(dtype)
+
+
+def windowGains(window: str, n_samples: int) -> tuple:
+    """_summary_
+    Computes the coherent gain and the equivalent noise bandwidth of a window.
+    Args:
+        window (str): The window selector (see parseWindow).
+        n_samples (int): The number of samples of the window.
+    Returns:
+        tuple[float, float]: the coherent gain (mean of the window) and the
+        equivalent noise bandwidth (in bins) of the window.
+    """
+    if parseWindow(window)[0] == Windows.RECTANGULAR.value:
+        return 1.0, 1.0
+    w = windowFunction(window, n_samples)
+    coherent_gain = np.mean(w)
+    enbw = n_samples * np.sum(w * w) / np.sum(w) ** 2
+    return coherent_gain, enbw
+
+
+def windowSpan(window: str = "rectangular") -> int:
+    """_summary_
+    Computes the default span of a tone: the number of bins covering the mainlobe of the window.
+    Args:
+        window (str, optional): The window selector (see parseWindow). Defaults to "rectangular".
+    Returns:
+        int: the number of bins dispersing the power of each tone.
+    """
+    name, beta = parseWindow(window)
+    if name == Windows.KAISER.value:
+        # half-width of the Kaiser mainlobe: sqrt(1 + (beta / pi)^2) bins
+        return int(np.ceil(np.sqrt(1 + (beta / np.pi) ** 2))) + 1
+    if name == Windows.RECTANGULAR.value:
+        return 1
+    # half-width of the mainlobe of a cosine-sum window: its number of terms
+    # (plus one bin, for tones falling between two bins)
+    return len(COSINE_WINDOW_COEFFICIENTS[name]) + 1
+
+
+def fftAmplitude(
+    x: np.ndarray,
+    precision: str = "double",
+    window: str = "rectangular",
+    backend: str = None,
+) -> np.ndarray:
+    """_summary_
+    Computes the one-sided amplitude spectrum of a real signal, from DC to fs/2, through a real input FFT.
+    Only the n_samples // 2 + 1 non-negative frequency bins are computed and stored (the negative
+    frequency bins of a real signal are the complex conjugates of the positive ones).
+    The spectrum is single-sided: the amplitude of the bins between DC and fs/2 is scaled by sqrt(2),
+    so that each bin holds the RMS amplitude of its tone and the power of the spectrum sums up to
+    the mean square of the signal (Parseval).
+    The windowed spectrum is divided by the coherent gain of the window, so the peak bin of a tone
+    holds its RMS amplitude whatever the window.
+    In single precision the transform is computed in complex64 (unless through numpy.fft, which
+    always computes in complex128), so no double precision copy of the signal is ever created.
+    Args:
+        x (np.ndarray): The samples of the (real) signal.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to the signal (see parseWindow). Defaults to "rectangular".
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        np.ndarray: the single-sided amplitude spectrum of the signal, from 0 to fs/2.
+    """
+    dtype = floatType(precision)
+    x = np.asarray(x).astype(dtype, copy=False)
+    w = None
+    if parseWindow(window)[0] != Windows.RECTANGULAR.value:
+        w = windowFunction(window, len(x), dtype=dtype)
+    return _rfftAmplitude(x, w, backend=backend)
+
+
+def _rfftAmplitude(
+    x: np.ndarray, w: np.ndarray = None, backend: str = None
+) -> np.ndarray:
+    """_summary_
+    Computes the single-sided amplitude spectrum of real samples (see fftAmplitude),
+    in the floating point type of the samples. The signals of a (n_samples, n_signals) array
+    are transformed at once, through a single FFT along the samples axis.
+    Args:
+        x (np.ndarray): The samples of the (real) signal, or of several signals (one per column), as float32 or float64.
+        w (np.ndarray, optional): The window samples. Defaults to None (rectangular window).
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        np.ndarray: the single-sided amplitude spectrum of the signal, from 0 to fs/2.
+    """
+    dtype = x.dtype
+    n_samples = len(x)
+    coherent_gain = 1.0
+    if w is not None:
+        coherent_gain = np.mean(w)
+        x = x * w.reshape((-1,) + (1,) * (x.ndim - 1))
+    spectrum = rfft(x, backend=backend, axis=0)
+    amplitude = np.abs(spectrum)
+    del spectrum
+    # the DC bin (and the fs/2 bin, for an even number of samples) have no negative frequency image
+    last_bin = len(amplitude) - 1 if n_samples % 2 == 0 else len(amplitude)
+    amplitude[1:last_bin] *= dtype.type(np.sqrt(2))
+    amplitude /= dtype.type(n_samples * coherent_gain)
+    return amplitude
+
+
+class Spectrum:
+    """_summary_
+    One-sided spectrum of a signal, backed by a single array: its power.
+    The frequency axis, the amplitude ("vout") and the power in dB ("power_db") are computed on
+    access and cached, so the runs that never plot nor export the spectrum never compute them.
+    The spectrum can be indexed like the DataFrame it replaces (spectrum.index, spectrum["power_db"]),
+    and converted to one through toDataFrame.
+    Args:
+        power (np.ndarray): The one-sided power spectrum [V^2], from 0 to fs/2.
+        n_fft (int): The length of the FFT the spectrum was computed with.
+        ts (float): The sampling time period of the signal.
+    """
+
+    columns = ["vout", "power", "power_db"]
+
+    def __init__(self, power: np.ndarray, n_fft: int, ts: float):
+        self.power = power
+        self.n_fft = n_fft
+        self.ts = ts
+        # (first sample, number of samples) of the coherent record the spectrum was computed from
+        # and its coherence error (in cycles of the fundamental tone): see coherentRecord
+        self.record = None
+        self.coherence_error = np.nan
+
+    @cached_property
+    def freq(self) -> np.ndarray:
+        """_summary_
+        The frequency [Hz] of the bins, from 0 to fs/2.
+        """
+        return np.fft.rfftfreq(self.n_fft, self.ts)
+
+    @cached_property
+    def vout(self) -> np.ndarray:
+        """_summary_
+        The RMS amplitude [V] of the bins.
+        """
+        return np.sqrt(self.power)
+
+    @cached_property
+    def power_db(self) -> np.ndarray:
+        """_summary_
+        The power [dB] of the bins.
+        """
+        return 10 * np.log10(self.power)
+
+    @property
+    def index(self) -> np.ndarray:
+        return self.freq
+
+    def __len__(self) -> int:
+        return len(self.power)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if not (column in self.columns):
+            raise KeyError(
+                f"{column} is not a spectrum column. Possible columns are: {self.columns}."
+            )
+        return getattr(self, column)
+
+    def toDataFrame(self) -> DataFrame:
+        """_summary_
+        Converts the spectrum into a DataFrame.
+        Returns:
+            DataFrame: the "vout" [V rms], "power" [V^2] and "power_db" [dB] spectrum, indexed by the frequency [Hz] from 0 to fs/2.
+        """
+        return DataFrame(
+            index=self.freq,
+            data={column: self[column] for column in self.columns},
+        )
+
+
+def powerSpectrum(
+    x: np.ndarray,
+    ts: float,
+    precision: str = "double",
+    window: str = "rectangular",
+    backend: str = None,
+) -> Spectrum:
+    """_summary_
+    Computes the one-sided power spectrum of a real signal.
+    Args:
+        x (np.ndarray): The samples of the signal.
+        ts (float): The sampling time period of the signal.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to the signal (see parseWindow). Defaults to "rectangular".
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        Spectrum: the spectrum, from 0 to fs/2.
+    """
+    vout = fftAmplitude(x, precision=precision, window=window, backend=backend)  # [V]
+    # [V^2] - square the voltage spectrum (in place) to obtain the power spectrum
+    power = np.square(vout, out=vout)
+    return Spectrum(power, len(x), ts)
+
+
+def welchSegments(n_samples: int, segments: int, overlap: float = 0.5) -> tuple:
+    """_summary_
+    Computes the length of the segments of an averaged periodogram, and the hop between them.
+    Args:
+        n_samples (int): The number of samples of the record.
+        segments (int): The number of segments averaged.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+    Returns:
+        tuple[int, int]: the length of the segments and the hop (in samples) between two segments.
+    """
+    if not (int(segments) == segments and segments >= 1):
+        raise ValueError(f"{segments} is not a valid number of segments (>= 1).")
+    if not (0.0 <= overlap < 1.0):
+        raise ValueError(
+            f"{overlap} is not a valid segment overlap. The overlap must be in [0, 1)."
+        )
+    segment_length = int(n_samples / (1 + (segments - 1) * (1 - overlap)))
+    hop = max(1, int(segment_length * (1 - overlap)))
+    if segment_length < 2:
+        raise ValueError(
+            f"{n_samples} samples are not enough to average {segments} segments."
+        )
+    return segment_length, hop
+
+
+def _welchPower(
+    x: np.ndarray,
+    segments: int,
+    overlap: float,
+    dtype: np.dtype,
+    window: str,
+    backend: str = None,
+) -> tuple:
+    """_summary_
+    Computes the averaged power spectrum of the overlapping segments of one or more signals (see welchSpectrum).
+    Args:
+        x (np.ndarray): The samples of the signal, or of several signals (one per column).
+        segments (int): The number of segments averaged (see welchSegments).
+        overlap (float): The overlap of consecutive segments, in [0, 1).
+        dtype (np.dtype): The floating point type of the samples.
+        window (str): The window applied to each segment (see parseWindow).
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple[np.ndarray, int]: the averaged power spectrum and the length of the segments.
+    """
+    segment_length, hop = welchSegments(len(x), segments, overlap)
+    w = None
+    if parseWindow(window)[0] != Windows.RECTANGULAR.value:
+        w = windowFunction(window, segment_length, dtype=dtype)
+    # accumulate the power of the segments in double precision
+    power = np.zeros((segment_length // 2 + 1,) + np.shape(x)[1:], dtype=np.float64)
+    for segment in range(segments):
+        start = segment * hop
+        amplitude = _rfftAmplitude(
+            np.asarray(x[start : start + segment_length]).astype(dtype),
+            w,
+            backend=backend,
+        )
+        power += np.square(amplitude, dtype=np.float64)
+    return (power / segments).astype(dtype), segment_length
+
+
+def welchSpectrum(
+    x: np.ndarray,
+    ts: float,
+    segments: int,
+    overlap: float = 0.5,
+    precision: str = "double",
+    window: str = "hann",
+    backend: str = None,
+) -> Spectrum:
+    """_summary_
+    Computes the one-sided power spectrum of a real signal through Welch's
+    averaged periodogram: the power spectra of overlapping windowed segments of the signal are averaged.
+    The segments are transformed one at a time and accumulated, so the working memory is proportional to
+    the segment length (a memory-mapped record is never loaded as a whole), and the averaging lowers
+    the variance of the noise floor.
+    Args:
+        x (np.ndarray): The samples of the signal.
+        ts (float): The sampling time period of the signal.
+        segments (int): The number of segments averaged (see welchSegments).
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to each segment (see parseWindow). Defaults to "hann".
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        Spectrum: the averaged spectrum, from 0 to fs/2.
+    """
+    power, segment_length = _welchPower(
+        x, segments, overlap, floatType(precision), window, backend=backend
+    )
+    return Spectrum(power, segment_length, ts)
+
+
+class WelchAccumulator:
+    """_summary_
+    Averaged periodogram (Welch's method, see welchSpectrum) of a streamed signal of unknown length:
+    the overlapping windowed segments of fixed length are transformed as soon as the blocks holding
+    them are received (several segments at once, through a single FFT of WELCH_BATCH_LENGTH samples
+    at most), and their power is accumulated. Only the samples of the segments yet to be completed
+    are carried over from one block to the next, so the memory is bounded by the segment length
+    and the block size, whatever the length of the record.
+    Args:
+        segment_length (int): The number of samples of each segment.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to each segment (see parseWindow). Defaults to "hann".
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    """
+
+    def __init__(
+        self,
+        segment_length: int,
+        overlap: float = 0.5,
+        precision: str = "double",
+        window: str = "hann",
+        backend: str = None,
+    ):
+        if not (0.0 <= overlap < 1.0):
+            raise ValueError(
+                f"{overlap} is not a valid segment overlap. The overlap must be in [0, 1)."
+            )
+        self.segment_length = int(segment_length)
+        self.hop = max(1, int(self.segment_length * (1 - overlap)))
+        self.dtype = floatType(precision)
+        self.window = window
+        self.backend = backend
+        self.w = None
+        if parseWindow(window)[0] != Windows.RECTANGULAR.value:
+            self.w = windowFunction(window, self.segment_length, dtype=self.dtype)
+        # accumulate the power of the segments in double precision
+        self.power = np.zeros(self.segment_length // 2 + 1, dtype=np.float64)
+        self.segments = 0
+        self.pending = np.zeros(0, dtype=self.dtype)
+
+    def update(self, x: np.ndarray) -> "WelchAccumulator":
+        """_summary_
+        Accumulates the power of the segments completed by the next block of samples.
+        Args:
+            x (np.ndarray): The next block of samples.
+        Returns:
+            WelchAccumulator: the updated accumulator.
+        """
+        buffer = np.concatenate([self.pending, np.asarray(x, dtype=self.dtype)])
+        n_segments = 0
+        if len(buffer) >= self.segment_length:
+            n_segments = (len(buffer) - self.segment_length) // self.hop + 1
+            segments = sliding_window_view(buffer, self.segment_length)[:: self.hop]
+            batch = max(1, WELCH_BATCH_LENGTH // self.segment_length)
+            for first in range(0, n_segments, batch):
+                amplitude = _rfftAmplitude(
+                    segments[first : first + batch].T, self.w, backend=self.backend
+                )
+                self.power += np.sum(np.square(amplitude, dtype=np.float64), axis=1)
+            self.segments += n_segments
+        self.pending = buffer[n_segments * self.hop :]
+        return self
+
+    def spectrum(self, ts: float) -> Spectrum:
+        """_summary_
+        Computes the averaged spectrum of the segments accumulated so far.
+        Args:
+            ts (float): The sampling time period of the signal.
+        Returns:
+            Spectrum: the averaged spectrum, from 0 to fs/2.
+        """
+        if self.segments == 0:
+            raise ValueError(
+                f"The record is shorter than a single segment ({self.segment_length} samples)."
+            )
+        return Spectrum(
+            (self.power / self.segments).astype(self.dtype), self.segment_length, ts
+        )
+
+
+def _checkSegmentsWindow(window: str):
+    if parseWindow(window)[0] == Windows.RECTANGULAR.value:
+        log.warning(
+            "\nThe segments of the averaged spectrum are not coherently sampled: use a window (e.g. --window hann) to avoid the leakage of the tones."
+        )
+
+
+def streamWelchSpectra(
+    blocks,
+    n_samples: int,
+    ts: float,
+    segments: int,
+    overlap: float = 0.5,
+    precision: str = "double",
+    window: str = "rectangular",
+    backend: str = None,
+) -> tuple:
+    """_summary_
+    Computes the averaged spectra of the signals of a streamed record of known length over the same segments
+    as welchSpectrum, feeding the blocks of each signal to a WelchAccumulator: only the samples of the segments
+    yet to be completed are held, so the memory is bounded by the segment length and the block size.
+    Args:
+        blocks (iterable): The (n_samples, n_signals) arrays (or the samples of a single signal) of consecutive blocks of the record.
+        n_samples (int): The number of samples of the record (see welchSegments).
+        ts (float): The sampling time period of the signals.
+        segments (int): The number of segments averaged.
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to each segment (see parseWindow). Defaults to "rectangular".
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple[list, int]: the averaged spectrum of each signal, and the length of the segments.
+    """
+    _checkSegmentsWindow(window)
+    segment_length, hop = welchSegments(n_samples, segments, overlap)
+    # the samples covered by the segments of welchSpectrum
+    remaining = (segments - 1) * hop + segment_length
+    accumulators = None
+    for x in blocks:
+        x = np.asarray(x)
+        x = x.reshape(len(x), -1)
+        if accumulators is None:
+            accumulators = [
+                WelchAccumulator(
+                    segment_length,
+                    overlap=overlap,
+                    precision=precision,
+                    window=window,
+                    backend=backend,
+                )
+                for _ in range(x.shape[1])
+            ]
+        # (the blocks are read to the end: they may be gathered by the caller meanwhile)
+        if remaining > 0:
+            for accumulator, signal in zip(accumulators, x[:remaining].T):
+                accumulator.update(signal)
+            remaining -= len(x)
+    if accumulators is None:
+        raise ValueError("No signals were streamed.")
+    return [accumulator.spectrum(ts) for accumulator in accumulators], segment_length
+
+
+def signalSpectrum(
+    x: np.ndarray,
+    ts: float,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    backend: str = None,
+) -> tuple:
+    """_summary_
+    Computes the one-sided spectrum of a signal: a single periodogram of the whole record (see powerSpectrum),
+    or an averaged periodogram of several segments of the record (see welchSpectrum).
+    Args:
+        x (np.ndarray): The samples of the signal.
+        ts (float): The sampling time period of the signal.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to the signal (see parseWindow). Defaults to "rectangular".
+        segments (int, optional): The number of segments averaged. Defaults to 1 (a single periodogram).
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple[Spectrum, int]: the spectrum and the length of the FFT it was computed with.
+    """
+    if segments == 1:
+        spectrum = powerSpectrum(
+            x, ts, precision=precision, window=window, backend=backend
+        )
+        return spectrum, len(x)
+    _checkSegmentsWindow(window)
+    spectrum = welchSpectrum(
+        x,
+        ts,
+        segments,
+        overlap=overlap,
+        precision=precision,
+        window=window,
+        backend=backend,
+    )
+    return spectrum, welchSegments(len(x), segments, overlap)[0]
+
+
+def spectrumPower(
+    x: np.ndarray,
+    precision: str = "double",
+    window: str = "rectangular",
+    segments: int = 1,
+    overlap: float = 0.5,
+    backend: str = None,
+) -> tuple:
+    """_summary_
+    Computes the one-sided power spectra of several signals at once: the (n_samples, n_signals) samples are
+    transformed through a single FFT along the samples axis (see signalSpectrum), and no DataFrame is built.
+    Args:
+        x (np.ndarray): The samples of the signals, one signal per column.
+        precision (str, optional): "double" or "single". Defaults to "double".
+        window (str, optional): The window applied to the signals (see parseWindow). Defaults to "rectangular".
+        segments (int, optional): The number of segments averaged. Defaults to 1 (a single periodogram).
+        overlap (float, optional): The overlap of consecutive segments, in [0, 1). Defaults to 0.5.
+        backend (str, optional): The FFT backend (see dycifer.fft.fftBackend). Defaults to None (configured backend).
+    Returns:
+        tuple[np.ndarray, int]: the (n_bins, n_signals) power spectra and the length of the FFT they were computed with.
+    """
+    dtype = floatType(precision)
+    if segments == 1:
+        amplitude = fftAmplitude(x, precision=precision, window=window, backend=backend)
+        return np.square(amplitude), len(x)
+    if parseWindow(window)[0] == Windows.RECTANGULAR.value:
+        log.warning(
+            "\nThe segments of the averaged spectrum are not coherently sampled: use a window (e.g. --window hann) to avoid the leakage of the tones."
+        )
+    return _welchPower(x, segments, overlap, dtype, window, backend=backend)
+
+
+def _toneBins(n_bins: int, bin_idxs: np.ndarray, span: int) -> tuple:
+    """_summary_
+    Computes the [idx - span, idx + span) bins of tones in (n_bins, n_signals) power spectra.
+    Args:
+        n_bins (int): The number of bins of the spectra.
+        bin_idxs (np.ndarray): The (n_tones, n_signals) bins of the tones.
+        span (int): The number of bins dispersing the power of each tone.
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: the (n_tones, n_signals, 2 * span) bins and signal
+        indexes of the tones (clipped to the spectra), and the mask of the bins inside the spectra.
+    """
+    bins = bin_idxs[..., None] + np.arange(-span, span)
+    valid = (bins >= 0) & (bins < n_bins)
+    signals = np.broadcast_to(np.arange(bin_idxs.shape[1])[:, None], bins.shape)
+    return np.clip(bins, 0, n_bins - 1), signals, valid
+
+
+def tonePower(power: np.ndarray, bin_idxs: np.ndarray, span: int) -> np.ndarray:
+    """_summary_
+    Computes the power of tones dispersed through the [idx - span, idx + span) bins of
+    (n_bins, n_signals) power spectra, for all the tones and signals at once (see binPower).
+    Args:
+        power (np.ndarray): The (n_bins, n_signals) one-sided power spectra.
+        bin_idxs (np.ndarray): The (n_tones, n_signals) bins of the tones.
+        span (int): The number of bins dispersing the power of each tone.
+    Returns:
+        np.ndarray: the (n_tones, n_signals) power of the tones.
+    """
+    bins, signals, valid = _toneBins(len(power), bin_idxs, span)
+    return np.sum(power[bins, signals], axis=-1, where=valid, dtype=np.float64)
+
+
+def noisePower(power: np.ndarray, bin_idxs: list, span: int) -> float:
+    """_summary_
+    Computes the noise power of a one-sided power spectrum: the power of all the bins
+    outside the DC bins [0, span) and outside the [idx - span, idx + span) bins of the signal and harmonics.
+    The noise bins are summed directly (in double precision) instead of subtracting the signal and
+    distortion power from the total power, which would cancel catastrophically for high SNRs
+    (and for any SNR above ~60 dB in single precision).
+    Args:
+        power (np.ndarray): The positive frequencies power spectrum, or (n_bins, n_signals) spectra.
+        bin_idxs (list): The indexes of the signal and harmonic bins ((n_tones, n_signals) for several spectra).
+        span (int): The number of bins dispersing the power of each tone.
+    Returns:
+        float: the noise power (an (n_signals,) array for several spectra).
+    """
+    power = np.asarray(power)
+    spectra = power.reshape(len(power), -1)
+    bin_idxs = np.asarray(bin_idxs, dtype=np.int64).reshape(len(bin_idxs), -1)
+    noise_bins = np.ones(spectra.shape, dtype=bool)
+    noise_bins[0 : 0 + span] = False
+    bins, signals, valid = _toneBins(len(spectra), bin_idxs, span)
+    noise_bins[bins[valid], signals[valid]] = False
+    noise = np.sum(spectra, axis=0, where=noise_bins, dtype=np.float64)
+    return noise if power.ndim > 1 else noise[0]
+
+
+def harmonicBins(
+    signal_bin: int, n_samples: int, harmonics: int = 7, fold: bool = True
+) -> np.ndarray:
+    """_summary_
+    Computes the (integer) bins of the harmonics of a tone from the bin of its fundamental.
+    The harmonic of order m lies at the bin m * signal_bin; the harmonics beyond fs/2 are aliased
+    (folded) back into the one-sided [0, fs/2] spectrum, unless fold is False.
+    Args:
+        signal_bin (int): The bin of the fundamental tone (or the (n_signals,) bins of several signals).
+        n_samples (int): The number of samples of the signal (the length of the full FFT).
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+        fold (bool, optional): Fold the harmonics beyond fs/2 back into the one-sided spectrum. Defaults to True.
+    Returns:
+        np.ndarray: the bins of the harmonics, from the fundamental to the harmonic of order harmonics
+        (one column per signal).
+    """
+    orders = np.arange(1, harmonics + 1, dtype=np.int64)
+    bins = np.multiply.outer(orders, np.asarray(signal_bin, dtype=np.int64))
+    if not fold:
+        return bins
+    bins = bins % n_samples
+    return np.where(bins > n_samples // 2, n_samples - bins, bins)
+
+
+def binPower(power: np.ndarray, bin_idx: int, span: int) -> float:
+    """_summary_
+    Computes the power of a tone dispersed through the [bin_idx - span, bin_idx + span) bins.
+    Args:
+        power (np.ndarray): The one-sided power spectrum.
+        bin_idx (int): The bin of the tone.
+        span (int): The number of bins dispersing the power of the tone.
+    Returns:
+        float: the power of the tone.
+    """
+    return np.sum(power[max(bin_idx - span, 0) : bin_idx + span], dtype=np.float64)
+
+
+def spectralMetrics(
+    power: np.ndarray,
+    n_samples: int,
+    harmonics: int = 7,
+    span: int = 1,
+    enbw: float = 1.0,
+) -> tuple:
+    """_summary_
+    Computes the dynamic performance metrics of a one-sided power spectrum.
+    The kernel works on integer bin indexes only: the fundamental is the strongest bin outside DC,
+    the harmonics are computed arithmetically from it (see harmonicBins) and no pandas
+    object is built, so its cost is negligible compared to the FFT.
+    The harmonics beyond fs/2 are not folded back: they are left out of the harmonics (no power,
+    and no HD2 or HD3), and their aliases are counted as noise.
+    The (n_bins, n_signals) power spectra of several signals are evaluated at once, through
+    vectorized reductions along the bins axis: the metrics are then (n_signals,) arrays.
+    The power of a windowed tone is spread through its mainlobe bins, and each bin integrates the
+    noise over the equivalent noise bandwidth of the window: the tone and noise powers summed
+    through the bins are divided by the ENBW (the spectrum is already corrected for the coherent gain).
+    Args:
+        power (np.ndarray): The one-sided power spectrum (see powerSpectrum), or spectra (see spectrumPower).
+        n_samples (int): The number of samples of the signal (the length of the full FFT).
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+        span (int, optional): The number of bins dispersing the power of each tone. Defaults to 1.
+        enbw (float, optional): The equivalent noise bandwidth (in bins) of the window (see windowGains). Defaults to 1.0.
+    Returns:
+        tuple[np.ndarray, np.ndarray, float, float, float, float, float, float, float, float]:
+            np.ndarray: the bins of the fundamental and of its harmonics
+            np.ndarray: the power of the fundamental and of its harmonics
+            float(1): Signal power (in dB)
+            float(2): DC power (in dB)
+            float(3): Spurious Free Dynamic Range (SFDR) metric
+            float(4): Total Harmonic Distortion (THD) metric
+            float(5): Signal to Noise Ratio (SNR) metric
+            float(6): Signal to Noise & Distortion Ratio (SNDR) metric
+            float(7): Fractional Second-Harmonic Distortion (HD2) metric
+            float(8): Fractional Third-Harmonic Distortion (HD3) metric
+    """
+    power = np.asarray(power)
+    spectra = power.reshape(len(power), -1)
+    # don't count the DC signal when searching for the signal bin
+    signal_bins = span + np.argmax(spectra[span:], axis=0)
+    harmonic_bins = harmonicBins(signal_bins, n_samples, harmonics, fold=False)
+    # the harmonics beyond fs/2 are moved out of the spectra: their tone bins hold no power
+    measured = harmonic_bins <= n_samples // 2
+    tone_bins = np.where(measured, harmonic_bins, len(spectra) + span)
+    harmonics_power = tonePower(spectra, tone_bins, span) / enbw
+    signal_power = harmonics_power[0]
+    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
+    DC_POWER_DB = 10 * np.log10(
+        np.sum(spectra[0:span], axis=0, dtype=np.float64) / enbw
+    )
+    # strongest spurious component: erase the signal and the DC bins from the spectrum
+    spurious_spectra = spectra.copy()
+    floor = np.min(spectra, axis=0)
+    bins = np.arange(len(spectra))[:, None]
+    erased = (bins < span) | (
+        (bins >= signal_bins - span) & (bins < signal_bins + span)
+    )
+    spurious_spectra[erased] = np.broadcast_to(floor, spectra.shape)[erased]
+    spur_bins = np.argmax(spurious_spectra, axis=0)
+    spur_power = tonePower(spurious_spectra, spur_bins[None, :], span)[0] / enbw
+    del spurious_spectra
+    SFDR = 10 * np.log10(signal_power / spur_power)
+    total_distortion_power = np.sum(harmonics_power[1:], axis=0)
+    THD = 10 * np.log10(total_distortion_power / signal_power)
+    noise_power = noisePower(spectra, tone_bins, span) / enbw
+    SNR = 10 * np.log10(signal_power / noise_power)
+    SNDR = 10 * np.log10(signal_power / (noise_power + total_distortion_power))
+    HD2 = np.full(spectra.shape[1], np.nan)
+    HD3 = np.full(spectra.shape[1], np.nan)
+    with np.errstate(divide="ignore"):
+        if harmonics > 1:
+            HD2 = np.where(
+                measured[1], 10 * np.log10(harmonics_power[1] / signal_power), np.nan
+            )
+        if harmonics > 2:
+            HD3 = np.where(
+                measured[2], 10 * np.log10(harmonics_power[2] / signal_power), np.nan
+            )
+        else:
+            log.warning(
+                "\nTried to access an harmonic that was not computed.\nIncrease the number of harmonics to at least 3 to compute the HD2 and HD3 metrics."
+            )
+    metrics = (SIGNAL_POWER_DB, DC_POWER_DB, SFDR, THD, SNR, SNDR, HD2, HD3)
+    if power.ndim == 1:
+        # a single signal: scalar metrics, and only the harmonics below fs/2
+        measured = measured[:, 0]
+        return (harmonic_bins[measured, 0], harmonics_power[measured, 0]) + tuple(
+            float(metric[0]) for metric in metrics
+        )
+    return (harmonic_bins, harmonics_power) + metrics
+
+
+def cumulativePower(power: np.ndarray) -> np.ndarray:
+    """_summary_
+    Computes the prefix sums of a one-sided power spectrum (in double precision), with a leading zero:
+    the power of any band of bins [low, high) is then cumulative[high] - cumulative[low] (see bandPower),
+    so the powers of all the bands of a spectrum are integrated without summing its bins again.
+    Args:
+        power (np.ndarray): The one-sided power spectrum.
+    Returns:
+        np.ndarray: the n_bins + 1 prefix sums of the power spectrum.
+    """
+    cumulative = np.zeros(len(power) + 1, dtype=np.float64)
+    np.cumsum(power, dtype=np.float64, out=cumulative[1:])
+    return cumulative
+
+
+def bandPower(cumulative: np.ndarray, low, high) -> np.ndarray:
+    """_summary_
+    Computes the power of the bands of bins [low, high) of a power spectrum from its prefix sums
+    (see cumulativePower), for any number of bands at once. The bands are clipped to the spectrum.
+    Args:
+        cumulative (np.ndarray): The prefix sums of the power spectrum.
+        low (np.ndarray): The first bin of each band.
+        high (np.ndarray): The bin following the last bin of each band.
+    Returns:
+        np.ndarray: the power of each band.
+    """
+    n_bins = len(cumulative) - 1
+    low = np.clip(low, 0, n_bins)
+    high = np.clip(high, low, n_bins)
+    # the rounding errors of the prefix sums never make a band power negative
+    return np.maximum(cumulative[high] - cumulative[low], 0.0)
+
+
+def excludedPower(cumulative: np.ndarray, low: np.ndarray, high: np.ndarray) -> float:
+    """_summary_
+    Computes the power of the union of (possibly overlapping) bands of bins [low, high) from the
+    prefix sums of a power spectrum: the overlapping bands are merged, so no bin is counted twice.
+    Args:
+        cumulative (np.ndarray): The prefix sums of the power spectrum (see cumulativePower).
+        low (np.ndarray): The first bin of each band.
+        high (np.ndarray): The bin following the last bin of each band.
+    Returns:
+        float: the power of the union of the bands.
+    """
+    order = np.argsort(low, kind="stable")
+    low = np.asarray(low)[order]
+    high = np.asarray(high)[order]
+    reach = np.maximum.accumulate(high)
+    # a band starts a merged band when it does not overlap the bands before it
+    starts = np.flatnonzero(np.concatenate([[True], low[1:] > reach[:-1]]))
+    merged_high = np.maximum.reduceat(high, starts)
+    return float(np.sum(bandPower(cumulative, low[starts], merged_high)))
+
+
+def bandMetrics(
+    power: np.ndarray,
+    n_samples: int,
+    band_bins: int,
+    harmonics: int = 7,
+    span: int = 1,
+    enbw: float = 1.0,
+    full_scale_power: float = 0.5,
+    cumulative: np.ndarray = None,
+) -> tuple:
+    """_summary_
+    Computes the in-band dynamic performance metrics of a one-sided power spectrum, considering only
+    the bins of the signal band [0, band_bins] (e.g. of an oversampled sigma-delta modulator, whose
+    shaped quantization noise is filtered out of the band by the decimation filter).
+    The fundamental is the strongest bin of the band outside DC, and only its harmonics (folded
+    into the one-sided spectrum, see harmonicBins) falling inside the band are distortion.
+    The tone and noise powers are integrated from the prefix sums of the spectrum (see cumulativePower):
+    the in-band noise is the power of the band minus the power of the (merged) DC and tone bins.
+    Args:
+        power (np.ndarray): The one-sided power spectrum (see powerSpectrum).
+        n_samples (int): The length of the FFT the spectrum was computed with.
+        band_bins (int): The last bin of the signal band.
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+        span (int, optional): The number of bins dispersing the power of each tone. Defaults to 1.
+        enbw (float, optional): The equivalent noise bandwidth (in bins) of the window (see windowGains). Defaults to 1.0.
+        full_scale_power (float, optional): The power of a full scale sine wave, the reference of the dynamic range. Defaults to 0.5.
+        cumulative (np.ndarray, optional): The prefix sums of the power spectrum. Defaults to None (computed).
+    Returns:
+        tuple[np.ndarray, np.ndarray, float, float, float, float, float]:
+            np.ndarray: the bins of the fundamental and of its in-band harmonics
+            np.ndarray: the power of the fundamental and of its in-band harmonics
+            float(1): Signal power (in dB)
+            float(2): Total Harmonic Distortion (THD) metric (in-band harmonics)
+            float(3): Signal to Noise Ratio (SNR) metric (in-band noise)
+            float(4): Signal to Noise & Distortion Ratio (SNDR) metric
+            float(5): Dynamic Range (DR) metric: full scale power to in-band noise power
+    """
+    band = np.asarray(power)[: band_bins + 1]
+    if len(band) <= 2 * span:
+        raise ValueError(
+            f"The signal band holds {len(band)} bins: at least {2 * span + 1} bins are required. Increase the frequency resolution of the spectrum."
+        )
+    if cumulative is None:
+        cumulative = cumulativePower(power)
+    signal_bin = span + int(np.argmax(band[span:]))
+    harmonic_bins = harmonicBins(signal_bin, n_samples, harmonics)
+    harmonic_bins = harmonic_bins[harmonic_bins <= band_bins]
+    # the tone bins are clipped to the band: the bins above it are out-of-band power
+    high = np.minimum(harmonic_bins + span, band_bins + 1)
+    harmonics_power = bandPower(cumulative, harmonic_bins - span, high) / enbw
+    signal_power = harmonics_power[0]
+    distortion_power = np.sum(harmonics_power[1:])
+    # the DC and tone bins are excluded from the in-band noise
+    low = np.concatenate([[0], harmonic_bins - span])
+    high = np.concatenate([[span], high])
+    noise_power = (
+        bandPower(cumulative, 0, band_bins + 1) - excludedPower(cumulative, low, high)
+    ) / enbw
+    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
+    THD = 10 * np.log10(distortion_power / signal_power)
+    SNR = 10 * np.log10(signal_power / noise_power)
+    SNDR = 10 * np.log10(signal_power / (noise_power + distortion_power))
+    DR = 10 * np.log10(full_scale_power / noise_power)
+    return (
+        harmonic_bins,
+        harmonics_power,
+        float(SIGNAL_POWER_DB),
+        float(THD),
+        float(SNR),
+        float(SNDR),
+        float(DR),
+    )
+
+
+def outOfBandMetrics(
+    power: np.ndarray,
+    band_bins: int,
+    signal_power: float,
+    span: int = 1,
+    enbw: float = 1.0,
+    cumulative: np.ndarray = None,
+    signal_bin: int = None,
+) -> tuple:
+    """_summary_
+    Computes the out-of-band metrics of a one-sided power spectrum: the power integrated over the
+    bins above the signal band (band_bins, fs/2] (the out-of-band noise, e.g. the residual shaped noise
+    of a sigma-delta DAC after its reconstruction filter), and the strongest out-of-band spur.
+    The [signal_bin - span, signal_bin + span) bins of a tone close to the band edge spill over it:
+    they are neither out-of-band noise nor a spur.
+    Args:
+        power (np.ndarray): The one-sided power spectrum (see powerSpectrum).
+        band_bins (int): The last bin of the signal band.
+        signal_power (float): The power of the signal, the reference of the metrics.
+        span (int, optional): The number of bins dispersing the power of each tone. Defaults to 1.
+        enbw (float, optional): The equivalent noise bandwidth (in bins) of the window (see windowGains). Defaults to 1.0.
+        cumulative (np.ndarray, optional): The prefix sums of the power spectrum. Defaults to None (computed).
+        signal_bin (int, optional): The bin of the fundamental. Defaults to None (no tone bins excluded).
+    Returns:
+        tuple[float, float, int]:
+            float(1): Out-of-band noise power, relative to the signal power (in dBc)
+            float(2): Strongest out-of-band spur power, relative to the signal power (in dBc)
+            int: the bin of the strongest out-of-band spur
+    """
+    power = np.asarray(power)
+    if cumulative is None:
+        cumulative = cumulativePower(power)
+    if band_bins + 1 >= len(power):
+        return np.nan, np.nan, -1
+    # the out-of-band bins start past the bins of the tone spilling over the band edge
+    first_bin = band_bins + 1
+    if signal_bin is not None:
+        first_bin = max(first_bin, signal_bin + span)
+    if first_bin >= len(power):
+        return np.nan, np.nan, -1
+    spur_bin = first_bin + int(np.argmax(power[first_bin:]))
+    spur_power = bandPower(cumulative, max(spur_bin - span, first_bin), spur_bin + span)
+    spur_power = float(spur_power) / enbw
+    noise_power = float(bandPower(cumulative, first_bin, len(power))) / enbw
+    OOB_NOISE = 10 * np.log10(noise_power / signal_power)
+    OOB_SPUR = 10 * np.log10(spur_power / signal_power)
+    return float(OOB_NOISE), float(OOB_SPUR), spur_bin
+
+
+def foldFrequencies(frequencies: np.ndarray, fs: float) -> np.ndarray:
+    """_summary_
+    Aliases (folds) tone frequencies into the one-sided [0, fs/2] spectrum.
+    Args:
+        frequencies (np.ndarray): The frequencies of the tones [Hz].
+        fs (float): The sampling frequency [Hz].
+    Returns:
+        np.ndarray: the folded frequencies [Hz].
+    """
+    return np.abs(((np.asarray(frequencies, dtype=np.float64) + fs / 2) % fs) - fs / 2)
+
+
+def dftBank(blocks, frequencies: np.ndarray, fs: float) -> tuple:
+    """_summary_
+    Correlates streamed blocks of samples with a bank of complex exponentials: the Discrete Time
+    Fourier Transform of the whole record at a few target frequencies, in a single pass and at
+    O(n_samples * n_frequencies) cost (the Goertzel algorithm, vectorized over blocks of samples).
+    The sum and the sum of squares of the samples are accumulated along, for the DC and total power.
+    Args:
+        blocks (iterable): The blocks of samples, (n_samples,) or (n_samples, n_signals) arrays.
+        frequencies (np.ndarray): The target frequencies [Hz].
+        fs (float): The sampling frequency [Hz].
+    Returns:
+        tuple[np.ndarray, int, np.ndarray, np.ndarray]: the (n_frequencies, n_signals) DTFT of the signals,
+        the number of samples, and the (n_signals,) sum and sum of squares of the samples.
+    """
+    omega = 2 * np.pi * np.asarray(frequencies, dtype=np.float64) / fs
+    kernel = np.exp(-1j * np.outer(omega, np.arange(DFT_BANK_BLOCK_LENGTH)))
+    dft = None
+    n_samples = 0
+    for block in blocks:
+        block = np.asarray(block, dtype=np.float64)
+        block = block.reshape(len(block), -1)
+        if dft is None:
+            dft = np.zeros((len(omega), block.shape[1]), dtype=np.complex128)
+            sums = np.zeros(block.shape[1])
+            squares = np.zeros(block.shape[1])
+        for start in range(0, len(block), DFT_BANK_BLOCK_LENGTH):
+            chunk = block[start : start + DFT_BANK_BLOCK_LENGTH]
+            # the phase of the kernel restarts at each chunk: rotate it to the chunk offset
+            rotation = np.exp(-1j * omega * n_samples)[:, None]
+            dft += rotation * (kernel[:, : len(chunk)] @ chunk)
+            sums += np.sum(chunk, axis=0)
+            squares += np.sum(chunk * chunk, axis=0)
+            n_samples += len(chunk)
+    if dft is None:
+        raise ValueError("No samples found in the analysed signals.")
+    return dft, n_samples, sums, squares
+
+
+def estimateToneFrequency(x: np.ndarray, fs: float) -> float:
+    """_summary_
+    Estimates the frequency of the strongest tone of a signal without computing its full spectrum.
+    A coarse (Kaiser windowed) spectrum of the first COARSE_SPECTRUM_LENGTH samples locates the tone,
+    and the estimate is refined over prefixes of the record COARSE_REFINEMENT times longer each time,
+    until the whole record is used: the phase drift of the tone between the two (Hann windowed)
+    halves of each prefix is the residual frequency error of the estimate.
+    Args:
+        x (np.ndarray): The samples of the signal.
+        fs (float): The sampling frequency [Hz].
+    Returns:
+        float: the estimated frequency of the tone [Hz].
+    """
+    x = np.asarray(x, dtype=np.float64)
+    span = windowSpan("kaiser")
+    length = min(len(x), COARSE_SPECTRUM_LENGTH)
+    power = np.square(_rfftAmplitude(x[:length], windowFunction("kaiser", length)))
+    # tones too close to DC for the coarse spectrum: lengthen it
+    while 1 + np.argmax(power[1:]) < span and length < len(x):
+        length = min(len(x), length * COARSE_REFINEMENT)
+        power = np.square(_rfftAmplitude(x[:length], windowFunction("kaiser", length)))
+    peak = span + int(np.argmax(power[span:]))
+    frequency = peak * fs / length
+    if 0 < peak < len(power) - 1:
+        a, b, c = np.log(power[peak - 1 : peak + 2] + np.finfo(np.float64).tiny)
+        frequency += 0.5 * (a - c) / (a - 2 * b + c) * fs / length
+    refinements = 0
+    while length < len(x) or refinements < 2:
+        refinements = refinements + 1 if length == len(x) else 0
+        length = min(len(x), length * COARSE_REFINEMENT)
+        half = length // 2
+        if half < 2:
+            break
+        w = windowFunction("hann", half)
+        dft = dftBank(
+            [np.stack([x[:half] * w, x[half : 2 * half] * w], axis=1)], [frequency], fs
+        )[0]
+        # phase drift of the tone over half of the prefix, beyond the phase of the estimate
+        omega = 2 * np.pi * frequency / fs
+        drift = np.angle(dft[0, 1] * np.conj(dft[0, 0]) * np.exp(-1j * omega * half))
+        frequency += drift / (2 * np.pi * half) * fs
+    return frequency
+
+
+def geometricSum(omega: np.ndarray, n_samples: int) -> np.ndarray:
+    """_summary_
+    Computes the sums of the complex exponentials exp(1j * omega * n), n = 0, ..., n_samples - 1.
+    Args:
+        omega (np.ndarray): The normalized angular frequencies [rad/sample].
+        n_samples (int): The number of samples.
+    Returns:
+        np.ndarray: the sums of the complex exponentials.
+    """
+    omega = np.asarray(omega, dtype=np.float64)
+    ratio = np.exp(1j * omega)
+    singular = np.isclose(ratio, 1.0, rtol=0.0, atol=1e-12)
+    ratio = np.where(singular, 0.0, ratio)
+    return np.where(
+        singular, n_samples, (1 - ratio**n_samples) / (1 - ratio + singular)
+    )
+
+
+def _sineGram(omega: np.ndarray, n_samples: int) -> np.ndarray:
+    # normal equations of the fit of sum_h (a_h cos(omega_h n) + b_h sin(omega_h n)) + c
+    harmonics = len(omega)
+    difference = geometricSum(omega[:, None] - omega[None, :], n_samples)
+    addition = geometricSum(omega[:, None] + omega[None, :], n_samples)
+    single = geometricSum(omega, n_samples)
+    gram = np.empty((2 * harmonics + 1, 2 * harmonics + 1))
+    gram[:harmonics, :harmonics] = (difference.real + addition.real) / 2
+    gram[harmonics:-1, harmonics:-1] = (difference.real - addition.real) / 2
+    gram[:harmonics, harmonics:-1] = (addition.imag - difference.imag) / 2
+    gram[harmonics:-1, :harmonics] = gram[:harmonics, harmonics:-1].T
+    gram[:harmonics, -1] = gram[-1, :harmonics] = single.real
+    gram[harmonics:-1, -1] = gram[-1, harmonics:-1] = single.imag
+    gram[-1, -1] = n_samples
+    return gram
+
+
+def _sineFit(blocks, frequencies: np.ndarray, fs: float) -> tuple:
+    # least-squares fit of the sine waves and the offset (see targetedMetrics)
+    dft, n_samples, sums, squares = dftBank(blocks, frequencies, fs)
+    projections = np.concatenate([dft.real, -dft.imag, sums[None, :]])
+    gram = _sineGram(2 * np.pi * frequencies / fs, n_samples)
+    # the pseudo-inverse handles the harmonics folded onto DC, fs/2 or one another (degenerate fits)
+    parameters = np.linalg.pinv(gram) @ projections
+    return parameters, projections, n_samples, squares
+
+
+def _residualBlocks(blocks, frequencies: np.ndarray, fs: float, parameters: np.ndarray):
+    """_summary_
+    Subtracts a fitted model (sine waves and offset, see targetedMetrics) from streamed blocks of samples,
+    in double precision. The phases of the model are built as the phases of the kernel of dftBank.
+    Yields:
+        np.ndarray: the (n_samples, n_signals) residual blocks.
+    """
+    harmonics = len(frequencies)
+    omega = 2 * np.pi * np.asarray(frequencies, dtype=np.float64) / fs
+    kernel = np.exp(1j * np.outer(np.arange(DFT_BANK_BLOCK_LENGTH), omega))
+    # a cos(omega n) + b sin(omega n) = Re((a - jb) exp(j omega n))
+    phasors = parameters[:harmonics] - 1j * parameters[harmonics:-1]
+    offset = parameters[-1]
+    n_samples = 0
+    for block in blocks:
+        block = np.asarray(block, dtype=np.float64)
+        block = block.reshape(len(block), -1)
+        for start in range(0, len(block), DFT_BANK_BLOCK_LENGTH):
+            chunk = block[start : start + DFT_BANK_BLOCK_LENGTH]
+            rotation = np.exp(1j * omega * n_samples)[:, None]
+            model = (kernel[: len(chunk)] @ (rotation * phasors)).real + offset
+            n_samples += len(chunk)
+            yield chunk - model
+
+
+def targetedMetrics(
+    blocks, fs: float, tone_frequency: float, harmonics: int = 7
+) -> tuple:
+    """_summary_
+    Measures the harmonic content of streamed signals at the frequencies of the fundamental tone and
+    of its harmonics only (see dftBank): no spectrum is computed nor stored.
+    The harmonics and the offset of the signals are jointly least-squares fitted (a multi-tone sine fit),
+    from the DTFT of the signals and the closed form sums of the fitted sine waves, so the measurement is
+    free of the leakage of non-coherently sampled tones. The residual power of the fit is the noise power.
+    The fit is refined in a single pass: a provisional fit of the first TONE_ESTIMATION_LENGTH samples (the
+    only samples held in memory) is subtracted from every sample, and the correction of the fit is computed
+    from the residual. The noise power is the power of the residual (summed directly, in double precision)
+    minus the power of the correction, so it does not cancel catastrophically for high SNRs (see noisePower).
+    Args:
+        blocks (iterable): The blocks of samples, (n_samples,) or (n_samples, n_signals) arrays.
+        fs (float): The sampling frequency [Hz].
+        tone_frequency (float): The frequency of the fundamental tone [Hz].
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the (folded) frequencies of the harmonics,
+        the (n_harmonics, n_signals) power of the harmonics, and the (n_signals,) DC power and
+        noise power of the signals.
+    """
+    frequencies = foldFrequencies(tone_frequency * np.arange(1, harmonics + 1), fs)
+    blocks = iter(blocks)
+    head = []
+    n_head = 0
+    for block in blocks:
+        head.append(np.asarray(block))
+        n_head += len(head[-1])
+        if n_head >= TONE_ESTIMATION_LENGTH:
+            break
+    if n_head == 0:
+        raise ValueError("No samples found in the analysed signals.")
+    provisional = _sineFit(head, frequencies, fs)[0]
+    correction, projections, n_samples, squares = _sineFit(
+        _residualBlocks(chain(head, blocks), frequencies, fs, provisional),
+        frequencies,
+        fs,
+    )
+    parameters = provisional + correction
+    a, b, c = parameters[:harmonics], parameters[harmonics:-1], parameters[-1]
+    # a tone at fs/2 is a full-scale alternating sequence: its power is a^2, not a^2/2
+    nyquist = np.isclose(frequencies, fs / 2)[:, None]
+    harmonics_power = np.where(nyquist, a**2, (a**2 + b**2) / 2)
+    dc_power = c**2
+    # residual power of the least-squares fit
+    noise_power = (squares - np.sum(correction * projections, axis=0)) / n_samples
+    return frequencies, harmonics_power, dc_power, noise_power
+
+
+def harmonicMetrics(
+    harmonics_power: np.ndarray, dc_power: float, noise_power: float
+) -> tuple:
+    """_summary_
+    Computes the harmonic metrics of a signal from the power of its harmonics (see targetedMetrics).
+    The metrics of several signals are computed at once from (n_harmonics, n_signals) harmonic powers.
+    Args:
+        harmonics_power (np.ndarray): The power of the fundamental and of its harmonics.
+        dc_power (float): The DC power of the signal (or (n_signals,) array).
+        noise_power (float): The noise power of the signal (or (n_signals,) array).
+    Returns:
+        tuple[float, float, float, float, float, float, float]:
+            float(1): Signal power (in dB)
+            float(2): DC power (in dB)
+            float(3): Total Harmonic Distortion (THD) metric
+            float(4): Signal to Noise Ratio (SNR) metric
+            float(5): Signal to Noise & Distortion Ratio (SNDR) metric
+            float(6): Fractional Second-Harmonic Distortion (HD2) metric
+            float(7): Fractional Third-Harmonic Distortion (HD3) metric
+    """
+    signal_power = harmonics_power[0]
+    distortion_power = np.sum(harmonics_power[1:], axis=0)
+    SIGNAL_POWER_DB = 10 * np.log10(signal_power)
+    DC_POWER_DB = 10 * np.log10(dc_power)
+    THD = 10 * np.log10(distortion_power / signal_power)
+    SNR = 10 * np.log10(signal_power / noise_power)
+    SNDR = 10 * np.log10(signal_power / (noise_power + distortion_power))
+    HD2 = np.nan
+    HD3 = np.nan
+    if len(harmonics_power) > 1:
+        HD2 = 10 * np.log10(harmonics_power[1] / signal_power)
+    if len(harmonics_power) > 2:
+        HD3 = 10 * np.log10(harmonics_power[2] / signal_power)
+    return SIGNAL_POWER_DB, DC_POWER_DB, THD, SNR, SNDR, HD2, HD3
+
+
+def streamHarmonics(
+    blocks, fs: float, tone_frequency: float = None, harmonics: int = 7
+) -> tuple:
+    """_summary_
+    Measures the harmonic content of streamed signals in a single pass (see targetedMetrics).
+    Without a tone frequency, the fundamental tone of the first signal is located (see estimateToneFrequency)
+    over its first TONE_ESTIMATION_LENGTH samples, which are the only samples held in memory.
+    Args:
+        blocks (iterable): The blocks of samples, (n_samples,) or (n_samples, n_signals) arrays.
+        fs (float): The sampling frequency [Hz].
+        tone_frequency (float, optional): The frequency of the fundamental tone [Hz]. Defaults to None (estimated).
+        harmonics (int, optional): The number of harmonics (including the fundamental). Defaults to 7.
+    Returns:
+        tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the frequency of the fundamental tone,
+        and the results of targetedMetrics.
+    """
+    blocks = iter(blocks)
+    if tone_frequency is None:
+        head = []
+        n_head = 0
+        for block in blocks:
+            block = np.asarray(block)
+            head.append(block)
+            n_head += len(block)
+            if n_head >= TONE_ESTIMATION_LENGTH:
+                break
+        if len(head) == 0:
+            raise ValueError("No samples found in the analysed signals.")
+        first = np.concatenate(head)
+        first = first.reshape(len(first), -1)[:TONE_ESTIMATION_LENGTH, 0]
+        tone_frequency = estimateToneFrequency(first, fs)
+        blocks = chain(head, blocks)
+    return (tone_frequency,) + targetedMetrics(
+        blocks, fs, tone_frequency, harmonics=harmonics
+    )
+
+
+def smoothLengths(low: int, high: int) -> np.ndarray:
+    """_summary_
+    Computes the 5-smooth numbers (2^a 3^b 5^c) in [low, high]: the lengths of the fastest FFTs.
+    Args:
+        low (int): The lower bound.
+        high (int): The upper bound.
+    Returns:
+        np.ndarray: the sorted 5-smooth numbers.
+    """
+    lengths = []
+    power_5 = 1
+    while power_5 <= high:
+        power_35 = power_5
+        while power_35 <= high:
+            length = power_35
+            while length <= high:
+                if length >= low:
+                    lengths.append(length)
+                length *= 2
+            power_35 *= 3
+        power_5 *= 5
+    return np.array(sorted(lengths), dtype=np.int64)
+
+
+def coherentRecord(x: np.ndarray, fs: float, tone_frequency: float = None) -> tuple:
+    """_summary_
+    Finds the longest coherent record of a signal whose length is FFT-friendly: among the 5-smooth
+    lengths (see smoothLengths) down to COHERENT_RECORD_FRACTION of the signal, the longest one holding
+    an integer number of periods of the fundamental tone, within COHERENCE_TOLERANCE cycles (or else,
+    the most coherent one). The record is taken at the end of the signal, away from start-up transients.
+    Args:
+        x (np.ndarray): The samples of the signal.
+        fs (float): The sampling frequency [Hz].
+        tone_frequency (float, optional): The frequency of the fundamental tone [Hz]. Defaults to None
+                                        (estimated, see estimateToneFrequency).
+    Returns:
+        tuple[int, int, float, float]: the first sample and the number of samples of the record,
+        the number of periods of the fundamental tone it holds, and its coherence error (in cycles).
+    """
+    if tone_frequency is None:
+        tone_frequency = estimateToneFrequency(x, fs)
+    n_samples = len(x)
+    lengths = smoothLengths(
+        max(2, int(np.ceil(COHERENT_RECORD_FRACTION * n_samples))), n_samples
+    )[::-1]
+    cycles = lengths * tone_frequency / fs
+    errors = np.abs(cycles - np.round(cycles))
+    coherent = np.flatnonzero(errors <= COHERENCE_TOLERANCE)
+    best = coherent[0] if len(coherent) > 0 else int(np.argmin(errors))
+    length = int(lengths[best])
+    return n_samples - length, length, float(cycles[best]), float(errors[best])
@@ -19,7 +19,7 @@ def getParent(path, levels=0):
 
 def plotPrettyFFT(
     freq,
-    power,
+    power=None,
     title: str = "",
     xlabel: str = "",
     ylabel: str = "",
@@ -36,8 +36,9 @@ def plotPrettyFFT(
     """_summary_
     Plot a pretty FFT plot
     Args:
-        freq (array/list): frequency array
-        power (array/list): power array
+        freq (array/list/Spectrum): frequency array, or the one-sided spectrum (Spectrum or DataFrame)
+                        returned by the dynamic evaluations (plotted directly, from 0 to fs/2)
+        power (array/list): power array. Defaults to the "power_db" column of the spectrum.
         title (str)     : title of the plot
         xlabel (str)    : x-axis label
         ylabel (str)    : y-axis label
@@ -65,6 +66,10 @@ def plotPrettyFFT(
     import pdb
     from itertools import cycle
 
+    if power is None:
+        # one-sided spectrum: the index holds the (non-negative) frequency bins
+        freq, power = freq.index, freq["power_db"]
+    freq, power = array(freq), array(power)
     plt.rc("axes", titlesize=14)  # fontsize of the axes title
     plt.rc("axes", labelsize=12)  # fontsize of the x and y labels
     plt.rc("xtick", labelsize=12)  # fontsize of the tick labels
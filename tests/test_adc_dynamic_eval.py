@@ -1,8 +1,12 @@
 from re import X
 from dycifer.read import readSignals
 from dycifer.mixed_signals import adcDynamicEval
+from dycifer.spectrum import Spectrum
 from dycifer.dycifer import cli
+import os
+import tempfile
 import unittest
+from unittest import mock
 from dycifer.utils import plotPrettyFFT
 import numpy as np
 import matplotlib.pyplot as plt
@@ -10,6 +14,14 @@ from pandas import DataFrame
 
 
 class TestADCDynamicEval(unittest.TestCase):
+    def setUp(self):
+        # the signals cache of the tests lives in a temporary directory
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ = mock.patch.dict(os.environ, {"DYCIFER_CACHE_DIR": cache_dir.name})
+        environ.start()
+        self.addCleanup(environ.stop)
+
     def test_adcDynamicEval(self):
         # create the test data
         fs = 10e9  # sampling frequency
@@ -51,12 +63,14 @@ class TestADCDynamicEval(unittest.TestCase):
             signals, fs / 5, n_bits=res, signal_span_factor=0.002
         )  # 0.2 % of power spectral density leakage
         self.assertIsNotNone(spectrum)
-        self.assertEqual(DataFrame, type(spectrum))
-        self.assertAlmostEqual(-6.0517, signal_power, places=3)
+        self.assertEqual(Spectrum, type(spectrum))
+        # single-sided power: +3.0103 dB from the two-sided power of the tone
+        self.assertAlmostEqual(-3.0414, signal_power, places=3)
         self.assertAlmostEqual(-69.9662, dc_power, places=3)
         self.assertAlmostEqual(7.9485, sfdr, places=3)
         self.assertAlmostEqual(-7.9485, thd, places=3)
-        self.assertAlmostEqual(38.5057, snr, places=3)
+        # the fs/2 bin is now counted as a noise bin
+        self.assertAlmostEqual(38.4995, snr, places=3)
         self.assertAlmostEqual(7.9447, sndr, places=3)
         self.assertAlmostEqual(1.0273, enob, places=3)
 
@@ -2,15 +2,26 @@ from re import X
 from turtle import color
 from dycifer.read import readSignals
 from dycifer.analog import caosDynamicEval
+from dycifer.spectrum import Spectrum
 from dycifer.dycifer import cli
+import os
+import tempfile
 import unittest
+from unittest import mock
 from dycifer.utils import plotPrettyFFT
 import numpy as np
 import matplotlib.pyplot as plt
-from pandas import DataFrame
 
 
 class TestCAOSDynamicEval(unittest.TestCase):
+    def setUp(self):
+        # the signals cache of the tests lives in a temporary directory
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ = mock.patch.dict(os.environ, {"DYCIFER_CACHE_DIR": cache_dir.name})
+        environ.start()
+        self.addCleanup(environ.stop)
+
     def test_caosDynamicEval(self):
         # create the test data
         fs = 1e9  # sampling frequency
@@ -54,7 +65,7 @@ class TestCAOSDynamicEval(unittest.TestCase):
             noise_power=0.0,
         )  # 0.2 % of power spectral density leakage
         self.assertIsNotNone(out_spectrum)
-        self.assertEqual(DataFrame, type(out_spectrum))
+        self.assertEqual(Spectrum, type(out_spectrum))
         plotPrettyFFT(
             out_spectrum.index[out_spectrum.index >= 0],
             out_spectrum["power_db"][out_spectrum.index >= 0],
@@ -1,8 +1,51 @@
 from re import X
+import os
+import json
+import tempfile
+import threading
+from unittest import mock
 from dycifer import __version__
-from dycifer.read import readSignals
-from dycifer.mixed_signals import adcDynamicEval
-from dycifer.analog import caosDynamicEval, daosDynamicEval
+from dycifer.read import (
+    readSignals,
+    streamSignals,
+    collectSignals,
+    readSchema,
+    Reiterable,
+)
+from dycifer.cache import loadCachedSignals, storeCachedSignals, evictCache, clearCache
+from dycifer.resample import (
+    sampleSignals,
+    sampleBlocks,
+    resampleSignals,
+    resampleBlocks,
+)
+from dycifer.spectrum import (
+    Spectrum,
+    powerSpectrum,
+    harmonicBins,
+    spectralMetrics,
+    welchSegments,
+    cumulativePower,
+    bandPower,
+    excludedPower,
+    bandMetrics,
+    outOfBandMetrics,
+    targetedMetrics,
+)
+from dycifer.fft import FFTBackends, rfft
+from dycifer.mixed_signals import (
+    adcDynamicEval,
+    decodeBits,
+    decodeBlocks,
+    ColumnStatistics,
+    adcLinearityEval,
+    sigmaDeltaAdcDynamicEval,
+    sigmaDeltaDacDynamicEval,
+    dacTransitions,
+    dacDynamicEval,
+)
+from dycifer.decimation import FirDecimator, DecimationChain, cicTaps, halfBandTaps
+from dycifer.analog import caosDynamicEval, caosBatchEval, daosDynamicEval
 from dycifer.dycifer import cli
 import unittest
 from dycifer.utils import plotPrettyFFT
@@ -12,6 +55,14 @@ from pandas import DataFrame
 
 
 class TestDycifer(unittest.TestCase):
+    def setUp(self):
+        # the signals cache of the tests lives in a temporary directory
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ = mock.patch.dict(os.environ, {"DYCIFER_CACHE_DIR": cache_dir.name})
+        environ.start()
+        self.addCleanup(environ.stop)
+
     def test_version(self):
         self.assertTrue(__version__ == "0.1.1")
 
@@ -84,6 +135,411 @@ class TestDycifer(unittest.TestCase):
         signals = readSignals(file_path_fooling)
         self.assertIsNotNone(signals)
 
+    def test_streamSignals(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "time [s]": t,
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+                "unused": np.ones(len(t)),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "stream_signals.csv")
+            sdf.to_csv(file_path, index=False)
+            # column projection keeps only the time and the selected columns
+            signals = readSignals(file_path, columns=["vout"])
+            self.assertEqual(["vout"], list(signals.columns))
+            self.assertEqual("time [s]", signals.index.name)
+            blocks = list(streamSignals(file_path, columns=["vout"], chunk_size=300))
+            self.assertEqual([300, 300, 300, 100], [len(block) for block in blocks])
+            self.assertTrue(all(list(block.columns) == ["vout"] for block in blocks))
+            collected = collectSignals(iter(blocks))
+            self.assertTrue(np.allclose(collected["vout"].values, sdf["vout"].values))
+            self.assertTrue(np.allclose(collected.index.values, t))
+            with self.assertRaises(ValueError):
+                readSignals(file_path, columns=["vnotfound"])
+
+    def test_readSignals_compressed(self):
+        import gzip
+        import lzma
+
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "time [s]": t,
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for file_name, opener in [
+                ("signals.csv.gz", gzip.open),
+                ("signals.csv.xz", lzma.open),
+                # compression identified by the magic bytes, not by the extension
+                ("signals.csv", gzip.open),
+            ]:
+                file_path = os.path.join(tmp_dir, file_name)
+                with opener(file_path, "wt") as fp:
+                    sdf.to_csv(fp, index=False)
+                signals = readSignals(file_path, columns=["vout"], use_cache=False)
+                self.assertEqual(["vout"], list(signals.columns))
+                self.assertTrue(np.allclose(signals.index.values, t))
+                self.assertTrue(np.allclose(signals["vout"].values, sdf["vout"].values))
+                blocks = list(
+                    streamSignals(file_path, chunk_size=300, use_cache=False)
+                )
+                self.assertEqual([300, 300, 300, 100], [len(block) for block in blocks])
+                collected = collectSignals(iter(blocks))
+                self.assertTrue(np.allclose(collected["vin"].values, sdf["vin"].values))
+
+    def test_readSignals_segments(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 3000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "time [s]": t,
+                "vout": np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # segments overlapping by 10 samples (the restart of each segment repeats the last samples)
+            bounds = [(0, 1000), (990, 2000), (1990, 3000)]
+            # natural sort: signals_2 before signals_10
+            for idx, (start, stop) in zip([1, 2, 10], bounds):
+                sdf.iloc[start:stop].to_csv(
+                    os.path.join(tmp_dir, f"signals_{idx}.csv"), index=False
+                )
+            pattern = os.path.join(tmp_dir, "signals_*.csv")
+            paths = [
+                os.path.join(tmp_dir, f"signals_{idx}.csv") for idx in [1, 2, 10]
+            ]
+            for file_paths in [pattern, paths]:
+                # the stitched record is streamed, and never gathered by the reader
+                stream = readSignals(file_paths, use_cache=False)
+                self.assertTrue(isinstance(stream, Reiterable))
+                signals = collectSignals(stream)
+                self.assertEqual(len(t), len(signals))
+                self.assertTrue(np.allclose(signals.index.values, t))
+                self.assertTrue(np.allclose(signals["vout"].values, sdf["vout"].values))
+            blocks = list(streamSignals(pattern, chunk_size=400, use_cache=False))
+            self.assertTrue(all(len(block) <= 400 for block in blocks))
+            window = collectSignals(
+                readSignals(pattern, use_cache=False, row_range=(900, 2100))
+            )
+            self.assertTrue(np.allclose(window.index.values, t[900:2100]))
+            # the stitched record is evaluated as a single record
+            results = caosDynamicEval(readSignals(pattern, use_cache=False), fs, "vout")
+            self.assertFalse(results is None)
+            # gap between the segments
+            sdf.iloc[2200:3000].to_csv(
+                os.path.join(tmp_dir, "signals_10.csv"), index=False
+            )
+            with self.assertRaises(ValueError):
+                collectSignals(readSignals(pattern, use_cache=False))
+            # different columns in the segments
+            sdf.rename(columns={"vout": "vin"}).iloc[1990:3000].to_csv(
+                os.path.join(tmp_dir, "signals_10.csv"), index=False
+            )
+            with self.assertRaises(ValueError):
+                collectSignals(readSignals(pattern, use_cache=False))
+            with self.assertRaises(FileNotFoundError):
+                collectSignals(
+                    readSignals(os.path.join(tmp_dir, "none_*.csv"), use_cache=False)
+                )
+
+    def test_readSignals_window(self):
+        import gzip
+
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 5000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "time [s]": t,
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for file_name, opener in [
+                ("window_signals.csv", open),
+                ("window_signals.csv.gz", gzip.open),
+            ]:
+                file_path = os.path.join(tmp_dir, file_name)
+                with opener(file_path, "wt") as fp:
+                    sdf.to_csv(fp, index=False)
+                for engine in ["pandas", "native"]:
+                    signals = readSignals(
+                        file_path,
+                        columns=["vout"],
+                        use_cache=False,
+                        time_range=(1000.5 / fs, 2000 / fs),
+                        engine=engine,
+                    )
+                    self.assertEqual(["vout"], list(signals.columns))
+                    self.assertTrue(np.allclose(signals.index.values, t[1001:2001]))
+                    self.assertTrue(
+                        np.allclose(signals["vout"].values, sdf["vout"].values[1001:2001])
+                    )
+                    signals = readSignals(
+                        file_path, use_cache=False, row_range=(123, 4567), engine=engine
+                    )
+                    self.assertTrue(np.allclose(signals.index.values, t[123:4567]))
+                blocks = list(
+                    streamSignals(
+                        file_path, chunk_size=700, use_cache=False, time_range=(None, 3e-6)
+                    )
+                )
+                collected = collectSignals(iter(blocks))
+                self.assertTrue(np.allclose(collected.index.values, t[:3001]))
+                signals = readSignals(file_path, use_cache=False, time_range=(1.0, 2.0))
+                self.assertEqual(0, len(signals))
+                with self.assertRaises(ValueError):
+                    readSignals(file_path, time_range=(0, 1e-6), row_range=(0, 10))
+
+    def test_readSignals_engines(self):
+        from importlib.util import find_spec
+        from unittest import mock
+        import dycifer.read
+
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 5000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "time [s]": t,
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "engine_signals.csv")
+            sdf.to_csv(file_path, index=False)
+            reference = readSignals(file_path, use_cache=False, engine="pandas")
+            # parse the file in several byte ranges, with two workers
+            with mock.patch.object(dycifer.read, "CSV_RANGE_SIZE", 2**12), mock.patch(
+                "os.cpu_count", return_value=2
+            ):
+                signals = readSignals(file_path, use_cache=False, engine="native")
+            self.assertTrue(reference.equals(signals))
+            self.assertEqual("time [s]", signals.index.name)
+            self.assertTrue(np.array_equal(reference.index.values, signals.index.values))
+            if find_spec("pyarrow") is not None:
+                signals = readSignals(file_path, use_cache=False, engine="pyarrow")
+                self.assertEqual(list(reference.columns), list(signals.columns))
+                self.assertEqual("time [s]", signals.index.name)
+                self.assertTrue(np.allclose(reference.values, signals.values, rtol=1e-15))
+            with self.assertRaises(ValueError):
+                readSignals(file_path, use_cache=False, engine="notanengine")
+
+    def test_readSignals_cache(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "time [s]": t,
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            with mock.patch.dict(os.environ, {"DYCIFER_CACHE_DIR": cache_dir}):
+                file_path = os.path.join(tmp_dir, "cached_signals.csv")
+                sdf.to_csv(file_path, index=False)
+                parsed = readSignals(file_path, columns=["vout"])
+                self.assertTrue(os.path.isdir(cache_dir))
+                # the second read is memory-mapped from the cache
+                cached = readSignals(file_path, columns=["vout"])
+                self.assertTrue(isinstance(cached["vout"].values, np.memmap))
+                self.assertTrue(np.array_equal(parsed.values, cached.values))
+                self.assertTrue(np.array_equal(parsed.index.values, cached.index.values))
+                self.assertEqual(parsed.index.name, cached.index.name)
+                # columns missing from the cache are parsed and added to it
+                self.assertEqual(
+                    ["vin", "vout"], list(readSignals(file_path).columns)
+                )
+                self.assertIsNotNone(loadCachedSignals(file_path))
+                # modifying the file invalidates the cache entry
+                sdf["vout"] = 3.0 * sdf["vout"]
+                sdf.to_csv(file_path, index=False)
+                self.assertIsNone(loadCachedSignals(file_path, columns=["vout"]))
+                self.assertTrue(
+                    np.allclose(readSignals(file_path)["vout"].values, sdf["vout"].values)
+                )
+                # an in-place edit keeping the size of the file invalidates the cache entry
+                with open(file_path, "rb") as fp:
+                    contents = bytearray(fp.read())
+                digit = contents.index(b"5", len(contents) // 2)
+                contents[digit : digit + 1] = b"6"
+                with open(file_path, "wb") as fp:
+                    fp.write(contents)
+                self.assertIsNone(loadCachedSignals(file_path, columns=["vout"]))
+                edited = readSignals(file_path)
+                # touching the file keeps the entry, and records the new modification time
+                stat = os.stat(file_path)
+                os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                cached = loadCachedSignals(file_path)
+                self.assertTrue(np.array_equal(edited.values, cached.values))
+                entry_dir = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+                with open(os.path.join(entry_dir, "manifest.json")) as fp:
+                    manifest = json.load(fp)
+                self.assertEqual(os.stat(file_path).st_mtime_ns, manifest["mtime_ns"])
+                # the least recently used entries are evicted
+                evictCache(0)
+                self.assertIsNone(loadCachedSignals(file_path))
+                uncached = readSignals(file_path, use_cache=False)
+                self.assertFalse(isinstance(uncached["vout"].values, np.memmap))
+                self.assertIsNone(loadCachedSignals(file_path))
+
+    def test_storeCachedSignals_concurrent(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        sdf = DataFrame({"time [s]": t, "vin": np.sin(2 * np.pi * 10e6 * t)})
+        for col in range(8):
+            sdf[f"v{col}"] = col + np.cos(2 * np.pi * 10e6 * t)
+        header = list(sdf.columns)
+        signals = sdf.set_index("time [s]")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "cached_signals.csv")
+            sdf.to_csv(file_path, index=False)
+
+            def store(columns, barrier):
+                barrier.wait()
+                storeCachedSignals(file_path, signals[columns], header)
+
+            for _ in range(5):
+                clearCache()
+                # two writers caching different columns of the same file at once
+                barrier = threading.Barrier(2)
+                writers = [
+                    threading.Thread(target=store, args=(columns, barrier))
+                    for columns in [["vin", "v0", "v1", "v2"], ["v3", "v4", "v5"]]
+                ]
+                for writer in writers:
+                    writer.start()
+                for writer in writers:
+                    writer.join()
+                cached = loadCachedSignals(file_path, columns=header[1:8])
+                self.assertIsNotNone(cached)
+                for col in cached.columns:
+                    self.assertTrue(np.array_equal(signals[col].values, cached[col].values))
+
+    def test_readRawSignals(self):
+        def write_rawfile(file_path, data, ltspice=False):
+            # ngspice: ASCII header and float64 records
+            # LTspice: UTF-16-LE header, float64 time and float32 traces
+            flags = "real forward" if ltspice else "real"
+            header = (
+                f"Title: test\nPlotname: Transient Analysis\nFlags: {flags}\n"
+                f"No. Variables: 3\nNo. Points: {len(data)}\nVariables:\n"
+                "\t0\ttime\ttime\n\t1\tv(in)\tvoltage\n\t2\tv(out)\tvoltage\n"
+                "Binary:\n"
+            )
+            dtype = "<f4" if ltspice else "<f8"
+            records = np.zeros(
+                len(data), dtype=[("t", "<f8"), ("vin", dtype), ("vout", dtype)]
+            )
+            records["t"], records["vin"], records["vout"] = data.T
+            with open(file_path, "wb") as fp:
+                fp.write(header.encode("utf-16-le" if ltspice else "latin-1"))
+                fp.write(records.tobytes())
+
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        data = np.stack(
+            [t, np.sin(2 * np.pi * 10e6 * t), 2.0 * np.sin(2 * np.pi * 10e6 * t)],
+            axis=1,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for ltspice in [False, True]:
+                file_path = os.path.join(tmp_dir, f"signals_{ltspice}.raw")
+                write_rawfile(file_path, data, ltspice=ltspice)
+                signals = readSignals(file_path, columns=["v(out)"])
+                self.assertEqual(["v(out)"], list(signals.columns))
+                self.assertEqual("time", signals.index.name)
+                # the traces are memory-mapped views of the rawfile
+                self.assertTrue(isinstance(signals["v(out)"].values, np.memmap))
+                self.assertTrue(np.allclose(signals["v(out)"].values, data[:, 2]))
+                self.assertTrue(np.allclose(signals.index.values, t))
+                # the analysis window is sliced from the memory-mapped traces
+                signals = readSignals(file_path, time_range=(100.5 / fs, 200 / fs))
+                self.assertTrue(np.allclose(signals.index.values, t[101:201]))
+                signals = readSignals(file_path, row_range=(900, None))
+                self.assertTrue(np.allclose(signals["v(in)"].values, data[900:, 1]))
+
+    def test_readSignals_formats(self):
+        from importlib.util import find_spec
+
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 1000) / fs  # time axis
+        sdf = DataFrame(
+            {
+                "time [s]": t,
+                "vin": np.sin(2 * np.pi * 10e6 * t),
+                "vout": 2.0 * np.sin(2 * np.pi * 10e6 * t),
+            }
+        )
+        writers = {}
+        if find_spec("pyarrow") is not None:
+            writers["signals.parquet"] = lambda path: sdf.to_parquet(path, index=False)
+            writers["signals.feather"] = lambda path: sdf.to_feather(path)
+        if find_spec("tables") is not None:
+            writers["signals.h5"] = lambda path: sdf.set_index("time [s]").to_hdf(
+                path, key="signals", format="table"
+            )
+        if not bool(writers):
+            self.skipTest("pyarrow and tables are not installed")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for file_name, writer in writers.items():
+                file_path = os.path.join(tmp_dir, file_name)
+                writer(file_path)
+                self.assertEqual(
+                    ["time [s]", "vin", "vout"], sorted(readSchema(file_path))
+                )
+                signals = readSignals(
+                    file_path, columns=["vout"], time_range=(100 / fs, 199.5 / fs)
+                )
+                self.assertEqual(["vout"], list(signals.columns))
+                self.assertEqual("time [s]", signals.index.name)
+                self.assertTrue(np.allclose(signals.index.values, t[100:200]))
+                self.assertTrue(
+                    np.allclose(signals["vout"].values, sdf["vout"].values[100:200])
+                )
+                signals = readSignals(file_path, columns=["vin"], row_range=(250, 750))
+                self.assertEqual("time [s]", signals.index.name)
+                self.assertTrue(np.allclose(signals.index.values, t[250:750]))
+                blocks = list(
+                    streamSignals(file_path, chunk_size=300, row_range=(250, 750))
+                )
+                self.assertEqual([300, 200], [len(block) for block in blocks])
+
+    def test_resampleSignals(self):
+        fs = 1e9  # sampling frequency
+        # non-uniform (adaptive) time steps of a transient simulation
+        rng = np.random.default_rng(0)
+        t = np.cumsum(rng.uniform(0.1, 0.9, 4000)) / fs
+        sdf = DataFrame({"vout": np.sin(2 * np.pi * 10e6 * t)}, index=t)
+        sdf.index.name = "time [s]"
+        signals = sampleSignals(sdf, fs)
+        ts = np.diff(signals.index.values)
+        self.assertTrue(np.allclose(ts, 1 / fs))
+        self.assertTrue(
+            np.allclose(
+                signals["vout"].values,
+                np.sin(2 * np.pi * 10e6 * signals.index.values),
+                atol=1e-3,
+            )
+        )
+        for method in ["linear", "cubic", "hold"]:
+            resampled = resampleSignals(sdf, fs, method=method)
+            blocks = [sdf.iloc[i : i + 333] for i in range(0, len(sdf), 333)]
+            streamed = collectSignals(resampleBlocks(blocks, fs, method=method))
+            self.assertTrue(np.allclose(resampled.index.values, streamed.index.values))
+            self.assertTrue(np.allclose(resampled.values, streamed.values))
+
     def test_adcDynamicEval(self):
         # create the test data
         fs = 10e9  # sampling frequency
@@ -99,9 +555,6 @@ class TestDycifer(unittest.TestCase):
         # signal 1
         freq1 = 300e6  # 300 MHz
         s = 0.5 * np.sin(2 * np.pi * freq1 * t) + 0.5  # signal 1
-        # signal 2
-        freq2 = 600e6  # 500 MHz
-        # s += 0.2*np.sin(2*np.pi*freq2*t)# signal 2
         # signal 3
         freq3 = 900e6  # 900 MHz
         s += 0.2 * np.sin(2 * np.pi * freq3 * t)  # signal 3
@@ -125,15 +578,540 @@ class TestDycifer(unittest.TestCase):
             signals, fs / 5, n_bits=res, signal_span_factor=0.002
         )  # 0.2 % of power spectral density leakage
         self.assertIsNotNone(spectrum)
-        self.assertEqual(DataFrame, type(spectrum))
-        self.assertAlmostEqual(-6.0517, signal_power, places=3)
+        self.assertEqual(Spectrum, type(spectrum))
+        # single-sided power: +3.0103 dB from the two-sided power of the tone
+        self.assertAlmostEqual(-3.0414, signal_power, places=3)
         self.assertAlmostEqual(-69.9662, dc_power, places=3)
         self.assertAlmostEqual(7.9485, sfdr, places=3)
         self.assertAlmostEqual(-7.9485, thd, places=3)
-        self.assertAlmostEqual(38.5057, snr, places=3)
+        # the fs/2 bin is now counted as a noise bin
+        self.assertAlmostEqual(38.4995, snr, places=3)
         self.assertAlmostEqual(7.9447, sndr, places=3)
         self.assertAlmostEqual(1.0273, enob, places=3)
 
+    def test_decodeBits(self):
+        rng = np.random.default_rng(0)
+        res = 12
+        codes = rng.integers(0, 2**res, 10000)
+        # bit signals at 0 V / 1.2 V, most significant bit first
+        levels = (codes[:, None] >> np.arange(res - 1, -1, -1)) & 1
+        bits = 1.2 * levels + rng.normal(0, 0.01, levels.shape)
+        np.testing.assert_array_equal(codes, decodeBits(bits))
+        np.testing.assert_array_equal(codes, decodeBits(bits[:, ::-1], ascending=True))
+        # decoding the bit signals matches the evaluation of the decimal word
+        fs = 1e9
+        t = np.arange(len(codes)) / fs
+        columns = {f"b{idx}": bits[:, res - 1 - idx] for idx in range(res)}
+        bit_signals = DataFrame({"time [s]": t, **columns}).set_index("time [s]")
+        word_signals = DataFrame({"time [s]": t, "dout": codes}).set_index("time [s]")
+        from_bits = adcDynamicEval(bit_signals, fs, asceding_bit_order=True)
+        from_word = adcDynamicEval(word_signals, fs, n_bits=res, v_source=1.2)
+        np.testing.assert_allclose(
+            from_word[0]["vout"], from_bits[0]["vout"], rtol=0.0, atol=0.1
+        )
+        self.assertAlmostEqual(from_word[2], from_bits[2], delta=0.1)
+        # the statistics of the streamed blocks match those of the whole record
+        blocks = [bit_signals.iloc[idx : idx + 999] for idx in range(0, len(t), 999)]
+        statistics = ColumnStatistics()
+        for block in blocks:
+            statistics.update(block.values)
+        self.assertEqual(len(t), statistics.count)
+        np.testing.assert_allclose(bit_signals.values.mean(axis=0), statistics.mean)
+        np.testing.assert_array_equal(bit_signals.values.min(axis=0), statistics.minimum)
+        np.testing.assert_array_equal(bit_signals.values.max(axis=0), statistics.maximum)
+        dout, _ = decodeBlocks(iter(blocks), ascending=True)
+        np.testing.assert_array_equal(codes, dout["dec_word"].values)
+        np.testing.assert_array_equal(t, dout.index.values)
+        streamed = adcDynamicEval(iter(blocks), fs, asceding_bit_order=True)
+        np.testing.assert_array_equal(from_bits[0]["vout"], streamed[0]["vout"])
+        # (the harmonics of the random codes lie beyond fs/2: no HD2 nor HD3)
+        np.testing.assert_array_equal(from_bits[2:], streamed[2:])
+        # re-iterable blocks are decoded in two passes, holding a single block at a time
+        passes = []
+
+        def openBlocks():
+            passes.append(len(passes))
+            return iter(blocks)
+
+        dout, _ = decodeBlocks(Reiterable(openBlocks), ascending=True)
+        self.assertEqual(2, len(passes))
+        np.testing.assert_array_equal(codes, dout["dec_word"].values)
+        np.testing.assert_array_equal(t, dout.index.values)
+        streamed = adcDynamicEval(
+            Reiterable(openBlocks), fs, asceding_bit_order=True
+        )
+        self.assertEqual(4, len(passes))
+        np.testing.assert_array_equal(from_bits[0]["vout"], streamed[0]["vout"])
+
+    def test_adcDynamicEval_targeted(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**14) / fs  # time axis
+        f_in = fs * 127.37 / len(t)  # non-coherent sampling
+        res = 10
+        codes = np.round((np.sin(2 * np.pi * f_in * t) + 1) / 2 * (2**res - 1))
+        levels = (codes.astype(int)[:, None] >> np.arange(res)) & 1
+        columns = {f"b{idx}": 1.2 * levels[:, idx] for idx in range(res)}
+        bit_signals = DataFrame({"time [s]": t, **columns}).set_index("time [s]")
+        blocks = [bit_signals.iloc[i : i + 1000] for i in range(0, len(t), 1000)]
+        in_memory = adcDynamicEval(
+            bit_signals, fs, asceding_bit_order=True, targeted=True, tone_frequency=f_in
+        )
+        # the streamed bit signals are decoded and measured one block at a time
+        with mock.patch(
+            "dycifer.mixed_signals.decodeBlocks",
+            side_effect=AssertionError("gathered"),
+        ):
+            streamed = adcDynamicEval(
+                blocks, fs, asceding_bit_order=True, targeted=True, tone_frequency=f_in
+            )
+        self.assertIsNone(streamed[0])
+        np.testing.assert_allclose(in_memory[1], streamed[1], rtol=1e-9)
+        np.testing.assert_allclose(in_memory[2:], streamed[2:], rtol=1e-9)
+        # the HD2 is measured from two harmonics on, the HD3 from three harmonics on
+        two_harmonics = adcDynamicEval(
+            blocks,
+            fs,
+            asceding_bit_order=True,
+            targeted=True,
+            tone_frequency=f_in,
+            harmonics=2,
+        )
+        self.assertAlmostEqual(in_memory[9], two_harmonics[9], delta=0.1)
+        self.assertTrue(np.isnan(two_harmonics[10]))
+
+    def test_adcLinearityEval(self):
+        rng = np.random.default_rng(0)
+        res = 8
+        # transition levels of an 8 bit ADC with a wide, a narrow and a missing code
+        widths = np.ones(2**res - 2)
+        widths[100], widths[101], widths[50] = 1.4, 0.6, 0.0
+        transitions = np.concatenate([[0.0], np.cumsum(widths)])
+        expected_dnl = widths / widths.mean() - 1
+        n_samples = 2**22
+        stimuli = {
+            # slightly overdriving sine (random phases) and ramp stimuli
+            "sine": transitions[-1] / 2
+            + (transitions[-1] / 2 + 3) * np.sin(2 * np.pi * rng.random(n_samples)),
+            "ramp": np.linspace(-3, transitions[-1] + 3, n_samples),
+        }
+        fs = 1e6
+        for stimulus, tolerance in [("sine", 0.05), ("ramp", 1e-3)]:
+            codes = np.searchsorted(transitions, stimuli[stimulus], side="right")
+            word_signals = DataFrame({"dout": codes})
+            (
+                linearity,
+                dnl_max,
+                dnl_min,
+                inl_max,
+                inl_min,
+                missing_codes,
+            ) = adcLinearityEval(word_signals, fs, n_bits=res, stimulus=stimulus)
+            self.assertEqual(n_samples, linearity["counts"].sum())
+            np.testing.assert_allclose(
+                expected_dnl, linearity["dnl"].values[1:-1], atol=tolerance
+            )
+            np.testing.assert_array_equal([51], missing_codes)
+            self.assertAlmostEqual(-1.0, dnl_min)
+            self.assertAlmostEqual(expected_dnl.max(), dnl_max, delta=tolerance)
+            # endpoint fit: no INL at the first and last transition levels
+            self.assertAlmostEqual(0.0, linearity["inl"].values[1])
+            self.assertAlmostEqual(0.0, linearity["inl"].values[-1])
+            self.assertAlmostEqual(inl_min, np.nanmin(linearity["inl"].values))
+            # the codes decoded from streamed bit signals are counted block by block
+            bits = 1.2 * ((codes[:, None] >> np.arange(res - 1, -1, -1)) & 1)
+            bit_signals = DataFrame(bits, columns=[f"b{idx}" for idx in range(res)])
+            blocks = (
+                bit_signals.iloc[idx : idx + 100000]
+                for idx in range(0, n_samples, 100000)
+            )
+            streamed = adcLinearityEval(
+                blocks, fs, stimulus=stimulus, bit_threshold=0.6
+            )
+            np.testing.assert_array_equal(linearity["counts"], streamed[0]["counts"])
+            # without a decision level, re-iterable blocks are read in two passes
+            blocks = Reiterable(
+                lambda: (
+                    bit_signals.iloc[idx : idx + 100000]
+                    for idx in range(0, n_samples, 100000)
+                )
+            )
+            streamed = adcLinearityEval(blocks, fs, stimulus=stimulus)
+            np.testing.assert_array_equal(linearity["counts"], streamed[0]["counts"])
+        with self.assertRaises(ValueError):
+            adcLinearityEval(word_signals, fs, n_bits=res, stimulus="triangle")
+        with self.assertRaises(ValueError):
+            adcLinearityEval(word_signals, fs, n_bits=res - 1)
+
+    def test_decimation(self):
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal(10007)
+        block_lengths = [1, 5, 100, 3, 2000, 7, 7891]
+        for taps, ratio in [(cicTaps(8, 5), 8), (halfBandTaps(), 2)]:
+            # the streamed decimation matches the decimated convolution of the whole signal
+            expected = np.convolve(x, taps)[len(taps) - 1 : len(x)][::ratio]
+            decimator = FirDecimator(taps, ratio)
+            splits = np.cumsum(block_lengths)[:-1]
+            decimated = np.concatenate(
+                [decimator.decimate(block) for block in np.split(x, splits)]
+            )
+            np.testing.assert_allclose(expected, decimated, rtol=0.0, atol=1e-12)
+        # half-band filter: flat passband up to fs/8, stopband from 3fs/8
+        response = 20 * np.log10(np.abs(np.fft.rfft(halfBandTaps(), 2**14)))
+        freq = np.fft.rfftfreq(2**14)
+        self.assertLess(np.max(np.abs(response[freq <= 0.125])), 1e-3)
+        self.assertLess(np.max(response[freq >= 0.375]), -100)
+        self.assertEqual(32, DecimationChain(64).ratio)
+        with self.assertRaises(ValueError):
+            DecimationChain(60)
+        # a signal band too wide for the decimation chain (an OSR below 8)
+        with self.assertRaisesRegex(ValueError, "not a valid signal bandwidth"):
+            sigmaDeltaAdcDynamicEval(DataFrame({"dout": np.ones(64)}), 64e6, bandwidth=5e6)
+
+    def test_sigmaDeltaAdcDynamicEval(self):
+        def modulator(u):
+            # second order, 1-bit sigma-delta modulator
+            v = np.empty(len(u))
+            i1 = i2 = 0.0
+            for n, un in enumerate(u.tolist()):
+                y = 1.0 if i2 >= 0 else -1.0
+                v[n] = y
+                i1 += un - y
+                i2 += i1 - 2 * y
+            return v
+
+        fs = 64e6
+        osr = 64
+        bandwidth = fs / 2 / osr
+        n_samples = 2**20
+        t = np.arange(n_samples) / fs
+        signals = DataFrame(
+            {"dout": modulator(0.5 * np.sin(2 * np.pi * bandwidth / 5.3 * t))}
+        )
+        (
+            modulator_spectrum,
+            decimated_spectrum,
+            target_harmonics,
+            indicators,
+        ) = sigmaDeltaAdcDynamicEval(signals, fs, osr=osr)
+        self.assertEqual(Spectrum, type(modulator_spectrum))
+        self.assertAlmostEqual(fs / osr / 2 * 4, 1 / decimated_spectrum.ts)
+        # same frequency resolution of both spectra
+        self.assertAlmostEqual(
+            modulator_spectrum.freq[1], decimated_spectrum.freq[1], places=6
+        )
+        self.assertAlmostEqual(
+            bandwidth / 5.3, target_harmonics[0][0], delta=modulator_spectrum.freq[1]
+        )
+        modulator_metrics = indicators.loc["Modulator"]
+        decimated_metrics = indicators.loc["Decimated"]
+        # 0.5 V amplitude sine wave
+        self.assertAlmostEqual(
+            10 * np.log10(0.125), modulator_metrics["Signal Power (dB)"], places=1
+        )
+        self.assertGreater(modulator_metrics["SNR (dB)"], 65)
+        # the decimation chain keeps the in-band signal and noise
+        for metric in ["Signal Power (dB)", "SNR (dB)", "SNDR (dB)", "DR (dB)"]:
+            self.assertAlmostEqual(
+                modulator_metrics[metric], decimated_metrics[metric], delta=0.5
+            )
+        # full scale (+-1) to -6 dBFS signal
+        self.assertAlmostEqual(
+            modulator_metrics["DR (dB)"] - modulator_metrics["SNR (dB)"],
+            10 * np.log10(0.5 / 0.125),
+            places=1,
+        )
+        self.assertAlmostEqual(
+            (modulator_metrics["SNDR (dB)"] - 1.76) / 6.02, modulator_metrics["ENOB"]
+        )
+        # the streamed modulator output gives the same results
+        blocks = (
+            signals.iloc[idx : idx + 77777] for idx in range(0, n_samples, 77777)
+        )
+        streamed = sigmaDeltaAdcDynamicEval(blocks, fs, bandwidth=bandwidth)[3]
+        np.testing.assert_allclose(indicators.values, streamed.values, rtol=1e-9)
+        with self.assertRaises(ValueError):
+            sigmaDeltaAdcDynamicEval(signals, fs)
+        file_path = "./resources/data/test_signals_sigma_delta.csv"
+        signals.to_csv(file_path, index=False)
+        args = [
+            "mixedsignals",
+            "-sda",
+            "-s",
+            file_path,
+            "-fs",
+            "64 M",
+            "-osr",
+            "64",
+            "-cs",
+            "100000",
+            "-gt",
+            "-o",
+            "./resources/tables/test_mixed_signals_sigmaDeltaAdcDynamicEval",
+        ]
+        with self.assertRaises(SystemExit):
+            cli(args)
+
+    def test_bandPower(self):
+        rng = np.random.default_rng(0)
+        power = rng.random(1000)
+        cumulative = cumulativePower(power)
+        low = np.array([0, 10, 995, 500])
+        high = np.array([5, 300, 1200, 501])
+        np.testing.assert_allclose(
+            [np.sum(power[lo:hi]) for lo, hi in zip(low, high)],
+            bandPower(cumulative, low, high),
+        )
+        # overlapping bands are counted once
+        low = np.array([10, 0, 15, 100, 30])
+        high = np.array([20, 5, 40, 110, 35])
+        union = np.zeros(len(power), dtype=bool)
+        for lo, hi in zip(low, high):
+            union[lo:hi] = True
+        self.assertAlmostEqual(
+            np.sum(power[union]), excludedPower(cumulative, low, high)
+        )
+
+    def test_bandMetrics_edge_tone(self):
+        # a tone on the last bin of the band spills its [bin - span, bin + span) bins over the band edge
+        span, band_bins = 3, 100
+        power = np.full(1025, 1e-9)
+        power[97:103] = 0.1
+        power[100] = 1.0
+        power[300] = 1e-4
+        harmonic_bins, harmonics_power, *_ = bandMetrics(
+            power, 2048, band_bins, harmonics=3, span=span
+        )
+        self.assertEqual(100, harmonic_bins[0])
+        # only the in-band bins of the tone are signal power
+        self.assertAlmostEqual(1.3, harmonics_power[0])
+        oob_noise, oob_spur, spur_bin = outOfBandMetrics(
+            power, band_bins, harmonics_power[0], span=span, signal_bin=100
+        )
+        # the tone bins above the band edge are neither a spur nor out-of-band noise
+        self.assertEqual(300, spur_bin)
+        self.assertAlmostEqual(10 * np.log10((1e-4 + 5e-9) / 1.3), oob_spur)
+        self.assertAlmostEqual(10 * np.log10((1e-4 + 921e-9) / 1.3), oob_noise)
+
+    def test_sigmaDeltaDacDynamicEval(self):
+        def modulator(u):
+            # second order, 1-bit sigma-delta modulator
+            v = np.empty(len(u))
+            i1 = i2 = 0.0
+            for n, un in enumerate(u.tolist()):
+                y = 1.0 if i2 >= 0 else -1.0
+                v[n] = y
+                i1 += un - y
+                i2 += i1 - 2 * y
+            return v
+
+        fs = 64e6
+        osr = 64
+        bandwidth = fs / 2 / osr
+        n_samples = 2**20
+        t = np.arange(n_samples) / fs
+        bitstream = modulator(0.5 * np.sin(2 * np.pi * bandwidth / 5.3 * t))
+        # reconstruction filter (cut at 4 times the signal bandwidth),
+        # and an out-of-band spur at 10 MHz (-54 dBc)
+        n = np.arange(255) - 127
+        cutoff = 2 * 4 * bandwidth / fs
+        taps = cutoff * np.sinc(cutoff * n) * np.kaiser(255, 10)
+        vout = np.convolve(bitstream, taps / np.sum(taps), mode="same")
+        vout += 1e-3 * np.sin(2 * np.pi * 10e6 * t)
+        signals = DataFrame({"vout": vout})
+        (
+            spectrum,
+            target_harmonics,
+            signal_power,
+            thd,
+            snr,
+            sndr,
+            enob,
+            oob_noise,
+            oob_spur,
+            spur_frequency,
+        ) = sigmaDeltaDacDynamicEval(signals, fs, osr=osr)
+        self.assertEqual(Spectrum, type(spectrum))
+        self.assertAlmostEqual(10 * np.log10(0.125), signal_power, places=1)
+        self.assertGreater(snr, 65)
+        self.assertLessEqual(sndr, snr)
+        self.assertAlmostEqual((sndr - 1.76) / 6.02, enob)
+        self.assertAlmostEqual(20 * np.log10(1e-3 / 0.5), oob_spur, delta=0.1)
+        self.assertAlmostEqual(10e6, spur_frequency, delta=spectrum.freq[1])
+        # the out-of-band noise holds the spur and the residual shaped noise
+        self.assertGreater(oob_noise, oob_spur)
+        # the streamed output gives the same results
+        blocks = (
+            signals.iloc[idx : idx + 77777] for idx in range(0, n_samples, 77777)
+        )
+        streamed = sigmaDeltaDacDynamicEval(blocks, fs, bandwidth=bandwidth)
+        np.testing.assert_allclose(
+            [signal_power, thd, snr, sndr, oob_noise, oob_spur],
+            [streamed[idx] for idx in [2, 3, 4, 5, 7, 8]],
+            rtol=1e-9,
+        )
+        file_path = "./resources/data/test_signals_sigma_delta_dac.csv"
+        signals.to_csv(file_path, index=False)
+        args = [
+            "mixedsignals",
+            "-sdd",
+            "-s",
+            file_path,
+            "-fs",
+            "64 M",
+            "-bw",
+            "500 k",
+            "-gt",
+            "-o",
+            "./resources/tables/test_mixed_signals_sigmaDeltaDacDynamicEval",
+        ]
+        with self.assertRaises(SystemExit):
+            cli(args)
+
+    def test_dacDynamicEval(self):
+        n_bits = 8
+        f_update = 1e6
+        samples_per_update = 64
+        fs = f_update * samples_per_update
+        lsb = 1e-3
+        tau = 1 / f_update / 20  # settling time constant of the DAC output
+        n_updates = 4096
+        updates = np.arange(n_updates)
+        update_codes = np.rint(
+            (2**n_bits - 1) / 2 * (1 + np.sin(2 * np.pi * 127 * updates / n_updates))
+        ).astype(int)
+        codes = np.repeat(update_codes, samples_per_update)
+        # first order settling of the output from the previous to the new level of each update
+        finals = update_codes * lsb
+        previous = np.append(finals[0], finals[:-1])
+        # (the output is still at the previous level at the update)
+        decay = np.exp(-np.arange(samples_per_update) / fs / tau)
+        vout = (
+            finals[:, None] + (previous - finals)[:, None] * decay[None, :]
+        ).ravel()
+        # a glitch (one sample of 10 LSB) at each major-carry transition
+        major_carry = (update_codes[1:] ^ update_codes[:-1]) == 2**n_bits - 1
+        glitch_samples = (np.flatnonzero(major_carry) + 1) * samples_per_update
+        vout[glitch_samples] += 10 * lsb
+        transitions = dacTransitions(vout, codes, 1 / fs, n_bits)
+        steps = update_codes[1:] - update_codes[:-1]
+        self.assertEqual(np.count_nonzero(steps), len(transitions))
+        np.testing.assert_allclose(
+            steps[steps != 0], transitions["step (LSB)"], atol=1e-6
+        )
+        # settling to +-1/2 LSB: tau * ln(|step| / (1/2)), rounded up to the sampling period
+        regular = ~transitions["major carry"].values
+        expected_settling = (
+            np.ceil(
+                tau * np.log(np.abs(steps[steps != 0]) / 0.5) * fs - 1e-9
+            )
+            / fs
+        )
+        np.testing.assert_allclose(
+            expected_settling[regular],
+            transitions["settling time (s)"].values[regular],
+            atol=1e-12,
+        )
+        # glitch area: the (discrete) area of the exponential settling, and the glitch
+        settling_area = -steps[steps != 0] * lsb * decay.sum() / fs
+        np.testing.assert_allclose(
+            settling_area[regular],
+            transitions["glitch area (V.s)"].values[regular],
+            rtol=1e-6,
+        )
+        self.assertEqual(np.count_nonzero(major_carry), transitions["major carry"].sum())
+        np.testing.assert_allclose(
+            settling_area[~regular] + 10 * lsb / fs,
+            transitions["glitch area (V.s)"].values[~regular],
+            rtol=1e-6,
+        )
+        # the dynamic metrics of the settled output of an ideal DAC
+        bits = ((codes[:, None] >> np.arange(n_bits - 1, -1, -1)) & 1).astype(float)
+        code_signal_names = [f"b{bit}" for bit in range(n_bits)]
+        signals = DataFrame(np.column_stack([vout, bits]), columns=["vout"] + code_signal_names)
+        (
+            spectrum,
+            target_harmonics,
+            signal_power,
+            dc_power,
+            sfdr,
+            thd,
+            snr,
+            sndr,
+            enob,
+            hd2,
+            hd3,
+            bit_transitions,
+        ) = dacDynamicEval(
+            signals, fs, "vout", code_signal_names, update_frequency=f_update
+        )
+        self.assertEqual(Spectrum, type(spectrum))
+        self.assertAlmostEqual(n_bits, enob, delta=0.2)
+        self.assertAlmostEqual(127 * f_update / n_updates, target_harmonics[0][0])
+        np.testing.assert_allclose(
+            transitions.values.astype(float), bit_transitions.values.astype(float)
+        )
+        # the decimal code signal, and the streamed signals give the same transitions
+        signals = DataFrame({"vout": vout, "code": codes.astype(float)})
+        blocks = (
+            signals.iloc[idx : idx + 77777]
+            for idx in range(0, len(signals), 77777)
+        )
+        streamed = dacDynamicEval(
+            blocks, fs, "vout", ["code"], update_frequency=f_update
+        )
+        np.testing.assert_allclose([sndr, enob], [streamed[7], streamed[8]])
+        np.testing.assert_allclose(
+            transitions.values.astype(float), streamed[-1].values.astype(float)
+        )
+        # re-iterable blocks of bit signals, shorter than the transitions, are read once per pass
+        bit_signals = DataFrame(
+            np.column_stack([vout, bits]), columns=["vout"] + code_signal_names
+        )
+        passes = []
+
+        def openBlocks():
+            passes.append(len(passes))
+            return (
+                bit_signals.iloc[idx : idx + 1000]
+                for idx in range(0, len(bit_signals), 1000)
+            )
+
+        streamed = dacDynamicEval(
+            Reiterable(openBlocks),
+            fs,
+            "vout",
+            code_signal_names,
+            update_frequency=f_update,
+        )
+        self.assertEqual(3, len(passes))
+        np.testing.assert_allclose([sndr, enob], [streamed[7], streamed[8]])
+        np.testing.assert_allclose(
+            transitions.values.astype(float), streamed[-1].values.astype(float)
+        )
+        # without the code signals, only the dynamic metrics are computed
+        self.assertIsNone(dacDynamicEval(signals, fs, "vout")[-1])
+        file_path = "./resources/data/test_signals_dac.csv"
+        signals.to_csv(file_path, index=False)
+        args = [
+            "mixedsignals",
+            "-dac",
+            "-s",
+            file_path,
+            "-fs",
+            "64 M",
+            "-os",
+            "vout",
+            "-cds",
+            "code",
+            "-uf",
+            "1 M",
+            "-gt",
+            "-o",
+            "./resources/tables/test_mixed_signals_dacDynamicEval",
+        ]
+        with self.assertRaises(SystemExit):
+            cli(args)
+
     def test_dycifer_cli_help(self):
         args = ["-h"]
         with self.assertRaises(SystemExit):
@@ -174,6 +1152,25 @@ class TestDycifer(unittest.TestCase):
         with self.assertRaises(SystemExit):
             cli(args)
 
+    def test_dycifer_cli_mixed_signals_adcLinearityEval(self):
+        args = [
+            "mixedsignals",
+            "-adc",
+            "-s",
+            "./resources/data/test_signals2.csv",
+            "-fs",
+            "10 G",
+            "-bit",
+            "6",
+            "-lin",
+            "sine",
+            "-gt",
+            "-o",
+            "./resources/tables/test_mixed_signals_adcLinearityEval",
+        ]
+        with self.assertRaises(SystemExit):
+            cli(args)
+
     def test_dycifer_cli_mixed_signals_adcDynamicEval_cadence_data(self):
         """_summary_
         Testing the mixed-signals CLI to evaluate the ADC dynamic performance
@@ -211,11 +1208,6 @@ class TestDycifer(unittest.TestCase):
         t_window = 1 / f_window
         t = np.arange(0, 1.0 * t_window, ts)  # time axis
         # signal 1
-        res = 6  # bits
-        N_dout = 2**res - 1
-        vrange = 1.0
-        v_step = vrange / N_dout
-        # signal 1
         freq1 = 300e6  # 300 MHz
         s = 1e-3 * np.cos(2 * np.pi * freq1 * t)  # signal 1
         # signal 2
@@ -254,7 +1246,7 @@ class TestDycifer(unittest.TestCase):
             noise_power=0.0,
         )  # 0.2 % of power spectral density leakage
         self.assertIsNotNone(out_spectrum)
-        self.assertEqual(DataFrame, type(out_spectrum))
+        self.assertEqual(Spectrum, type(out_spectrum))
         """
         plotPrettyFFT(
             out_spectrum.index[out_spectrum.index >= 0],
@@ -263,7 +1255,8 @@ class TestDycifer(unittest.TestCase):
             **kwargs
         )
         """
-        self.assertAlmostEqual(signal_power, -6.020599913279618, places=3)
+        # single-sided power of the unit amplitude output sine wave (0.5 V^2)
+        self.assertAlmostEqual(signal_power, -3.010299956639812, places=3)
         self.assertAlmostEqual(dc_power, -6.935749724493102, places=3)
         self.assertAlmostEqual(gain, 999.9999999999966, places=3)
         self.assertAlmostEqual(sfdr, 20.000000000000103, places=3)
@@ -273,6 +1266,350 @@ class TestDycifer(unittest.TestCase):
         # self.assertAlmostEqual(hd2, -20.000000000000103, places=3)
         # self.assertAlmostEqual(hd3, -40.00000000000053, places=3)
 
+    def test_spectralMetrics(self):
+        n_samples = 2**12
+        signal_bin = 1000
+        n = np.arange(n_samples)
+        # the 3rd harmonic (bin 3000) is aliased to bin 4096 - 3000 = 1096
+        x = (
+            np.sin(2 * np.pi * signal_bin * n / n_samples)
+            + 1e-2 * np.sin(2 * np.pi * 2 * signal_bin * n / n_samples)
+            + 1e-3 * np.sin(2 * np.pi * 3 * signal_bin * n / n_samples)
+        )
+        self.assertEqual(
+            [1000, 2000, 1096, 96, 904],
+            list(harmonicBins(signal_bin, n_samples, harmonics=5)),
+        )
+        spectrum = powerSpectrum(x, 1.0)
+        (
+            harmonic_bins,
+            harmonics_power,
+            signal_power,
+            dc_power,
+            sfdr,
+            thd,
+            snr,
+            sndr,
+            hd2,
+            hd3,
+        ) = spectralMetrics(spectrum.power, n_samples, harmonics=3)
+        # the metrics leave out the harmonics beyond fs/2: their aliases are noise
+        self.assertEqual([1000, 2000], list(harmonic_bins))
+        self.assertAlmostEqual(10 * np.log10(0.5), signal_power, places=6)
+        self.assertAlmostEqual(40.0, sfdr, places=6)
+        self.assertAlmostEqual(-40.0, hd2, places=6)
+        self.assertTrue(np.isnan(hd3))
+        self.assertAlmostEqual(60.0, snr, places=6)
+        # the dB and amplitude spectra are only computed on access
+        self.assertEqual(len(x) // 2 + 1, len(spectrum))
+        self.assertFalse("power_db" in vars(spectrum))
+        frame = spectrum.toDataFrame()
+        self.assertEqual(["vout", "power", "power_db"], list(frame.columns))
+        self.assertTrue(np.array_equal(np.fft.rfftfreq(len(x), 1.0), frame.index.values))
+        self.assertTrue(np.allclose(10 * np.log10(spectrum.power), frame["power_db"].values))
+        self.assertTrue(np.allclose(spectrum.power, np.square(frame["vout"].values)))
+        self.assertAlmostEqual(-40.0, thd, places=6)
+
+    def test_caosDynamicEval_window(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**14) / fs  # time axis
+        f_in = fs * 127.37 / len(t)  # non-coherent sampling
+        rng = np.random.default_rng(0)
+        vout = (
+            np.sin(2 * np.pi * f_in * t)
+            + 1e-3 * np.sin(2 * np.pi * 2 * f_in * t)
+            + 1e-4 * np.sin(2 * np.pi * 3 * f_in * t)
+            + rng.normal(0, 1e-5, len(t))
+        )
+        signals = DataFrame({"time [s]": t, "vout": vout}).set_index("time [s]")
+        rectangular = caosDynamicEval(signals.copy(), fs, "vout")
+        self.assertGreater(np.abs(rectangular[2] - 10 * np.log10(0.5)), 1.0)
+        for window in ["blackmanharris", "kaiser", "flattop"]:
+            results = caosDynamicEval(signals.copy(), fs, "vout", window=window)
+            # signal power, HD2 and HD3 corrected for the coherent gain and the ENBW
+            self.assertAlmostEqual(10 * np.log10(0.5), results[2], places=2)
+            self.assertAlmostEqual(-60.0, results[10], places=1)
+            self.assertAlmostEqual(-80.0, results[11], places=1)
+        # the kaiser window sidelobes are below the noise floor: SNR = 0.5 / 1e-10
+        kaiser = caosDynamicEval(signals.copy(), fs, "vout", window="kaiser")
+        self.assertAlmostEqual(10 * np.log10(0.5 / 1e-10), kaiser[8], delta=0.1)
+        with self.assertRaises(ValueError):
+            caosDynamicEval(signals.copy(), fs, "vout", window="triangular")
+
+    def test_caosDynamicEval_segments(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**16) / fs  # time axis
+        f_in = fs * 1270.37 / len(t)  # non-coherent sampling
+        rng = np.random.default_rng(0)
+        vout = (
+            np.sin(2 * np.pi * f_in * t)
+            + 1e-3 * np.sin(2 * np.pi * 2 * f_in * t)
+            + rng.normal(0, 1e-4, len(t))
+        )
+        signals = DataFrame({"time [s]": t, "vout": vout}).set_index("time [s]")
+        results = caosDynamicEval(
+            signals.copy(), fs, "vout", window="kaiser", segments=16, overlap=0.5
+        )
+        # 16 segments of 7710 samples overlapping by half
+        segment_length, hop = welchSegments(len(t), 16, 0.5)
+        self.assertEqual((7710, 3855), (segment_length, hop))
+        self.assertEqual(segment_length // 2 + 1, len(results[0]))
+        self.assertAlmostEqual(10 * np.log10(0.5), results[2], places=2)
+        self.assertAlmostEqual(-60.0, results[10], places=1)
+        self.assertAlmostEqual(10 * np.log10(0.5 / 1e-8), results[8], delta=0.2)
+        for segments, overlap in [(0, 0.5), (16, 1.0), (2**16, 0.5)]:
+            with self.assertRaises(ValueError):
+                caosDynamicEval(
+                    signals.copy(),
+                    fs,
+                    "vout",
+                    window="kaiser",
+                    segments=segments,
+                    overlap=overlap,
+                )
+
+    def test_streamedWelchSpectra(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**14) / fs  # time axis
+        f_in = fs * 127.37 / len(t)  # non-coherent sampling
+        rng = np.random.default_rng(0)
+        vin = 0.5 * np.sin(2 * np.pi * f_in * t)
+        vout = (
+            np.sin(2 * np.pi * f_in * t)
+            + 1e-3 * np.sin(2 * np.pi * 2 * f_in * t)
+            + rng.normal(0, 1e-4, len(t))
+        )
+        signals = DataFrame({"time [s]": t, "vout": vout, "vin": vin}).set_index(
+            "time [s]"
+        )
+        blocks = [signals.iloc[i : i + 1000] for i in range(0, len(t), 1000)]
+        # the averaged spectra of the streamed blocks match those of the whole record,
+        # without gathering the blocks
+        in_memory = caosDynamicEval(
+            signals.copy(), fs, "vout", "vin", window="hann", segments=8
+        )
+        with mock.patch(
+            "dycifer.analog.collectSignals", side_effect=AssertionError("gathered")
+        ):
+            streamed = caosDynamicEval(
+                blocks, fs, "vout", "vin", window="hann", segments=8
+            )
+        np.testing.assert_allclose(in_memory[0].power, streamed[0].power, rtol=1e-9)
+        np.testing.assert_allclose(in_memory[2:], streamed[2:], rtol=1e-9)
+        # the rise time of a streamed pulse train is measured across the blocks
+        pulses = DataFrame(
+            {"time [s]": t, "vout": np.clip(4 * np.sin(2 * np.pi * f_in * t), -1, 1)}
+        ).set_index("time [s]")
+        blocks = [pulses.iloc[i : i + 1000] for i in range(0, len(t), 1000)]
+        in_memory = daosDynamicEval(
+            pulses.copy(), fs, "vout", window="hann", segments=8
+        )
+        with mock.patch(
+            "dycifer.analog.collectSignals", side_effect=AssertionError("gathered")
+        ):
+            streamed = daosDynamicEval(blocks, fs, "vout", window="hann", segments=8)
+        np.testing.assert_allclose(in_memory[0].power, streamed[0].power, rtol=1e-9)
+        np.testing.assert_allclose(in_memory[2:], streamed[2:], rtol=1e-9)
+        # the output word of the ADC is decoded and averaged block by block
+        res = 10
+        codes = np.round((np.sin(2 * np.pi * f_in * t) + 1) / 2 * (2**res - 1))
+        levels = (codes.astype(int)[:, None] >> np.arange(res)) & 1
+        columns = {f"b{idx}": 1.2 * levels[:, idx] for idx in range(res)}
+        bit_signals = DataFrame({"time [s]": t, **columns}).set_index("time [s]")
+        blocks = [bit_signals.iloc[i : i + 1000] for i in range(0, len(t), 1000)]
+        in_memory = adcDynamicEval(
+            bit_signals, fs, asceding_bit_order=True, window="hann", segments=8
+        )
+        with mock.patch(
+            "dycifer.mixed_signals.decodeBlocks",
+            side_effect=AssertionError("gathered"),
+        ):
+            streamed = adcDynamicEval(
+                blocks, fs, asceding_bit_order=True, window="hann", segments=8
+            )
+        np.testing.assert_allclose(in_memory[0].power, streamed[0].power, rtol=1e-9)
+        np.testing.assert_allclose(in_memory[2:], streamed[2:], rtol=1e-9)
+
+    def test_caosDynamicEval_targeted(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**16) / fs  # time axis
+        f_in = fs * 1270.37 / len(t)  # non-coherent sampling
+        rng = np.random.default_rng(0)
+        vin = 0.5 * np.sin(2 * np.pi * f_in * t)
+        vout = (
+            0.2
+            + np.sin(2 * np.pi * f_in * t + 0.3)
+            + 1e-2 * np.sin(2 * np.pi * 2 * f_in * t)
+            + 1e-3 * np.sin(2 * np.pi * 3 * f_in * t)
+            + rng.normal(0, 1e-4, len(t))
+        )
+        signals = DataFrame({"time [s]": t, "vout": vout, "vin": vin}).set_index(
+            "time [s]"
+        )
+        results = caosDynamicEval(
+            signals.copy(), fs, "vout", input_signal_name="vin", targeted=True
+        )
+        self.assertIsNone(results[0])
+        self.assertAlmostEqual(f_in, results[1][0][0], delta=1e-6 * f_in)
+        self.assertAlmostEqual(10 * np.log10(0.5), results[2], places=3)
+        self.assertAlmostEqual(10 * np.log10(0.04), results[3], places=3)
+        self.assertAlmostEqual(2.0, results[4], places=4)
+        self.assertAlmostEqual(-40.0, results[10], places=2)
+        self.assertAlmostEqual(-60.0, results[11], places=1)
+        self.assertTrue(np.isnan(results[6]))  # no SFDR without a spectrum
+        self.assertAlmostEqual(10 * np.log10(0.5 / 1e-8), results[8], delta=0.1)
+        # noise and distortion: the harmonics and the white noise
+        self.assertAlmostEqual(
+            10 * np.log10(0.5 / (0.5e-4 + 0.5e-6 + 1e-8)), results[9], places=2
+        )
+        # streamed blocks, with the tone frequency given: single pass over the blocks
+        blocks = [signals.iloc[i : i + 5000] for i in range(0, len(t), 5000)]
+        streamed = caosDynamicEval(
+            iter(blocks),
+            fs,
+            "vout",
+            input_signal_name="vin",
+            targeted=True,
+            tone_frequency=results[1][0][0],
+        )
+        for i in [2, 3, 4, 8, 9, 10, 11]:
+            self.assertAlmostEqual(results[i], streamed[i], places=6)
+        # the noise power of a high SNR (~137 dB) signal with an offset does not cancel
+        # against the power of the fitted tones, in double and in single precision
+        n_samples = 2**22
+        n = np.arange(n_samples)
+        tone = 1.0 + 0.9 * np.sin(2 * np.pi * 0.0123456789 * n + 0.3)
+        noise = rng.normal(0, 0.9 / np.sqrt(2) * 10 ** (-137 / 20), n_samples)
+        for dtype in [np.float64, np.float32]:
+            x = (tone + noise).astype(dtype)
+            _, _, _, residual_power = targetedMetrics(
+                [x[i : i + 2**18] for i in range(0, n_samples, 2**18)],
+                1.0,
+                0.0123456789,
+            )
+            self.assertAlmostEqual(
+                1.0, residual_power[0] / np.var(x.astype(np.float64) - tone), places=3
+            )
+        # decimated streamed blocks match the decimated signals
+        sampled = sampleSignals(signals, fs / 3)
+        concatenated = np.concatenate(
+            [block["vout"].values for block in sampleBlocks(iter(blocks), fs / 3)]
+        )
+        self.assertTrue(np.array_equal(sampled["vout"].values, concatenated))
+
+    def test_caosBatchEval(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**14) / fs  # time axis
+        f_in = fs * 127 / len(t)  # coherent sampling
+        rng = np.random.default_rng(0)
+        vin = 0.5 * np.sin(2 * np.pi * f_in * t)
+        lanes = {
+            f"lane{i}": (1 + 0.1 * i) * np.sin(2 * np.pi * f_in * t)
+            + 10 ** (-(40 + 5 * i) / 20) * np.sin(2 * np.pi * 2 * f_in * t)
+            + rng.normal(0, 1e-4, len(t))
+            for i in range(4)
+        }
+        signals = DataFrame({"time [s]": t, "vin": vin, **lanes}).set_index(
+            "time [s]"
+        )
+        table = caosBatchEval(
+            signals.copy(), fs, input_signal_name="vin", window="hann"
+        )
+        self.assertEqual(list(lanes.keys()), list(table.index))
+        for i, lane in enumerate(lanes.keys()):
+            results = caosDynamicEval(
+                signals.copy(), fs, lane, input_signal_name="vin", window="hann"
+            )
+            row = table.loc[lane].values
+            # signal power, DC power, gain, gain (dB), SFDR, THD, SNR, SNDR, HD2, HD3
+            self.assertTrue(np.allclose(np.array(results[2:], dtype=float), row))
+            self.assertAlmostEqual(2 * (1 + 0.1 * i), row[2], places=4)
+            self.assertAlmostEqual(
+                -40.0 - 5 * i - 20 * np.log10(1 + 0.1 * i), row[8], delta=0.05
+            )
+        # targeted batch evaluation of the streamed blocks, and a subset of the signals
+        blocks = [signals.iloc[i : i + 3000] for i in range(0, len(t), 3000)]
+        targeted = caosBatchEval(
+            iter(blocks), fs, ["lane1", "lane3"], input_signal_name="vin", targeted=True
+        )
+        self.assertEqual(["lane1", "lane3"], list(targeted.index))
+        self.assertTrue(
+            np.allclose(
+                table.loc[["lane1", "lane3"], ["Gain (dB)", "HD2"]].values,
+                targeted[["Gain (dB)", "HD2"]].values,
+                atol=1e-2,
+            )
+        )
+
+    def test_caosDynamicEval_coherent(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 10000) / fs  # time axis
+        f_in = fs * 127.37 / len(t)  # non-coherent sampling
+        vout = np.sin(2 * np.pi * f_in * t) + 1e-3 * np.sin(2 * np.pi * 2 * f_in * t)
+        signals = DataFrame({"time [s]": t, "vout": vout}).set_index("time [s]")
+        leaky = caosDynamicEval(signals.copy(), fs, "vout")
+        results = caosDynamicEval(signals.copy(), fs, "vout", coherent=True)
+        start, length = results[0].record
+        self.assertEqual(len(t), start + length)
+        self.assertGreaterEqual(length, len(t) // 2)
+        # 5-smooth record length
+        for factor in [2, 3, 5]:
+            while length % factor == 0:
+                length //= factor
+        self.assertEqual(1, length)
+        cycles = results[0].record[1] * f_in / fs
+        self.assertAlmostEqual(
+            abs(cycles - np.round(cycles)), results[0].coherence_error, places=6
+        )
+        # the leakage of the tone drops with the coherence error
+        self.assertLess(results[0].coherence_error, 0.05)
+        self.assertAlmostEqual(10 * np.log10(0.5), results[2], delta=0.02)
+        self.assertAlmostEqual(-60.0, results[10], delta=0.5)
+        self.assertGreater(results[6], leaky[6] + 20)
+
+    def test_fftBackends(self):
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal(2**12)
+        reference = np.fft.rfft(x)
+        for backend in [elem.value for elem in FFTBackends]:
+            # pyfftw falls back to scipy.fft when it is not installed
+            spectrum = rfft(x, backend=backend)
+            self.assertEqual(np.complex128, spectrum.dtype)
+            self.assertTrue(np.allclose(reference, spectrum))
+            self.assertEqual(
+                np.complex64, rfft(x.astype(np.float32), backend=backend).dtype
+            )
+        signals = DataFrame(
+            {"vout": np.sin(2 * np.pi * 127 * np.arange(2**12) / 2**12)},
+            index=np.arange(2**12) / 1e9,
+        )
+        numpy_results = caosDynamicEval(signals.copy(), 1e9, "vout", fft_backend="numpy")
+        scipy_results = caosDynamicEval(signals.copy(), 1e9, "vout", fft_backend="scipy")
+        self.assertAlmostEqual(numpy_results[2], scipy_results[2], places=9)
+        with self.assertRaises(ValueError):
+            caosDynamicEval(signals.copy(), 1e9, "vout", fft_backend="mkl")
+
+    def test_caosDynamicEval_single_precision(self):
+        fs = 1e9  # sampling frequency
+        t = np.arange(0, 2**14) / fs  # time axis
+        f_in = fs * 127 / len(t)  # coherent sampling
+        rng = np.random.default_rng(0)
+        vout = (
+            np.sin(2 * np.pi * f_in * t)
+            + 1e-4 * np.sin(2 * np.pi * 2 * f_in * t)
+            + rng.normal(0, 1e-4, len(t))
+        )
+        signals = DataFrame({"time [s]": t, "vout": vout}).set_index("time [s]")
+        double = caosDynamicEval(signals.copy(), fs, "vout")
+        single = caosDynamicEval(signals.copy(), fs, "vout", precision="single")
+        self.assertEqual(np.float32, single[0]["power"].dtype)
+        self.assertEqual(np.float64, single[0].index.dtype)
+        # SFDR, THD, SNR and SNDR
+        for idx in range(6, 10):
+            self.assertAlmostEqual(double[idx], single[idx], places=2)
+        with self.assertRaises(ValueError):
+            caosDynamicEval(signals.copy(), fs, "vout", precision="half")
+
     def test_daosDynamicEval(self):
         fs = 1e9  # sampling frequency
         file_path = "./resources/data/fft_points_c2c_256_bin7.csv"
@@ -302,7 +1639,7 @@ class TestDycifer(unittest.TestCase):
             show_rise_time_eval=True,
         )  # 0.2 % of power spectral density leakage
         self.assertIsNotNone(out_spectrum)
-        self.assertEqual(DataFrame, type(out_spectrum))
+        self.assertEqual(Spectrum, type(out_spectrum))
         """
         plotPrettyFFT(
             out_spectrum.index[out_spectrum.index >= 0],
@@ -312,7 +1649,7 @@ class TestDycifer(unittest.TestCase):
         )
         """
 
-        self.assertAlmostEqual(signal_power, -16.338484099692018, places=3)
+        self.assertAlmostEqual(signal_power, -13.328184143052205, places=3)
         self.assertAlmostEqual(dc_power, -7.353037389986262, places=3)
         self.assertEqual(type(gain), type(np.nan))
 